@@ -1,8 +1,45 @@
 from .config_loader import load_config, load_db_config, load_migration_config
 from .connection_string import create_connection_string
 from .db import Database
-from .joins import validate_joins, generate_join_query
+from .async_db import AsyncDatabase
+from .cache import (
+    ReflectionCache,
+    PlanCache,
+    schema_fingerprint,
+    default_cache_dir,
+)
+from .joins import (
+    validate_joins,
+    explain_joins,
+    generate_join_query,
+    generate_keyset_queries,
+)
+from .checkpoint import CheckpointStore
+from .fast_load import sqlite_fast_load
+from .extraction import (
+    iter_keyset_pages,
+    iter_keyset_chunks,
+    iter_copy_chunks,
+    partition_key_range,
+)
+from .arrow import (
+    iter_arrow_batches,
+    iter_arrow_chunks,
+    arrow_load_rows,
+    arrow_query_to_table,
+)
+from .pipeline import iter_pipelined
 from .migration import migrate
+from .async_migration import amigrate
+from .scheduler import build_dependency_graph, run_scheduled, arun_scheduled
+from .loading import (
+    load_rows,
+    copy_rows,
+    copy_query_to_table,
+    load_data_rows,
+    bulk_insert_rows,
+)
+from .upsert import upsert_rows
 
 __all__ = [
     "load_config",
@@ -10,8 +47,36 @@ __all__ = [
     "load_migration_config",
     "create_connection_string",
     "Database",
+    "AsyncDatabase",
+    "ReflectionCache",
+    "PlanCache",
+    "schema_fingerprint",
+    "default_cache_dir",
     "validate_joins",
+    "explain_joins",
     "generate_join_query",
+    "generate_keyset_queries",
+    "CheckpointStore",
+    "sqlite_fast_load",
+    "iter_keyset_pages",
+    "iter_keyset_chunks",
+    "iter_copy_chunks",
+    "partition_key_range",
+    "iter_arrow_batches",
+    "iter_arrow_chunks",
+    "arrow_load_rows",
+    "arrow_query_to_table",
+    "iter_pipelined",
     "migrate",
+    "amigrate",
+    "build_dependency_graph",
+    "run_scheduled",
+    "arun_scheduled",
+    "load_rows",
+    "copy_rows",
+    "copy_query_to_table",
+    "load_data_rows",
+    "bulk_insert_rows",
+    "upsert_rows",
 ]
 __version__ = "0.1.0"
@@ -0,0 +1,176 @@
+import importlib
+from typing import Any, Dict, Iterable, Iterator, List, Mapping
+from pydantic import validate_call
+from .db import Database, _batched, _group_by_columns
+
+ARROW_VIEW = "sqlmorpher_arrow_batch"
+
+
+def _pyarrow() -> Any:
+    try:
+        return importlib.import_module("pyarrow")
+    except ImportError as e:
+        raise ImportError(
+            "Arrow transfers require pyarrow: pip install pyarrow"
+        ) from e
+
+
+def _is_duckdb(db: Database) -> bool:
+    return db.engine.dialect.name == "duckdb"
+
+
+def _check_duckdb(db: Database) -> None:
+    if not _is_duckdb(db):
+        raise ValueError(
+            "Arrow transfers require a DuckDB database, got "
+            f"'{db.engine.dialect.name}'."
+        )
+
+
+def _driver_connection(connection: Any) -> Any:
+    return getattr(connection, "driver_connection", connection)
+
+
+def _record_batches(duck: Any, query: str, chunk_size: int) -> Any:
+    result = duck.execute(query)
+    reader = getattr(result, "to_arrow_reader", None)
+    if reader is None:
+        return result.fetch_record_batch(chunk_size)
+    return reader(chunk_size)
+
+
+def _insert_arrow(duck: Any, table: str, batch: Any) -> None:
+    columns = ", ".join(batch.schema.names)
+    duck.register(ARROW_VIEW, batch)
+    try:
+        duck.execute(
+            f"INSERT INTO {table} ({columns}) SELECT * FROM {ARROW_VIEW}"
+        )
+    finally:
+        duck.unregister(ARROW_VIEW)
+
+
+def _write_arrow_batches(
+    db: Database, table: str, batches: Iterable[Any]
+) -> int:
+    loaded = 0
+    with db.transaction() as connection:
+        duck = _driver_connection(connection.connection)
+        for batch in batches:
+            if batch.num_rows:
+                _insert_arrow(duck, table, batch)
+                loaded += batch.num_rows
+    return loaded
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def iter_arrow_batches(
+    db: Database, query: str, chunk_size: int = 1000
+) -> Iterator[Any]:
+    """Read a query result from DuckDB as Arrow record batches, without
+    building a Python object per row.
+
+    Args:
+        db (Database): The source DuckDB database.
+        query (str): The query to read, e.g. from generate_join_query.
+        chunk_size (int): Maximum number of rows per record batch.
+
+    Yields:
+        pyarrow.RecordBatch: The next batch of rows.
+    """
+    _check_duckdb(db)
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+    raw_connection = db.engine.raw_connection()
+    try:
+        duck = _driver_connection(raw_connection)
+        yield from _record_batches(duck, query, chunk_size)
+    finally:
+        raw_connection.close()
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def iter_arrow_chunks(
+    db: Database, query: str, chunk_size: int = 1000
+) -> Iterator[List[Dict[str, Any]]]:
+    """Read a query result from DuckDB through Arrow and yield it as chunks
+    of row dicts.
+
+    Args:
+        db (Database): The source DuckDB database.
+        query (str): The query to read.
+        chunk_size (int): Number of rows per yielded chunk.
+
+    Yields:
+        List[Dict[str, Any]]: The next chunk of rows.
+    """
+    for batch in iter_arrow_batches(db, query, chunk_size):
+        if batch.num_rows:
+            yield batch.to_pylist()
+
+
+def arrow_load_rows(
+    db: Database,
+    table: str,
+    rows: Iterable[Mapping[str, Any]],
+    batch_size: int = 1000,
+) -> int:
+    """Load rows into a DuckDB table by converting each batch to an Arrow
+    table and running ``INSERT INTO table SELECT * FROM batch``.
+
+    As with Database.insert_rows, consecutive rows sharing the same set of
+    columns are converted together, so columns missing from a row get
+    their default.
+
+    Args:
+        db (Database): The target DuckDB database.
+        table (str): The name of the target table.
+        rows (Iterable[Mapping[str, Any]]): The rows to load.
+        batch_size (int): Maximum number of rows per INSERT.
+
+    Returns:
+        int: The number of rows loaded.
+    """
+    _check_duckdb(db)
+    if batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer.")
+    pyarrow = _pyarrow()
+    return _write_arrow_batches(
+        db,
+        table,
+        (
+            pyarrow.Table.from_pylist(group)
+            for batch in _batched(rows, batch_size)
+            for _, group in _group_by_columns(batch)
+        ),
+    )
+
+
+def arrow_query_to_table(
+    source_db: Database,
+    query: str,
+    target_db: Database,
+    table: str,
+    chunk_size: int = 1000,
+) -> int:
+    """Stream a query result from a DuckDB source into a DuckDB target
+    table as Arrow record batches, without building Python rows.
+
+    The columns of the query must be named like the target columns, as
+    generate_join_query does. The whole result is loaded in a single
+    target transaction.
+
+    Args:
+        source_db (Database): The source DuckDB database.
+        query (str): The query to read.
+        target_db (Database): The target DuckDB database.
+        table (str): The name of the target table.
+        chunk_size (int): Maximum number of rows per record batch.
+
+    Returns:
+        int: The number of rows loaded.
+    """
+    _check_duckdb(target_db)
+    return _write_arrow_batches(
+        target_db, table, iter_arrow_batches(source_db, query, chunk_size)
+    )
@@ -0,0 +1,115 @@
+from sqlalchemy import Engine, text
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.util import greenlet_spawn
+from pydantic import validate_call
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+from .db import Database
+
+T = TypeVar("T")
+
+
+class AsyncDatabase(Database):
+    """Database handle on an asyncio driver (asyncpg, aiomysql, aiosqlite,
+    ...), created with ``create_async_engine``.
+
+    The synchronous API inherited from Database (execute_query,
+    transaction, get_table, ...) works inside run_sync, which runs a
+    function in a greenlet whose database I/O is awaited on the event loop.
+    This is also how amigrate runs migration entries, so transform
+    functions keep their synchronous signature.
+    """
+
+    async_engine: AsyncEngine
+
+    def _create_engine(
+        self, connection_string: str, engine_options: Dict[str, Any]
+    ) -> Engine:
+        self.async_engine = create_async_engine(
+            connection_string, **engine_options
+        )
+        return self.async_engine.sync_engine
+
+    async def run_sync(
+        self, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Run a synchronous function that uses this database (or other
+        AsyncDatabase handles) without blocking the event loop.
+
+        Args:
+            fn (Callable): The function to run.
+            *args: Positional arguments for ``fn``.
+            **kwargs: Keyword arguments for ``fn``.
+
+        Returns:
+            The return value of ``fn``.
+        """
+        result: T = await greenlet_spawn(fn, *args, **kwargs)
+        return result
+
+    @validate_call
+    async def aexecute_query(
+        self, query: str, params: Optional[dict[str, Any]] = None
+    ) -> Optional[Sequence[RowMapping]]:
+        return await self.run_sync(self.execute_query, query, params)
+
+    async def ainsert_rows(
+        self,
+        table: str,
+        rows: Iterable[Mapping[str, Any]],
+        batch_size: int = 1000,
+    ) -> int:
+        """Async counterpart of Database.insert_rows.
+
+        Args:
+            table (str): The name of the target table.
+            rows (Iterable[Mapping[str, Any]]): The rows to insert.
+            batch_size (int): Maximum number of rows per transaction.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+        return await self.run_sync(
+            self.insert_rows, table, rows, batch_size=batch_size
+        )
+
+    async def astream_query(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """Async counterpart of Database.stream_query.
+
+        Args:
+            query (str): The SQL query to execute.
+            params (dict, optional): Bound parameters for the query.
+            chunk_size (int): Number of rows fetched per round-trip.
+
+        Yields:
+            Sequence[RowMapping]: The next chunk of rows.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer.")
+        async with self.async_engine.connect() as connection:
+            result = await connection.stream(
+                text(query),
+                params,
+                execution_options={"yield_per": chunk_size},
+            )
+            async for partition in result.mappings().partitions(chunk_size):
+                yield partition
+
+    async def dispose(self) -> None:
+        """Close all pooled connections of the async engine."""
+        await self.async_engine.dispose()
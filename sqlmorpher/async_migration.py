@@ -0,0 +1,114 @@
+from .async_db import AsyncDatabase
+from .cache import PlanCache, schema_fingerprint
+from .checkpoint import CheckpointStore
+from .migration import (
+    RegisteredFn,
+    _checkpoint_key,
+    _migrate_entry,
+    _reflect_referenced_tables,
+)
+from .scheduler import build_dependency_graph, arun_scheduled
+from pydantic import validate_call
+from typing import Any, Dict, List, Mapping, Optional
+from tqdm.rich import tqdm
+
+
+def _check_async_entry(map_entry: Dict[str, Any]) -> None:
+    if (
+        map_entry.get("pipeline", False)
+        or map_entry.get("parallelism", 1) > 1
+        or map_entry.get("transform_executor", "thread") != "thread"
+        or map_entry.get("extract_method") == "copy"
+    ):
+        raise ValueError(
+            f"Migration entry for '{map_entry['root_table']}' is not "
+            "supported by amigrate: pipeline, parallelism, "
+            "transform_executor 'process' and extract_method 'copy' need "
+            "threads or a psycopg connection."
+        )
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+async def amigrate(
+    old_db: AsyncDatabase,
+    new_db: AsyncDatabase,
+    mapping: List[Dict[str, Any]],
+    transform_registry: Optional[Mapping[str, RegisteredFn]] = None,
+    concurrency: int = 10,
+    plan_cache: Optional[PlanCache] = None,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    resume: bool = False,
+) -> str:
+    """Async counterpart of migrate, running many migration entries
+    concurrently on the current event loop instead of on threads.
+
+    Each entry runs in its own asyncio task and is started once the entries
+    it depends on are done. Entries accept the same keys as in migrate,
+    except the ones that need threads: pipeline, parallelism,
+    transform_executor "process" and extract_method "copy". Transform
+    functions are called with new_db and may use its synchronous API.
+
+    Args:
+        old_db (AsyncDatabase): The source database to migrate data from.
+        new_db (AsyncDatabase): The target database to migrate data to.
+        mapping (List[Dict]): The mapping configuration for migration.
+        transform_registry (Dict[str, Callable], optional): A registry of
+        transformation functions. Defaults to None.
+        concurrency (int): Maximum number of entries migrated concurrently.
+        Defaults to 10.
+        plan_cache (PlanCache, optional): Cache of the generated source
+        queries, see migrate. Defaults to None.
+        checkpoint_store (CheckpointStore, optional): Where the progress of
+        every entry is recorded, see migrate. Defaults to None.
+        resume (bool): Continue a previous run recorded in
+        checkpoint_store, see migrate. Defaults to False.
+
+    Returns:
+        str: A message indicating the result of the migration.
+    """
+    registry = transform_registry or {}
+    for map_entry in mapping:
+        _check_async_entry(map_entry)
+    if resume and checkpoint_store is None:
+        raise ValueError("resume requires a checkpoint_store.")
+    if checkpoint_store is not None and not resume:
+        for map_entry in mapping:
+            await old_db.run_sync(
+                checkpoint_store.clear, _checkpoint_key(map_entry)
+            )
+
+    source_fingerprint = (
+        await old_db.run_sync(schema_fingerprint, old_db.engine)
+        if plan_cache is not None
+        else None
+    )
+    await old_db.run_sync(
+        _reflect_referenced_tables,
+        old_db,
+        new_db,
+        mapping,
+        reflect_source=plan_cache is None,
+    )
+    graph = build_dependency_graph(new_db, mapping)
+    progress = tqdm(total=len(mapping), desc="Migrating tables", unit="table")
+
+    async def run_entry(idx: int) -> None:
+        await old_db.run_sync(
+            _migrate_entry,
+            old_db,
+            new_db,
+            mapping[idx],
+            registry,
+            plan_cache=plan_cache,
+            source_fingerprint=source_fingerprint,
+            checkpoints=checkpoint_store,
+            resume=resume,
+        )
+        progress.update(1)
+
+    try:
+        await arun_scheduled(graph, run_entry, concurrency=concurrency)
+    finally:
+        progress.close()
+
+    return "Migration completed successfully"
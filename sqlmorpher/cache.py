@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+from sqlalchemy import Engine, MetaData, inspect, text
+
+_FINGERPRINT_QUERIES: Dict[str, str] = {
+    "sqlite": "PRAGMA schema_version",
+    "postgresql": (
+        "SELECT md5(string_agg("
+        "c.relname || ':' || a.attname || ':' || a.atttypid::text "
+        "|| ':' || a.attnotnull::text, ',' ORDER BY c.relname, a.attnum)) "
+        "|| (SELECT count(*) FROM pg_constraint "
+        "WHERE connamespace = current_schema()::regnamespace)::text "
+        "FROM pg_attribute a "
+        "JOIN pg_class c ON c.oid = a.attrelid "
+        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE a.attnum > 0 AND NOT a.attisdropped "
+        "AND n.nspname = current_schema() "
+        "AND c.relkind IN ('r', 'v', 'm', 'p')"
+    ),
+    "mysql": (
+        "SELECT COUNT(*), SUM(CRC32(CONCAT_WS(':', TABLE_NAME, "
+        "COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY))) "
+        "FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE()"
+    ),
+    "mssql": (
+        "SELECT COUNT(*), MAX(modify_date) FROM sys.objects "
+        "WHERE type IN ('U', 'V', 'PK', 'F', 'UQ')"
+    ),
+    "oracle": "SELECT COUNT(*), MAX(LAST_DDL_TIME) FROM USER_OBJECTS",
+}
+
+
+def default_cache_dir() -> str:
+    """Return the reflection cache directory, taken from the
+    ``SQLMORPHER_CACHE_DIR`` environment variable or defaulting to
+    ``~/.cache/sqlmorpher``."""
+    return os.getenv("SQLMORPHER_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "sqlmorpher"
+    )
+
+
+def schema_fingerprint(engine: Engine) -> str:
+    """Compute a cheap version marker of the database schema, which
+    changes whenever tables or columns are created, altered or dropped.
+
+    A single catalog query is used for SQLite, PostgreSQL, MySQL, SQL
+    Server and Oracle; other databases fall back to the list of table
+    names.
+
+    Args:
+        engine (Engine): The database engine.
+
+    Returns:
+        str: The schema fingerprint.
+    """
+    query = _FINGERPRINT_QUERIES.get(engine.dialect.name)
+    if query is None:
+        names = sorted(inspect(engine).get_table_names())
+        return hashlib.sha256(",".join(names).encode()).hexdigest()
+    with engine.connect() as connection:
+        row = connection.execute(text(query)).fetchone()
+    return repr(tuple(row) if row is not None else ())
+
+
+class ReflectionCache:
+    """On-disk cache of reflected table definitions for one database,
+    invalidated whenever its schema fingerprint changes.
+
+    The cache file is a pickle named after a hash of the connection
+    string, so the directory must only be writable by trusted users.
+    """
+
+    def __init__(self, directory: str, connection_string: str):
+        key = hashlib.sha256(connection_string.encode()).hexdigest()
+        self.path = os.path.join(directory, f"{key}.pickle")
+        self.fingerprint: Optional[str] = None
+
+    def load(self, engine: Engine, metadata: MetaData) -> None:
+        """Copy the cached tables into ``metadata`` if the cache matches
+        the current schema fingerprint."""
+        self.fingerprint = schema_fingerprint(engine)
+        try:
+            with open(self.path, "rb") as f:
+                cached = pickle.load(f)
+        except Exception:
+            return
+        if not isinstance(cached, dict):
+            return
+        if cached.get("fingerprint") != self.fingerprint:
+            return
+        cached_metadata: MetaData = cached["metadata"]
+        for table in cached_metadata.sorted_tables:
+            if table.key not in metadata.tables:
+                table.to_metadata(metadata)
+
+    def save(self, metadata: MetaData) -> None:
+        """Write ``metadata`` to the cache file atomically."""
+        if self.fingerprint is None:
+            return
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {"fingerprint": self.fingerprint, "metadata": metadata}, f
+                )
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class PlanCache:
+    """Cache of compiled migration plans (generated SQL and column lists),
+    kept in memory and, when a directory is given, as JSON files so that
+    later runs can skip join validation and query generation."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory
+        self._plans: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Hash JSON-serializable key parts (e.g. a migration entry and a
+        schema fingerprint) into a cache key."""
+        material = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def _path(self, key: str) -> Optional[str]:
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached plan for ``key``, or None."""
+        with self._lock:
+            plan = self._plans.get(key)
+        if plan is not None:
+            return plan
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "r") as f:
+                loaded = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(loaded, dict):
+            return None
+        with self._lock:
+            self._plans[key] = loaded
+        return loaded
+
+    def put(self, key: str, plan: Dict[str, Any]) -> None:
+        """Store ``plan`` under ``key``."""
+        with self._lock:
+            self._plans[key] = plan
+        path = self._path(key)
+        if path is None:
+            return
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(plan, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
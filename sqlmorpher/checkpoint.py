@@ -0,0 +1,142 @@
+import json
+import threading
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import Boolean, Column, MetaData, String, Table, Text
+from .db import Database
+from .upsert import UPSERT_DIALECTS, _upsert_statement
+
+DEFAULT_CHECKPOINT_TABLE = "sqlmorpher_checkpoints"
+
+# Key types that JSON cannot hold, with how to restore them from text. The
+# datetime entry comes first since a datetime is also a date.
+_KEY_TYPES: Tuple[Tuple[str, Any, Callable[[str], Any]], ...] = (
+    ("datetime", datetime, datetime.fromisoformat),
+    ("date", date, date.fromisoformat),
+    ("time", time, time.fromisoformat),
+    ("decimal", Decimal, Decimal),
+    ("uuid", UUID, UUID),
+    ("bytes", (bytes, memoryview), bytes.fromhex),
+)
+
+
+def _encode_key(value: Any) -> Any:
+    for name, key_type, _ in _KEY_TYPES:
+        if isinstance(value, key_type):
+            text = value.hex() if name == "bytes" else str(value)
+            return {"$type": name, "value": text}
+    return str(value)
+
+
+def _decode_key(value: Dict[str, Any]) -> Any:
+    for name, _, parse in _KEY_TYPES:
+        if value.keys() == {"$type", "value"} and value["$type"] == name:
+            return parse(value["value"])
+    return value
+
+
+class CheckpointStore:
+    """Progress of migration entries, kept in a table of a database.
+
+    For every entry the store records whether it completed and the last
+    root key whose rows were committed. Checkpoints are written with the
+    regular Database API, so when the store lives in the target database
+    they commit in the same transaction as the rows they describe. A store
+    in another database (e.g. a local SQLite file) works as well, but a
+    crash between the two commits can replay the last chunk.
+    """
+
+    def __init__(self, db: Database, table: str = DEFAULT_CHECKPOINT_TABLE):
+        self.db = db
+        self.table = table
+        self._table = Table(
+            table,
+            MetaData(),
+            Column("entry", String(255), primary_key=True),
+            Column("last_key", Text),
+            Column("completed", Boolean, nullable=False),
+        )
+        self._created = False
+        self._lock = threading.Lock()
+
+    def _ensure_table(self) -> None:
+        with self._lock:
+            if not self._created:
+                self._table.create(self.db.engine, checkfirst=True)
+                self._created = True
+
+    def get(self, entry: str) -> Optional[Dict[str, Any]]:
+        """Return the checkpoint of an entry as ``{"last_key",
+        "completed"}``, or None when the entry has none."""
+        self._ensure_table()
+        rows = self.db.execute_query(
+            f"SELECT last_key, completed FROM {self.table} "
+            "WHERE entry = :entry",
+            {"entry": entry},
+        )
+        if not rows:
+            return None
+        last_key = rows[0]["last_key"]
+        return {
+            "last_key": (
+                None
+                if last_key is None
+                else json.loads(last_key, object_hook=_decode_key)
+            ),
+            "completed": bool(rows[0]["completed"]),
+        }
+
+    def save(
+        self, entry: str, last_key: Any = None, completed: bool = False
+    ) -> None:
+        """Record the progress of an entry, replacing its checkpoint.
+
+        The checkpoint is upserted where the database supports it, so
+        concurrent saves of one entry (e.g. from the partitions of a
+        parallel entry) do not conflict.
+
+        Args:
+            entry (str): The entry key.
+            last_key (Any): The last committed root key, JSON-encoded.
+            Dates, times, decimals, UUIDs and bytes keep their type; other
+            values that are not JSON types are stored as strings.
+            completed (bool): Whether the entry completed.
+        """
+        self._ensure_table()
+        row = {
+            "entry": entry,
+            "last_key": (
+                None
+                if last_key is None
+                else json.dumps(last_key, default=_encode_key)
+            ),
+            "completed": completed,
+        }
+        with self.db.transaction() as connection:
+            if self.db.engine.dialect.name in UPSERT_DIALECTS:
+                connection.execute(
+                    _upsert_statement(
+                        self.db, self._table, list(row), ["entry"]
+                    ),
+                    [row],
+                )
+                return
+            self.clear(entry)
+            self.db.execute_query(
+                f"INSERT INTO {self.table} (entry, last_key, completed) "
+                "VALUES (:entry, :last_key, :completed)",
+                row,
+            )
+
+    def clear(self, entry: Optional[str] = None) -> None:
+        """Delete the checkpoint of an entry, or all checkpoints."""
+        self._ensure_table()
+        if entry is None:
+            self.db.execute_query(f"DELETE FROM {self.table}")
+            return
+        self.db.execute_query(
+            f"DELETE FROM {self.table} WHERE entry = :entry",
+            {"entry": entry},
+        )
@@ -1,6 +1,7 @@
 import os
 import yaml
 from .db import Database
+from .cache import default_cache_dir
 from pydantic import validate_call
 from typing import Dict, List, Any, cast
 from .connection_string import create_connection_string
@@ -60,7 +61,11 @@ def load_db_config(path: str) -> Dict[str, Database]:
         path (str): The file path to the database configuration YAML file.
     Returns:
         Dict[str, Database]: A dictionary with 'source' and 'target'
-        Database instances.
+        Database instances. Tables are reflected lazily unless the database
+        configuration sets ``reflect: true``; ``reflection_cache`` enables
+        the on-disk reflection cache, either in the given directory or, if
+        set to true, in the default cache directory. ``engine_options`` is
+        passed to create_engine.
     """
     db_configs = load_config(path).get("databases", {})
     databases: Dict[str, Database] = {}
@@ -74,6 +79,19 @@ def load_db_config(path: str) -> Dict[str, Database]:
             if password:
                 conf["password"] = password
         db_type = conf.pop("type")
+        reflect = bool(conf.pop("reflect", False))
+        reflection_cache = conf.pop("reflection_cache", None)
+        engine_options = conf.pop("engine_options", None)
+        if reflection_cache is True:
+            reflection_cache = default_cache_dir()
+        elif reflection_cache is False:
+            reflection_cache = None
         conn_str = create_connection_string(db_type, **conf)
-        databases[key] = Database(type=db_type, connection_string=conn_str)
+        databases[key] = Database(
+            type=db_type,
+            connection_string=conn_str,
+            reflect=reflect,
+            reflection_cache=reflection_cache,
+            engine_options=engine_options,
+        )
     return databases
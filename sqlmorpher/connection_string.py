@@ -176,11 +176,16 @@ def sqlserver(
     database: str,
     driver: str = "ODBC Driver 18 for SQL Server",
     options: Optional[Dict[str, str]] = None,
+    packet_size: Optional[int] = None,
 ) -> str:
     conn_str = (
         f"Driver={{{driver}}};Server={host},{port};"
         f"Database={database};UID={user};PWD={password}"
     )
+    if packet_size is not None:
+        if packet_size < 512 or packet_size > 32767:
+            raise ValueError("packet_size must be between 512 and 32767.")
+        conn_str += f";Packet Size={packet_size}"
     if options:
         conn_str += ";" + ";".join(f"{k}={v}" for k, v in options.items())
     return _create_odbc("mssql", conn_str, driver="pyodbc")
@@ -255,6 +260,9 @@ def create_connection_string(db_type: str, **kwargs: Any) -> str:
             (default "ODBC Driver 18 for SQL Server").
             options (Optional[Dict[str, str]]): Additional key/value options
             appended to the ODBC connection string.
+            packet_size (Optional[int]): TDS network packet size in bytes
+            (512 to 32767). Larger packets mean fewer round-trips for bulk
+            inserts. Defaults to the driver's default.
 
         access:
             path (str): Path to the .mdb/.accdb file.
@@ -1,33 +1,184 @@
-from sqlalchemy import create_engine, Engine, MetaData, text
-from sqlalchemy.engine import RowMapping, Result
+from sqlalchemy import create_engine, make_url, Engine, MetaData, Table, text
+from sqlalchemy.engine import Connection, RowMapping, Result
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.sql.expression import Executable
 from typing import Any as _Any
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError, NoSuchTableError
 from pydantic import validate_call
-from typing import Optional, Any, Dict, Sequence
+from .cache import ReflectionCache
+from typing import (
+    Optional,
+    Any,
+    Dict,
+    Sequence,
+    Iterator,
+    Iterable,
+    Mapping,
+    List,
+    Tuple,
+)
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import groupby, islice
+import threading
+
+
+_active_connections: ContextVar[Mapping["Database", Connection]] = ContextVar(
+    "sqlmorpher_active_connections", default={}
+)
+
+
+DIALECT_ENGINE_OPTIONS: Dict[Tuple[str, str], Dict[str, Any]] = {
+    ("mssql", "pyodbc"): {"fast_executemany": True},
+}
+
+
+def _engine_options(
+    connection_string: str, engine_options: Mapping[str, Any]
+) -> Dict[str, Any]:
+    url = make_url(connection_string)
+    key = (url.get_backend_name(), url.get_driver_name())
+    options = dict(DIALECT_ENGINE_OPTIONS.get(key, {}))
+    options.update(engine_options)
+    return options
+
+
+def _build_insert_sql(table: str, columns: Sequence[str]) -> str:
+    placeholders = ", ".join([f":{c}" for c in columns])
+    columns_str = ", ".join(columns)
+    return f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
+
+
+def _batched(
+    rows: Iterable[Mapping[str, Any]], batch_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(rows)
+    while True:
+        batch = [dict(row) for row in islice(iterator, batch_size)]
+        if not batch:
+            return
+        yield batch
+
+
+def _group_by_columns(
+    rows: List[Dict[str, Any]],
+) -> Iterator[Tuple[Tuple[str, ...], List[Dict[str, Any]]]]:
+    for columns, group in groupby(rows, key=lambda row: tuple(row.keys())):
+        yield columns, list(group)
 
 
 class Database:
     type: str
     engine: Engine
+    engine_options: Dict[str, Any]
     metadata: MetaData
     session_factory: sessionmaker[Session]
 
     @validate_call
-    def __init__(self, type: str, connection_string: str):
+    def __init__(
+        self,
+        type: str,
+        connection_string: str,
+        reflect: bool = False,
+        reflection_cache: Optional[str] = None,
+        engine_options: Optional[Dict[str, Any]] = None,
+    ):
+        """Create a database handle.
+
+        Table definitions are reflected lazily, on first use through
+        get_table or in bulk through reflect_tables.
+
+        Args:
+            type (str): The database type, e.g. "postgresql".
+            connection_string (str): The SQLAlchemy connection string.
+            reflect (bool): Reflect the whole schema immediately.
+            Defaults to False.
+            reflection_cache (str, optional): Directory of an on-disk cache
+            of reflected tables, reused across processes as long as the
+            schema fingerprint is unchanged. Defaults to None (disabled).
+            engine_options (dict, optional): Extra keyword arguments for
+            create_engine, e.g. ``{"connect_args": {"local_infile": True}}``
+            to allow LOAD DATA LOCAL INFILE with PyMySQL. They override the
+            defaults of DIALECT_ENGINE_OPTIONS for the database backend and
+            driver, such as ``fast_executemany`` for SQL Server with
+            pyodbc. Defaults to None.
+        """
         self.type = type
-        self.engine = create_engine(connection_string)
+        self.engine_options = _engine_options(
+            connection_string, engine_options or {}
+        )
+        self.engine = self._create_engine(
+            connection_string, self.engine_options
+        )
         self.metadata = MetaData()
-        self.metadata.reflect(bind=self.engine)
         self.session_factory = sessionmaker(bind=self.engine)
+        self._reflect_lock = threading.RLock()
+        self._reflection_cache = (
+            ReflectionCache(reflection_cache, connection_string)
+            if reflection_cache
+            else None
+        )
+        self._reflection_cache_loaded = False
+        self._insert_statements: Dict[
+            Tuple[str, Tuple[str, ...]], TextClause
+        ] = {}
+        if reflect:
+            self.reflect_tables()
+
+    def _create_engine(
+        self, connection_string: str, engine_options: Dict[str, Any]
+    ) -> Engine:
+        return create_engine(connection_string, **engine_options)
 
     @validate_call
     def execute_query(
         self, query: str, params: Optional[dict[str, Any]] = None
     ) -> Optional[Sequence[RowMapping]]:
+        return self._execute(text(query), params)
+
+    @contextmanager
+    def transaction(self) -> Iterator[Connection]:
+        """Open a unit of work on one connection.
+
+        Until the block exits, execute_query, insert_row and insert_rows
+        called from the same thread or asyncio task run on the yielded
+        connection instead of opening and committing their own. The
+        transaction commits when the block exits and rolls back if it
+        raises. Nested calls reuse the outer transaction.
+
+        Yields:
+            Connection: The connection of the transaction.
+        """
+        current = self._active_connection()
+        if current is not None:
+            yield current
+            return
+        with self.engine.begin() as connection:
+            token = _active_connections.set(
+                {**_active_connections.get(), self: connection}
+            )
+            try:
+                yield connection
+            finally:
+                _active_connections.reset(token)
+
+    def _active_connection(self) -> Optional[Connection]:
+        return _active_connections.get().get(self)
+
+    def _execute(
+        self, statement: Executable, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Sequence[RowMapping]]:
+        connection = self._active_connection()
+        if connection is not None:
+            result: Result[_Any] = connection.execute(statement, params)
+            if getattr(result, "returns_rows", False):
+                return result.mappings().fetchall()
+            return None
+
         session: Session = self.session_factory()
         try:
-            result: Result[_Any] = session.execute(text(query), params)
+            result = session.execute(statement, params)
             session.commit()
 
             if getattr(result, "returns_rows", False):
@@ -40,17 +191,169 @@ class Database:
             session.close()
 
     @validate_call
-    def insert_row(self, table: str, row: Dict[str, Any]) -> None:
-        columns_list = list(row.keys())
-        placeholders = ", ".join([f":{c}" for c in columns_list])
-        columns_str = ", ".join(columns_list)
-        insert_sql = (
-            f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
-        )
-        self.execute_query(insert_sql, params=row)
+    def stream_query(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Sequence[RowMapping]]:
+        """Execute a query with a server-side cursor and yield its rows in
+        chunks of at most ``chunk_size`` rows.
+
+        Args:
+            query (str): The SQL query to execute.
+            params (dict, optional): Bound parameters for the query.
+            chunk_size (int): Number of rows fetched per round-trip.
+
+        Yields:
+            Sequence[RowMapping]: The next chunk of rows.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer.")
+        with self.engine.connect() as connection:
+            result: Result[_Any] = connection.execution_options(
+                yield_per=chunk_size
+            ).execute(text(query), params)
+            for partition in result.mappings().partitions(chunk_size):
+                yield partition
+
+    def _insert_statement(
+        self, table: str, columns: Tuple[str, ...]
+    ) -> TextClause:
+        key = (table, columns)
+        statement = self._insert_statements.get(key)
+        if statement is None:
+            statement = text(_build_insert_sql(table, columns))
+            self._insert_statements[key] = statement
+        return statement
+
+    def insert_row(self, table: str, row: Mapping[str, Any]) -> None:
+        """Insert a single row into a table.
+
+        The INSERT statement is built once per table and column set and
+        reused by later calls, so per-row inserts only pay for execution.
+
+        Args:
+            table (str): The name of the target table.
+            row (Mapping[str, Any]): The column values to insert.
+        """
+        params = dict(row)
+        self._execute(self._insert_statement(table, tuple(params)), params)
+
+    def insert_rows(
+        self,
+        table: str,
+        rows: Iterable[Mapping[str, Any]],
+        batch_size: int = 1000,
+    ) -> int:
+        """Insert many rows into a table using executemany, committing once
+        per batch instead of once per row.
+
+        Consecutive rows sharing the same set of columns are sent in a
+        single executemany call. Inside transaction(), the batches are
+        written on the transaction's connection and committed with it.
+
+        Args:
+            table (str): The name of the target table.
+            rows (Iterable[Mapping[str, Any]]): The rows to insert.
+            batch_size (int): Maximum number of rows per transaction.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer.")
+        inserted = 0
+        for batch in _batched(rows, batch_size):
+            with self.transaction() as connection:
+                for columns, group in _group_by_columns(batch):
+                    statement = self._insert_statement(table, columns)
+                    connection.execute(statement, group)
+            inserted += len(batch)
+        return inserted
+
+    def reflect_tables(self, only: Optional[Iterable[str]] = None) -> None:
+        """Reflect table definitions into ``metadata``.
+
+        Args:
+            only (Iterable[str], optional): Names of the tables to reflect.
+            Tables already reflected and names that do not exist in the
+            database are skipped. Defaults to None, which reflects the
+            whole schema.
+        """
+        with self._reflect_lock:
+            self._load_reflection_cache()
+            known = set(self.metadata.tables)
+            if only is None:
+                self.metadata.reflect(bind=self.engine)
+            else:
+                missing = {n for n in only if n not in known}
+                if missing:
+                    self.metadata.reflect(
+                        bind=self.engine, only=lambda name, _: name in missing
+                    )
+            if set(self.metadata.tables) != known:
+                self._save_reflection_cache()
+
+    def get_table(self, name: str) -> Table:
+        """Return the definition of a table, reflecting it on first use.
+
+        Args:
+            name (str): The name of the table.
+
+        Returns:
+            Table: The reflected table.
+        """
+        table = self.metadata.tables.get(name)
+        if table is not None:
+            return table
+        with self._reflect_lock:
+            self._load_reflection_cache()
+            table = self.metadata.tables.get(name)
+            if table is not None:
+                return table
+            try:
+                table = Table(name, self.metadata, autoload_with=self.engine)
+            except NoSuchTableError:
+                raise ValueError(f"Table '{name}' does not exist.")
+            self._save_reflection_cache()
+            return table
+
+    def refresh_table(self, name: str) -> Table:
+        """Reflect a table again, e.g. after its schema changed. An already
+        known Table object is updated in place so that existing references
+        to it stay valid.
+
+        Args:
+            name (str): The name of the table.
+
+        Returns:
+            Table: The reflected table.
+        """
+        with self._reflect_lock:
+            if name not in self.metadata.tables:
+                return self.get_table(name)
+            try:
+                table = Table(
+                    name,
+                    self.metadata,
+                    autoload_with=self.engine,
+                    extend_existing=True,
+                )
+            except NoSuchTableError:
+                raise ValueError(f"Table '{name}' does not exist.")
+            self._save_reflection_cache()
+            return table
+
+    def _load_reflection_cache(self) -> None:
+        if self._reflection_cache is None or self._reflection_cache_loaded:
+            return
+        self._reflection_cache.load(self.engine, self.metadata)
+        self._reflection_cache_loaded = True
 
-    def reflect_tables(self) -> None:
-        self.metadata.reflect(bind=self.engine)
+    def _save_reflection_cache(self) -> None:
+        if self._reflection_cache is not None:
+            self._reflection_cache.save(self.metadata)
 
     def validate_connection(self) -> bool:
         try:
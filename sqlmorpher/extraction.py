@@ -0,0 +1,283 @@
+import codecs
+import queue
+import re
+import threading
+from typing import Any, Dict, Iterator, Optional, Sequence, List, Tuple, Union
+from sqlalchemy.engine import RowMapping
+from pydantic import validate_call
+from .db import Database
+
+_COPY_END = object()
+_TEXT_UNESCAPES = {
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+}
+_TEXT_ESCAPE_RE = re.compile(r"\\(x[0-9a-fA-F]{1,2}|[0-7]{1,3}|.)")
+
+
+class _QueueWriter:
+    """File-like sink handed to psycopg2's copy_expert, forwarding every
+    chunk to a bounded queue until the consumer stops."""
+
+    def __init__(self, chunks: "queue.Queue[Any]", stop: threading.Event):
+        self.chunks = chunks
+        self.stop = stop
+
+    def put(self, item: Any) -> bool:
+        while not self.stop.is_set():
+            try:
+                self.chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def write(self, data: Union[str, bytes]) -> int:
+        if not self.put(data):
+            raise RuntimeError("COPY TO STDOUT consumer stopped reading.")
+        return len(data)
+
+
+def _copy_expert_out(cursor: Any, copy_sql: str) -> Iterator[Any]:
+    chunks: "queue.Queue[Any]" = queue.Queue(maxsize=64)
+    stop = threading.Event()
+    writer = _QueueWriter(chunks, stop)
+
+    def produce() -> None:
+        try:
+            cursor.copy_expert(copy_sql, writer)
+        except BaseException as e:
+            writer.put(e)
+        finally:
+            writer.put(_COPY_END)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is _COPY_END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _iter_copy_out(db: Database, copy_sql: str) -> Iterator[bytes]:
+    raw_connection = db.engine.raw_connection()
+    try:
+        cursor = raw_connection.cursor()
+        try:
+            if hasattr(cursor, "copy_expert"):
+                chunks = _copy_expert_out(cursor, copy_sql)
+            else:
+                chunks = _copy_iter(cursor, copy_sql)
+            for data in chunks:
+                yield data.encode() if isinstance(data, str) else bytes(data)
+        finally:
+            cursor.close()
+    finally:
+        raw_connection.rollback()
+        raw_connection.close()
+
+
+def _copy_iter(cursor: Any, copy_sql: str) -> Iterator[Any]:
+    with cursor.copy(copy_sql) as copy:
+        yield from copy
+
+
+def _unescape_text_field(field: str) -> Optional[str]:
+    if field == "\\N":
+        return None
+    if "\\" not in field:
+        return field
+
+    def replace(match: "re.Match[str]") -> str:
+        code = match.group(1)
+        if code[0] == "x" and len(code) > 1:
+            return chr(int(code[1:], 16))
+        if code[0] in "01234567":
+            return chr(int(code, 8))
+        return _TEXT_UNESCAPES.get(code, code)
+
+    return _TEXT_ESCAPE_RE.sub(replace, field)
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def iter_keyset_pages(
+    db: Database,
+    queries: Dict[str, str],
+    chunk_size: int,
+    lower_key: Optional[Any] = None,
+    upper_key: Optional[Any] = None,
+    after_key: Optional[Any] = None,
+) -> Iterator[Tuple[Sequence[RowMapping], Any]]:
+    """Read a join page by page like ``iter_keyset_chunks``, also yielding
+    the last root key of every page, e.g. to checkpoint progress.
+
+    Args:
+        db (Database): The source database.
+        queries (Dict[str, str]): The "bounds", "keys" and "page" queries.
+        chunk_size (int): The chunk size the queries were generated with.
+        lower_key (Any, optional): First root key to read (inclusive).
+        Defaults to the smallest key of the root table.
+        upper_key (Any, optional): Last root key to read (inclusive).
+        Defaults to the largest key of the root table.
+        after_key (Any, optional): Only read root keys greater than this
+        one, e.g. the last key of a previous run. Defaults to None.
+
+    Yields:
+        Tuple[Sequence[RowMapping], Any]: The join rows of up to
+        ``chunk_size`` root keys and the last of these keys.
+    """
+    if after_key is not None and (lower_key is None or after_key > lower_key):
+        lower_key = after_key
+    if lower_key is None or upper_key is None:
+        bounds = db.execute_query(queries["bounds"]) or []
+        if not bounds or bounds[0]["min_key"] is None:
+            return
+        if lower_key is None:
+            lower_key = bounds[0]["min_key"]
+        if upper_key is None:
+            upper_key = bounds[0]["max_key"]
+
+    while lower_key is not None:
+        key_range = {"lower_key": lower_key, "upper_key": upper_key}
+        keys = [
+            row["root_key"]
+            for row in db.execute_query(queries["keys"], key_range) or []
+        ]
+        if not keys:
+            return
+        if after_key is not None and keys[0] == after_key:
+            after_key = None
+            lower_key = keys[1] if len(keys) > 1 else None
+            continue
+
+        page_keys = keys[:chunk_size]
+        key_range["upper_key"] = page_keys[-1]
+        rows = db.execute_query(queries["page"], key_range) or []
+        if rows:
+            yield rows, page_keys[-1]
+
+        lower_key = keys[chunk_size] if len(keys) > chunk_size else None
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def iter_keyset_chunks(
+    db: Database,
+    queries: Dict[str, str],
+    chunk_size: int,
+    lower_key: Optional[Any] = None,
+    upper_key: Optional[Any] = None,
+) -> Iterator[Sequence[RowMapping]]:
+    """Read a join page by page using the queries produced by
+    ``generate_keyset_queries``.
+
+    Args:
+        db (Database): The source database.
+        queries (Dict[str, str]): The "bounds", "keys" and "page" queries.
+        chunk_size (int): The chunk size the queries were generated with.
+        lower_key (Any, optional): First root key to read (inclusive).
+        Defaults to the smallest key of the root table.
+        upper_key (Any, optional): Last root key to read (inclusive).
+        Defaults to the largest key of the root table.
+
+    Yields:
+        Sequence[RowMapping]: The join rows of up to ``chunk_size`` root
+        keys.
+    """
+    for rows, _ in iter_keyset_pages(
+        db, queries, chunk_size, lower_key, upper_key
+    ):
+        yield rows
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def partition_key_range(
+    db: Database, queries: Dict[str, str], partitions: int
+) -> List[Tuple[Any, Any]]:
+    """Split the root key range into at most ``partitions`` disjoint,
+    inclusive key ranges that can be read concurrently.
+
+    Integer keys are split arithmetically between MIN and MAX; other key
+    types are split into buckets of equal row count with NTILE.
+
+    Args:
+        db (Database): The source database.
+        queries (Dict[str, str]): The queries produced by
+        ``generate_keyset_queries``.
+        partitions (int): The number of ranges to produce.
+
+    Returns:
+        List[Tuple[Any, Any]]: ``(lower_key, upper_key)`` pairs, in key
+        order. Empty when the root table has no rows.
+    """
+    if partitions <= 0:
+        raise ValueError("partitions must be a positive integer.")
+    bounds = db.execute_query(queries["bounds"]) or []
+    if not bounds or bounds[0]["min_key"] is None:
+        return []
+    min_key, max_key = bounds[0]["min_key"], bounds[0]["max_key"]
+
+    if isinstance(min_key, int) and isinstance(max_key, int):
+        step = -(-(max_key - min_key + 1) // partitions)
+        return [
+            (lower, min(lower + step - 1, max_key))
+            for lower in range(min_key, max_key + 1, step)
+        ]
+
+    tiles = db.execute_query(
+        queries["partitions"], {"partitions": partitions}
+    )
+    return [(row["min_key"], row["max_key"]) for row in tiles or []]
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def iter_copy_chunks(
+    db: Database, query: str, columns: List[str], chunk_size: int = 1000
+) -> Iterator[List[Dict[str, Optional[str]]]]:
+    """Read a query result from PostgreSQL with ``COPY (query) TO STDOUT``
+    and yield it as chunks of row dicts.
+
+    COPY skips the per-row result processing of the driver, but every value
+    is returned as text (or None for NULL) and is cast back by the target
+    database on insert.
+
+    Args:
+        db (Database): The source database (psycopg2 or psycopg driver).
+        query (str): The query to export, e.g. from generate_join_query.
+        columns (List[str]): The column names of the query, in order.
+        chunk_size (int): Number of rows per yielded chunk.
+
+    Yields:
+        List[Dict[str, Optional[str]]]: The next chunk of rows.
+    """
+    if db.engine.dialect.name != "postgresql":
+        raise ValueError(
+            "COPY extraction requires a PostgreSQL database, got "
+            f"'{db.engine.dialect.name}'."
+        )
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    batch: List[Dict[str, Optional[str]]] = []
+    for data in _iter_copy_out(db, f"COPY ({query}) TO STDOUT"):
+        pending += decoder.decode(data)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            fields = [_unescape_text_field(f) for f in line.split("\t")]
+            batch.append(dict(zip(columns, fields)))
+            if len(batch) >= chunk_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
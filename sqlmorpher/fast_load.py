@@ -0,0 +1,73 @@
+from contextlib import contextmanager
+from typing import Any, Iterator
+from sqlalchemy import event, text
+from pydantic import validate_call
+from .db import Database
+
+SQLITE_JOURNAL_MODES = ("WAL", "OFF")
+FAST_LOAD_COMMIT_EVERY = 100000
+
+
+def _is_file_sqlite(db: Database) -> bool:
+    url = db.engine.url
+    return url.get_backend_name() == "sqlite" and url.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+@contextmanager
+@validate_call(config={"arbitrary_types_allowed": True})
+def sqlite_fast_load(
+    db: Database, journal_mode: str = "WAL", cache_size: int = -262144
+) -> Iterator[None]:
+    """Tune a file-based SQLite database for bulk writes for the duration
+    of the block.
+
+    Every connection opened inside the block uses the given journal mode,
+    ``synchronous=OFF`` and the given page cache size. Pooled connections
+    are closed on entry and exit so that none keeps the tuned settings,
+    and the original journal mode is restored on exit. In-memory databases
+    are left untouched.
+
+    ``synchronous=OFF`` gives up durability on power loss, and
+    ``journal_mode=OFF`` also gives up rollback: a failed transaction can
+    leave partial writes behind.
+
+    Args:
+        db (Database): The SQLite database.
+        journal_mode (str): "WAL" (default) or "OFF".
+        cache_size (int): Value for ``PRAGMA cache_size``; negative values
+        are KiB. Defaults to -262144 (256 MiB).
+    """
+    if journal_mode.upper() not in SQLITE_JOURNAL_MODES:
+        raise ValueError(
+            f"Invalid journal_mode '{journal_mode}'. "
+            f"Expected one of: {list(SQLITE_JOURNAL_MODES)}"
+        )
+    if not _is_file_sqlite(db):
+        yield
+        return
+
+    with db.engine.connect() as connection:
+        original = connection.execute(text("PRAGMA journal_mode")).scalar()
+
+    def tune(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA journal_mode={journal_mode.upper()}")
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.execute(f"PRAGMA cache_size={int(cache_size)}")
+        finally:
+            cursor.close()
+
+    db.engine.dispose()
+    event.listen(db.engine, "connect", tune)
+    try:
+        yield
+    finally:
+        event.remove(db.engine, "connect", tune)
+        db.engine.dispose()
+        with db.engine.connect() as connection:
+            connection.exec_driver_sql(f"PRAGMA journal_mode={original}")
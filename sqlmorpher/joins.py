@@ -1,11 +1,24 @@
+import json
 import re
 from typing import List, Dict, Optional, Tuple, Any, Set
-from sqlalchemy import inspect, Table, MetaData, select, Engine
+from sqlalchemy import (
+    Table,
+    select,
+    Column,
+    Select,
+    and_,
+    func,
+    literal_column,
+    text,
+    Connection,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.sql.sqltypes import Integer, String, Date, Boolean
 from pydantic import validate_call
 from .db import Database
 
+VALIDATION_MODES = ("probe", "explain", "metadata", "none")
+
 
 def _get_column_type(table: Table, column: str) -> Optional[str]:
     col = table.c.get(column)
@@ -29,16 +42,18 @@ def _parse_on_clause(on: str) -> Optional[Tuple[str, str, str, str]]:
     return (m.group(1), m.group(2), m.group(3), m.group(4))
 
 
-def _load_table(metadata: MetaData, engine: Engine, table_name: str) -> Table:
-    return Table(table_name, metadata, autoload_with=engine)
-
-
-def _ensure_columns_exist(table: Table, columns: List[str]) -> None:
+def _ensure_columns_exist(
+    db: Database, table: Table, columns: List[str]
+) -> Table:
+    if all(col in table.c for col in columns):
+        return table
+    table = db.refresh_table(table.name)
     for col in columns:
         if col not in table.c:
             raise ValueError(
                 f"Column '{col}' does not exist in table '{table.name}'."
             )
+    return table
 
 
 def _ensure_referenced_tables(
@@ -49,14 +64,6 @@ def _ensure_referenced_tables(
             raise ValueError(f"Table '{t}' referenced before being joined.")
 
 
-def _ensure_table_and_load(
-    name: str, metadata: MetaData, db: Database, tables: Set[str]
-) -> Table:
-    if name not in tables:
-        raise ValueError(f"Table '{name}' does not exist.")
-    return _load_table(metadata, db.engine, name)
-
-
 def _parse_on_or_raise(on: str) -> Tuple[str, str, str, str]:
     parsed = _parse_on_clause(on)
     if not parsed:
@@ -64,34 +71,29 @@ def _parse_on_or_raise(on: str) -> Tuple[str, str, str, str]:
     return parsed
 
 
-@validate_call(config={"arbitrary_types_allowed": True})
-def validate_joins(
-    db: Database, root_table_name: str, join_tables: List[Dict[str, str]]
-) -> Tuple[Any, Dict[str, Table]]:
-    """Validate join configurations for SQL queries.
+def _is_foreign_key_join(
+    left_col: Column[Any], right_col: Column[Any]
+) -> bool:
+    for col, other in ((left_col, right_col), (right_col, left_col)):
+        target = f"{other.table.name}.{other.name}"
+        for fk in col.foreign_keys:
+            if fk.target_fullname.split(".")[-2:] == target.split("."):
+                return True
+    return False
 
-    Args:
-        db (Database): The database instance.
-        root_table_name (str): The name of the root table.
-        join_tables (List[Dict[str, str]]): A list of join specifications.
 
-    Returns:
-        Tuple containing:
-        - from_clause: The SQLAlchemy from clause with all joins
-        - table_map: Dictionary mapping table names to Table objects
-    """
-    inspector = inspect(db.engine)
-    tables = set(inspector.get_table_names())
-    if root_table_name not in tables:
+def _build_joins(
+    db: Database, root_table_name: str, join_tables: List[Dict[str, str]]
+) -> Tuple[Any, Dict[str, Table], List[Tuple[str, Any, bool]]]:
+    try:
+        root_table = db.get_table(root_table_name)
+    except ValueError:
         raise ValueError(f"Root table '{root_table_name}' does not exist.")
 
-    metadata = MetaData()
     added_tables = {root_table_name}
-    table_map: Dict[str, Table] = {}
-
-    root_table = _load_table(metadata, db.engine, root_table_name)
-    table_map[root_table_name] = root_table
+    table_map: Dict[str, Table] = {root_table_name: root_table}
     from_clause: Any = root_table
+    steps: List[Tuple[str, Any, bool]] = []
 
     for join_info in join_tables:
         table_name = join_info.get("table")
@@ -101,7 +103,7 @@ def validate_joins(
         if not table_name or not on_clause:
             raise ValueError("Each join must have 'table' and 'on' keys.")
 
-        _ensure_table_and_load(table_name, metadata, db, tables)
+        table_map[table_name] = db.get_table(table_name)
 
         left_table_name, left_col_name, right_table_name, right_col_name = (
             _parse_on_or_raise(on_clause)
@@ -111,19 +113,15 @@ def validate_joins(
             added_tables, (left_table_name, right_table_name), table_name
         )
 
-        left_table = _ensure_table_and_load(
-            left_table_name, metadata, db, tables
+        left_table = _ensure_columns_exist(
+            db, table_map[left_table_name], [left_col_name]
         )
-        right_table = _ensure_table_and_load(
-            right_table_name, metadata, db, tables
+        right_table = _ensure_columns_exist(
+            db, table_map[right_table_name], [right_col_name]
         )
-
         table_map[left_table_name] = left_table
         table_map[right_table_name] = right_table
 
-        _ensure_columns_exist(left_table, [left_col_name])
-        _ensure_columns_exist(right_table, [right_col_name])
-
         left_type = _get_column_type(left_table, left_col_name)
         right_type = _get_column_type(right_table, right_col_name)
         if left_type != right_type:
@@ -141,27 +139,195 @@ def validate_joins(
             right_table, left_col == right_col, isouter=is_outer
         )
         added_tables.add(table_name)
+        steps.append(
+            (
+                table_name,
+                from_clause,
+                _is_foreign_key_join(left_col, right_col),
+            )
+        )
 
-    first_col = list(root_table.c)[0]
-    stmt = select(first_col).select_from(from_clause).limit(1)
-    sql_str = str(
-        stmt.compile(db.engine, compile_kwargs={"literal_binds": True})
+    return from_clause, table_map, steps
+
+
+def _first_column_select(
+    table_map: Dict[str, Table], root_table_name: str, from_clause: Any
+) -> Select[Any]:
+    first_col = list(table_map[root_table_name].c)[0]
+    return select(first_col).select_from(from_clause)
+
+
+def _explain_json(connection: Connection, prefix: str, sql: str) -> Any:
+    plan = connection.execute(text(prefix + sql)).scalar()
+    return json.loads(plan) if isinstance(plan, str) else plan
+
+
+def _explain_cost(db: Database, sql: str) -> Optional[float]:
+    dialect = db.engine.dialect.name
+    with db.engine.connect() as connection:
+        if dialect == "postgresql":
+            plan = _explain_json(connection, "EXPLAIN (FORMAT JSON) ", sql)
+            return float(plan[0]["Plan"]["Total Cost"])
+        if dialect == "mysql":
+            plan = _explain_json(connection, "EXPLAIN FORMAT=JSON ", sql)
+            return float(plan["query_block"]["cost_info"]["query_cost"])
+        if dialect == "mssql":
+            connection.exec_driver_sql("SET SHOWPLAN_XML ON")
+            try:
+                plan = connection.exec_driver_sql(sql).scalar()
+            finally:
+                connection.exec_driver_sql("SET SHOWPLAN_XML OFF")
+            match = re.search(
+                r'StatementSubTreeCost="([0-9.eE+-]+)"', str(plan)
+            )
+            return float(match.group(1)) if match else None
+        if dialect == "oracle":
+            connection.execute(
+                text("EXPLAIN PLAN SET STATEMENT_ID = 'sqlmorpher' FOR " + sql)
+            )
+            cost = connection.execute(
+                text(
+                    "SELECT cost FROM plan_table "
+                    "WHERE statement_id = 'sqlmorpher' AND id = 0"
+                )
+            ).scalar()
+            connection.execute(
+                text(
+                    "DELETE FROM plan_table "
+                    "WHERE statement_id = 'sqlmorpher'"
+                )
+            )
+            return float(cost) if cost is not None else None
+        prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+        connection.execute(text(prefix + sql)).fetchall()
+        return None
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def validate_joins(
+    db: Database,
+    root_table_name: str,
+    join_tables: List[Dict[str, str]],
+    validation: str = "probe",
+) -> Tuple[Any, Dict[str, Table]]:
+    """Validate join configurations for SQL queries.
+
+    Args:
+        db (Database): The database instance.
+        root_table_name (str): The name of the root table.
+        join_tables (List[Dict[str, str]]): A list of join specifications.
+        validation (str): How the join is checked against the database
+        once tables, columns and types have been validated:
+        - "probe" (default) executes the join with LIMIT 1
+        - "explain" only asks the database for the query plan
+        - "metadata" skips the probe when every join follows a reflected
+          foreign key, and probes otherwise
+        - "none" skips the check
+
+    Returns:
+        Tuple containing:
+        - from_clause: The SQLAlchemy from clause with all joins
+        - table_map: Dictionary mapping table names to Table objects
+
+    Tables are taken from the table registry of ``db`` (see
+    Database.get_table), so each table is reflected at most once.
+    """
+    if validation not in VALIDATION_MODES:
+        raise ValueError(
+            f"Invalid validation '{validation}'. "
+            f"Expected one of: {list(VALIDATION_MODES)}"
+        )
+    from_clause, table_map, steps = _build_joins(
+        db, root_table_name, join_tables
     )
+    if validation == "none" or (
+        validation == "metadata" and all(fk for _, _, fk in steps)
+    ):
+        return from_clause, table_map
 
+    stmt = _first_column_select(table_map, root_table_name, from_clause)
     try:
-        db.execute_query(sql_str)
+        if validation == "explain":
+            _explain_cost(db, _compile(db, stmt))
+        else:
+            db.execute_query(_compile(db, stmt.limit(1)))
     except SQLAlchemyError as e:
         raise ValueError(f"Join validation failed: {e}")
 
     return from_clause, table_map
 
 
+@validate_call(config={"arbitrary_types_allowed": True})
+def explain_joins(
+    db: Database, root_table_name: str, join_tables: List[Dict[str, str]]
+) -> List[Dict[str, Any]]:
+    """Estimate the cost of a join chain without executing it.
+
+    The plan of the root table joined with the first ``n`` join tables is
+    requested for every ``n``, so the cost added by each join can be read
+    from the difference between consecutive entries.
+
+    Args:
+        db (Database): The database instance.
+        root_table_name (str): The name of the root table.
+        join_tables (List[Dict[str, str]]): A list of join specifications.
+
+    Returns:
+        List[Dict[str, Any]]: One dict per join, in order, with the joined
+        "table", whether the join follows a reflected foreign key
+        ("foreign_key") and the estimated total "cost" of the query up to
+        that join. The cost is None for databases whose plan does not
+        expose a cost, such as SQLite.
+    """
+    _, table_map, steps = _build_joins(db, root_table_name, join_tables)
+    report: List[Dict[str, Any]] = []
+    for table_name, from_clause, is_fk in steps:
+        stmt = _first_column_select(table_map, root_table_name, from_clause)
+        try:
+            cost = _explain_cost(db, _compile(db, stmt))
+        except SQLAlchemyError as e:
+            raise ValueError(f"Join validation failed: {e}")
+        report.append(
+            {"table": table_name, "foreign_key": is_fk, "cost": cost}
+        )
+    return report
+
+
+def _build_select(
+    from_clause: Any,
+    table_map: Dict[str, Table],
+    select_columns: Dict[str, str],
+) -> Select[Any]:
+    columns = [
+        table_map[table_col.split(".")[0]]
+        .c[table_col.split(".")[1]]
+        .label(alias)
+        for table_col, alias in select_columns.items()
+    ]
+    return select(*columns).select_from(from_clause)
+
+
+def _compile(db: Database, stmt: Select[Any]) -> str:
+    return str(stmt.compile(db.engine, compile_kwargs={"literal_binds": True}))
+
+
+def _root_key_column(table: Table) -> Column[Any]:
+    key_columns = list(table.primary_key.columns)
+    if len(key_columns) != 1:
+        raise ValueError(
+            "Keyset extraction requires a single-column primary key on "
+            f"root table '{table.name}'."
+        )
+    return key_columns[0]
+
+
 @validate_call(config={"arbitrary_types_allowed": True})
 def generate_join_query(
     db: Database,
     root_table_name: str,
     join_tables: List[Dict[str, Any]],
     select_columns: Dict[str, str],
+    validation: str = "probe",
 ) -> str:
     """
     Generate a SQL query with joins based on the provided root table and
@@ -173,21 +339,98 @@ def generate_join_query(
         join_tables (List[Dict[str, str]]): A list of join specifications.
         select_columns (Dict[str, str]): A dictionary mapping source columns
         to aliases.
+        validation (str): The join validation mode, see validate_joins.
 
     Returns:
         str: The generated SQL query with joins.
     """
-    from_clause, table_map = validate_joins(db, root_table_name, join_tables)
+    from_clause, table_map = validate_joins(
+        db, root_table_name, join_tables, validation
+    )
+    stmt = _build_select(from_clause, table_map, select_columns)
+    return _compile(db, stmt)
 
-    columns = [
-        table_map[table_col.split(".")[0]]
-        .c[table_col.split(".")[1]]
-        .label(alias)
-        for table_col, alias in select_columns.items()
-    ]
 
-    stmt = select(*columns).select_from(from_clause)
-    sql_str = str(
-        stmt.compile(db.engine, compile_kwargs={"literal_binds": True})
+@validate_call(config={"arbitrary_types_allowed": True})
+def generate_keyset_queries(
+    db: Database,
+    root_table_name: str,
+    join_tables: List[Dict[str, Any]],
+    select_columns: Dict[str, str],
+    chunk_size: int,
+    validation: str = "probe",
+) -> Dict[str, str]:
+    """
+    Generate the queries used to read a join page by page, using keyset
+    pagination on the primary key of the root table.
+
+    Every page is bounded by an inclusive key range, so each query is an
+    index range scan on the root table and all join rows of a root key are
+    always read in the same page.
+
+    Args:
+        db (Database): The database instance.
+        root_table_name (str): The name of the root table. It must have a
+        single-column primary key.
+        join_tables (List[Dict[str, str]]): A list of join specifications.
+        select_columns (Dict[str, str]): A dictionary mapping source columns
+        to aliases.
+        chunk_size (int): Maximum number of root keys per page.
+        validation (str): The join validation mode, see validate_joins.
+
+    Returns:
+        Dict[str, str]: The queries, keyed by role:
+        - "bounds": selects ``min_key`` and ``max_key`` of the root table
+        - "keys": selects up to ``chunk_size + 1`` ``root_key`` values from
+          ``:lower_key`` to ``:upper_key``
+        - "page": the join query restricted to keys from ``:lower_key``
+          to ``:upper_key``
+        - "partitions": splits the keys into ``:partitions`` buckets of
+          equal size with NTILE and selects the ``min_key`` and
+          ``max_key`` of each bucket
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+    from_clause, table_map = validate_joins(
+        db, root_table_name, join_tables, validation
+    )
+    key_col = _root_key_column(table_map[root_table_name])
+    key_range = and_(
+        key_col >= literal_column(":lower_key"),
+        key_col <= literal_column(":upper_key"),
+    )
+
+    bounds = select(
+        func.min(key_col).label("min_key"), func.max(key_col).label("max_key")
+    )
+    keys = (
+        select(key_col.label("root_key"))
+        .where(key_range)
+        .order_by(key_col)
+        .limit(chunk_size + 1)
+    )
+    page = (
+        _build_select(from_clause, table_map, select_columns)
+        .where(key_range)
+        .order_by(key_col)
+    )
+    tiles = select(
+        key_col.label("root_key"),
+        func.ntile(literal_column(":partitions"))
+        .over(order_by=key_col)
+        .label("bucket"),
+    ).subquery()
+    partitions = (
+        select(
+            func.min(tiles.c.root_key).label("min_key"),
+            func.max(tiles.c.root_key).label("max_key"),
+        )
+        .group_by(tiles.c.bucket)
+        .order_by(func.min(tiles.c.root_key))
     )
-    return sql_str
+    return {
+        "bounds": _compile(db, bounds),
+        "keys": _compile(db, keys),
+        "page": _compile(db, page),
+        "partitions": _compile(db, partitions),
+    }
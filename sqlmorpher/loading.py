@@ -0,0 +1,453 @@
+import json
+import os
+import re
+import tempfile
+import weakref
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    Union,
+)
+from sqlalchemy.exc import DBAPIError
+from .arrow import _is_duckdb, arrow_load_rows
+from .db import Database, _batched, _group_by_columns
+from .extraction import _iter_copy_out
+
+LOAD_METHODS = ("auto", "insert", "copy", "load_data", "bulk", "arrow")
+
+_COPY_DRIVERS = ("psycopg2", "psycopg")
+_LOAD_DATA_DRIVERS = ("pymysql", "mysqldb")
+_LOCAL_INFILE_DISABLED = (1148, 2068, 3948)
+_MYSQL_ESCAPES = {
+    b"\\": b"\\\\",
+    b"\t": b"\\t",
+    b"\n": b"\\n",
+    b"\r": b"\\r",
+    b"\0": b"\\0",
+}
+_MYSQL_ESCAPE_RE = re.compile(b"[\\\\\t\n\r\0]")
+_load_data_disabled: "weakref.WeakSet[Database]" = weakref.WeakSet()
+_TEXT_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+_ARRAY_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
+def _array_literal(values: List[Any]) -> str:
+    elements = (
+        "NULL"
+        if value is None
+        else (
+            _array_literal(value)
+            if isinstance(value, list)
+            else f'"{_text_literal(value).translate(_ARRAY_ESCAPES)}"'
+        )
+        for value in values
+    )
+    return "{" + ",".join(elements) + "}"
+
+
+def _text_literal(value: Any) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\x" + bytes(value).hex()
+    if isinstance(value, dict):
+        return json.dumps(value, default=str)
+    if isinstance(value, list):
+        return _array_literal(value)
+    return str(value)
+
+
+def _text_value(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    return _text_literal(value).translate(_TEXT_ESCAPES)
+
+
+def _encode_text_rows(
+    batch: List[Dict[str, Any]], columns: Sequence[str]
+) -> str:
+    return "".join(
+        "\t".join(_text_value(row[col]) for col in columns) + "\n"
+        for row in batch
+    )
+
+
+def _supports_copy(db: Database) -> bool:
+    dialect = db.engine.dialect
+    return dialect.name == "postgresql" and dialect.driver in _COPY_DRIVERS
+
+
+def _supports_load_data(db: Database) -> bool:
+    dialect = db.engine.dialect
+    return (
+        dialect.name in ("mysql", "mariadb")
+        and dialect.driver in _LOAD_DATA_DRIVERS
+    )
+
+
+def _supports_bulk_insert(db: Database) -> bool:
+    dialect = db.engine.dialect
+    return dialect.name == "mssql" and dialect.driver == "pyodbc"
+
+
+def _mysql_text_value(value: Any) -> bytes:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return _MYSQL_ESCAPE_RE.sub(
+            lambda match: _MYSQL_ESCAPES[match.group()], bytes(value)
+        )
+    return _text_value(value).encode()
+
+
+def _encode_load_data_rows(
+    batch: List[Dict[str, Any]], columns: Sequence[str]
+) -> bytes:
+    return b"".join(
+        b"\t".join(_mysql_text_value(row[col]) for col in columns)
+        + b"\n"
+        for row in batch
+    )
+
+
+def _local_infile_disabled(error: DBAPIError) -> bool:
+    args: Tuple[Any, ...] = getattr(error.orig, "args", ())
+    return bool(args) and args[0] in _LOCAL_INFILE_DISABLED
+
+
+class _IterReader:
+    """Read-only file-like view over an iterator of chunks, as expected by
+    psycopg2's copy_expert."""
+
+    def __init__(self, chunks: Iterable[Union[str, bytes]]):
+        self.chunks: Iterator[Union[str, bytes]] = iter(chunks)
+
+    def read(self, size: int = -1) -> Union[str, bytes]:
+        return next(self.chunks, b"")
+
+    def readline(self, size: int = -1) -> Union[str, bytes]:
+        return self.read(size)
+
+
+def _copy_from(
+    cursor: Any, copy_sql: str, chunks: Iterable[Union[str, bytes]]
+) -> None:
+    if hasattr(cursor, "copy_expert"):
+        cursor.copy_expert(copy_sql, _IterReader(chunks))
+        return
+    with cursor.copy(copy_sql) as copy:
+        for data in chunks:
+            copy.write(data)
+
+
+def _copy_all(
+    cursor: Any, copies: Sequence[Tuple[str, Iterable[Union[str, bytes]]]]
+) -> None:
+    for copy_sql, chunks in copies:
+        _copy_from(cursor, copy_sql, chunks)
+
+
+def _run_copy_from(
+    db: Database, copies: Sequence[Tuple[str, Iterable[Union[str, bytes]]]]
+) -> None:
+    connection = db._active_connection()
+    if connection is not None:
+        cursor = connection.connection.cursor()
+        try:
+            _copy_all(cursor, copies)
+        finally:
+            cursor.close()
+        return
+    raw_connection = db.engine.raw_connection()
+    try:
+        cursor = raw_connection.cursor()
+        try:
+            _copy_all(cursor, copies)
+        finally:
+            cursor.close()
+        raw_connection.commit()
+    except Exception:
+        raw_connection.rollback()
+        raise
+    finally:
+        raw_connection.close()
+
+
+def copy_rows(
+    db: Database,
+    table: str,
+    rows: Iterable[Mapping[str, Any]],
+    batch_size: int = 1000,
+) -> int:
+    """Load rows into a PostgreSQL table with ``COPY ... FROM STDIN``,
+    one commit per batch. Inside Database.transaction(), the COPYs run on
+    the transaction's connection and commit with it.
+
+    As with Database.insert_rows, consecutive rows sharing the same set of
+    columns are sent in one COPY, so columns missing from a row get their
+    default. Lists are written as PostgreSQL arrays and dicts as JSON.
+
+    Args:
+        db (Database): The target database (psycopg2 or psycopg driver).
+        table (str): The name of the target table.
+        rows (Iterable[Mapping[str, Any]]): The rows to load.
+        batch_size (int): Maximum number of rows per COPY.
+
+    Returns:
+        int: The number of rows loaded.
+    """
+    if not _supports_copy(db):
+        raise ValueError(
+            "COPY loading requires a PostgreSQL database using the "
+            f"psycopg2 or psycopg driver, got '{db.engine.dialect.name}'."
+        )
+    if batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer.")
+    loaded = 0
+    for batch in _batched(rows, batch_size):
+        _run_copy_from(
+            db,
+            [
+                (
+                    f"COPY {table} ({', '.join(columns)}) FROM STDIN",
+                    [_encode_text_rows(group, columns)],
+                )
+                for columns, group in _group_by_columns(batch)
+            ],
+        )
+        loaded += len(batch)
+    return loaded
+
+
+def copy_query_to_table(
+    source_db: Database,
+    query: str,
+    target_db: Database,
+    table: str,
+    columns: List[str],
+) -> int:
+    """Pipe a query result from a PostgreSQL source straight into a
+    PostgreSQL target table, chaining ``COPY (query) TO STDOUT`` into
+    ``COPY table FROM STDIN`` without building Python rows.
+
+    The whole result is loaded in a single target transaction.
+
+    Args:
+        source_db (Database): The source database.
+        query (str): The query to export, e.g. from generate_join_query.
+        target_db (Database): The target database.
+        table (str): The name of the target table.
+        columns (List[str]): The target columns, in query column order.
+
+    Returns:
+        int: The number of rows loaded.
+    """
+    if source_db.engine.dialect.name != "postgresql" or not _supports_copy(
+        target_db
+    ):
+        raise ValueError(
+            "COPY piping requires PostgreSQL source and target databases."
+        )
+    loaded = 0
+
+    def counted(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        # Text format escapes newlines in values, so each one ends a row.
+        nonlocal loaded
+        for data in chunks:
+            loaded += data.count(b"\n")
+            yield data
+
+    chunks = _iter_copy_out(source_db, f"COPY ({query}) TO STDOUT")
+    copy_sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    _run_copy_from(target_db, [(copy_sql, counted(chunks))])
+    return loaded
+
+
+def _run_load_data(db: Database, load_sql: str) -> None:
+    with db.transaction() as connection:
+        connection.exec_driver_sql(load_sql)
+
+
+def _load_data_group(
+    db: Database,
+    table: str,
+    columns: Sequence[str],
+    rows: List[Dict[str, Any]],
+) -> None:
+    fd, path = tempfile.mkstemp(prefix="sqlmorpher-", suffix=".tsv")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_encode_load_data_rows(rows, columns))
+        infile = path.replace("\\", "/").replace("'", "''")
+        _run_load_data(
+            db,
+            f"LOAD DATA LOCAL INFILE '{infile}' INTO TABLE {table} "
+            "CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+            f"LINES TERMINATED BY '\\n' ({', '.join(columns)})",
+        )
+    finally:
+        os.remove(path)
+
+
+def _load_data_batch(
+    db: Database, table: str, batch: List[Dict[str, Any]]
+) -> None:
+    with db.transaction():
+        for columns, group in _group_by_columns(batch):
+            _load_data_group(db, table, columns, group)
+
+
+def load_data_rows(
+    db: Database,
+    table: str,
+    rows: Iterable[Mapping[str, Any]],
+    batch_size: int = 1000,
+) -> int:
+    """Load rows into a MySQL table with ``LOAD DATA LOCAL INFILE``, one
+    statement per batch spooled to a temporary tab-separated file.
+
+    The client must allow local files, e.g. with
+    ``engine_options={"connect_args": {"local_infile": True}}`` for
+    PyMySQL, and the server must have ``local_infile`` enabled. Otherwise
+    the rows are written with batched inserts instead, and later calls for
+    the same database skip LOAD DATA. As with Database.insert_rows,
+    consecutive rows sharing the same set of columns are loaded together,
+    so columns missing from a row get their default.
+
+    Args:
+        db (Database): The target database (PyMySQL or mysqlclient driver).
+        table (str): The name of the target table.
+        rows (Iterable[Mapping[str, Any]]): The rows to load.
+        batch_size (int): Maximum number of rows per LOAD DATA statement.
+
+    Returns:
+        int: The number of rows loaded.
+    """
+    if not _supports_load_data(db):
+        raise ValueError(
+            "LOAD DATA loading requires a MySQL database using the PyMySQL "
+            f"or mysqlclient driver, got '{db.engine.dialect.name}'."
+        )
+    if batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer.")
+    loaded = 0
+    for batch in _batched(rows, batch_size):
+        if db not in _load_data_disabled:
+            try:
+                _load_data_batch(db, table, batch)
+                loaded += len(batch)
+                continue
+            except DBAPIError as e:
+                if not _local_infile_disabled(e):
+                    raise
+                _load_data_disabled.add(db)
+        loaded += db.insert_rows(table, batch, batch_size=batch_size)
+    return loaded
+
+
+def _run_bulk_insert(
+    db: Database, insert_sql: str, params: List[Tuple[Any, ...]]
+) -> None:
+    with db.transaction() as connection:
+        cursor: Any = connection.connection.cursor()
+        try:
+            cursor.fast_executemany = True
+            cursor.executemany(insert_sql, params)
+        finally:
+            cursor.close()
+
+
+def bulk_insert_rows(
+    db: Database,
+    table: str,
+    rows: Iterable[Mapping[str, Any]],
+    batch_size: int = 1000,
+) -> int:
+    """Load rows into a SQL Server table with pyodbc's
+    ``fast_executemany``, which binds each batch as parameter arrays and
+    sends it in a single round-trip instead of one per row. As with
+    Database.insert_rows, consecutive rows sharing the same set of columns
+    are sent together, so columns missing from a row get their default.
+
+    Args:
+        db (Database): The target database (pyodbc driver).
+        table (str): The name of the target table.
+        rows (Iterable[Mapping[str, Any]]): The rows to load.
+        batch_size (int): Maximum number of rows per round-trip.
+
+    Returns:
+        int: The number of rows loaded.
+    """
+    if not _supports_bulk_insert(db):
+        raise ValueError(
+            "Bulk loading requires a SQL Server database using the pyodbc "
+            f"driver, got '{db.engine.dialect.name}'."
+        )
+    if batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer.")
+    loaded = 0
+    for batch in _batched(rows, batch_size):
+        with db.transaction():
+            for columns, group in _group_by_columns(batch):
+                placeholders = ", ".join("?" for _ in columns)
+                _run_bulk_insert(
+                    db,
+                    f"INSERT INTO {table} ({', '.join(columns)}) "
+                    f"VALUES ({placeholders})",
+                    [tuple(row[col] for col in columns) for row in group],
+                )
+        loaded += len(batch)
+    return loaded
+
+
+def load_rows(
+    db: Database,
+    table: str,
+    rows: Iterable[Mapping[str, Any]],
+    batch_size: int = 1000,
+    load_method: str = "auto",
+) -> int:
+    """Bulk-load rows into a table with the given load method.
+
+    Args:
+        db (Database): The target database.
+        table (str): The name of the target table.
+        rows (Iterable[Mapping[str, Any]]): The rows to load.
+        batch_size (int): Maximum number of rows per batch.
+        load_method (str): "insert" uses Database.insert_rows, "copy" uses
+        PostgreSQL COPY, "load_data" uses MySQL LOAD DATA LOCAL INFILE
+        (see load_data_rows), "bulk" uses SQL Server fast_executemany (see
+        bulk_insert_rows), "arrow" inserts Arrow batches into DuckDB (see
+        arrow_load_rows), and "auto" picks the one the database supports
+        and batched inserts otherwise.
+
+    Returns:
+        int: The number of rows loaded.
+    """
+    if load_method not in LOAD_METHODS:
+        raise ValueError(
+            f"Invalid load_method '{load_method}'. "
+            f"Expected one of: {list(LOAD_METHODS)}"
+        )
+    if load_method == "copy" or (
+        load_method == "auto" and _supports_copy(db)
+    ):
+        return copy_rows(db, table, rows, batch_size=batch_size)
+    if load_method == "load_data" or (
+        load_method == "auto" and _supports_load_data(db)
+    ):
+        return load_data_rows(db, table, rows, batch_size=batch_size)
+    if load_method == "bulk" or (
+        load_method == "auto" and _supports_bulk_insert(db)
+    ):
+        return bulk_insert_rows(db, table, rows, batch_size=batch_size)
+    if load_method == "arrow" or (load_method == "auto" and _is_duckdb(db)):
+        return arrow_load_rows(db, table, rows, batch_size=batch_size)
+    return db.insert_rows(table, rows, batch_size=batch_size)
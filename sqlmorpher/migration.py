@@ -1,23 +1,177 @@
 from .db import Database
-from .joins import generate_join_query
+from .joins import generate_join_query, generate_keyset_queries
+from .extraction import (
+    iter_keyset_pages,
+    iter_copy_chunks,
+    partition_key_range,
+)
+from .pipeline import iter_pipelined
+from .scheduler import build_dependency_graph, run_scheduled
+from .cache import PlanCache, schema_fingerprint
+from .checkpoint import CheckpointStore
+from .fast_load import FAST_LOAD_COMMIT_EVERY, sqlite_fast_load
+from .arrow import _is_duckdb, iter_arrow_chunks, arrow_query_to_table
+from .upsert import _conflict_keys, upsert_rows
+from .loading import (
+    LOAD_METHODS,
+    load_rows,
+    copy_query_to_table,
+    _supports_copy,
+)
 from sqlalchemy.engine import RowMapping
 from pydantic import validate_call
-from typing import Dict, List, Callable, Any, Optional, Sequence, Mapping
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Callable,
+    Any,
+    Optional,
+    Sequence,
+    Mapping,
+    Iterable,
+    Iterator,
+    Tuple,
+    Union,
+    cast,
+)
 from tqdm.rich import tqdm
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from collections import deque
+from contextlib import closing, nullcontext
+from functools import reduce
+import importlib
+import threading
+import time
 import warnings
 
 TransformFn = Callable[[Database, Mapping[str, Any]], None]
+BatchTransformFn = Callable[
+    [Database, List[Dict[str, Any]]], Optional[Iterable[Mapping[str, Any]]]
+]
+RegisteredFn = Union[TransformFn, BatchTransformFn]
+RowChunk = Sequence[Union[RowMapping, Mapping[str, Any]]]
+KeyedChunk = Tuple[RowChunk, Any]
+TransformedChunk = Tuple[int, List[Dict[str, Any]], Any]
+
+TRANSFORM_MODES = ("row", "batch")
+EXTRACT_METHODS = ("stream", "keyset", "copy", "arrow")
+TRANSFORM_EXECUTORS = ("thread", "process")
+LOAD_MODES = ("insert", "upsert")
+
+DEFAULT_CHUNK_SIZE = 1000
 
 warnings.filterwarnings("ignore", category=FutureWarning)
 warnings.filterwarnings("ignore", category=UserWarning)
 
 
+_worker_db: Optional[Database] = None
+_worker_fn: Optional[BatchTransformFn] = None
+
+
+def _resolve_function_path(path: str) -> RegisteredFn:
+    module_name, sep, attr = path.partition(":")
+    if not sep:
+        module_name, _, attr = path.rpartition(".")
+    if not module_name or not attr:
+        raise ValueError(
+            f"Invalid function path '{path}'. Expected 'module:function'."
+        )
+    try:
+        module = importlib.import_module(module_name)
+        fn = reduce(getattr, attr.split("."), module)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(
+            f"Transform function '{path}' could not be imported: {e}"
+        ) from e
+    if not callable(fn):
+        raise ValueError(f"Transform function '{path}' is not callable.")
+    return cast(RegisteredFn, fn)
+
+
+def _function_path(fn: RegisteredFn) -> str:
+    module = getattr(fn, "__module__", None)
+    qualname = getattr(fn, "__qualname__", "")
+    if not module or not qualname or "<" in qualname:
+        raise ValueError(
+            f"Transform function {fn!r} must be a module-level function to "
+            "run in a process pool."
+        )
+    return f"{module}:{qualname}"
+
+
+def _init_transform_worker(
+    db_type: str,
+    connection_string: str,
+    engine_options: Dict[str, Any],
+    fn_path: str,
+) -> None:
+    global _worker_db, _worker_fn
+    _worker_db = Database(
+        type=db_type,
+        connection_string=connection_string,
+        engine_options=engine_options,
+    )
+    _worker_fn = cast(BatchTransformFn, _resolve_function_path(fn_path))
+
+
+def _run_batch_transform(
+    rows: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    assert _worker_db is not None and _worker_fn is not None
+    transformed = _worker_fn(_worker_db, rows)
+    return [] if transformed is None else [dict(row) for row in transformed]
+
+
+def _transform_process_pool(
+    new_db: Database, insert_fn: RegisteredFn, workers: int
+) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_transform_worker,
+        initargs=(
+            new_db.type,
+            new_db.engine.url.render_as_string(hide_password=False),
+            new_db.engine_options,
+            _function_path(insert_fn),
+        ),
+    )
+
+
+def _iter_process_transforms(
+    process_pool: ProcessPoolExecutor,
+    chunks: Iterable[KeyedChunk],
+    workers: int,
+) -> Iterator[TransformedChunk]:
+    pending: Deque[Tuple[int, "Future[List[Dict[str, Any]]]", Any]] = deque()
+
+    def pop() -> TransformedChunk:
+        source_rows, future, last_key = pending.popleft()
+        return source_rows, future.result(), last_key
+
+    for rows, last_key in chunks:
+        row_dicts = [row_to_dict(row) for row in rows]
+        future = process_pool.submit(_run_batch_transform, row_dicts)
+        pending.append((len(rows), future, last_key))
+        if len(pending) > workers:
+            yield pop()
+    while pending:
+        yield pop()
+
+
 def _lookup_insert_fn(
-    transform_registry: Dict[str, TransformFn], insert_fn_name: str
-) -> Optional[TransformFn]:
+    transform_registry: Mapping[str, RegisteredFn], insert_fn_name: str
+) -> Optional[RegisteredFn]:
     if not insert_fn_name:
         return None
     insert_fn = transform_registry.get(insert_fn_name)
+    if insert_fn is None and (":" in insert_fn_name or "." in insert_fn_name):
+        return _resolve_function_path(insert_fn_name)
     if insert_fn is None:
         raise ValueError(
             f"Transform function '{insert_fn_name}' not found in registry. "
@@ -26,6 +180,142 @@ def _lookup_insert_fn(
     return insert_fn
 
 
+def _check_choice(key: str, value: str, choices: Sequence[str]) -> str:
+    if value not in choices:
+        raise ValueError(
+            f"Invalid {key} '{value}'. Expected one of: {list(choices)}"
+        )
+    return value
+
+
+def _uses_keyset(map_entry: Dict[str, Any]) -> bool:
+    return (
+        map_entry.get("extract_method") == "keyset"
+        or map_entry.get("parallelism", 1) > 1
+    )
+
+
+def _build_plan(
+    old_db: Database, map_entry: Dict[str, Any], chunk_size: int
+) -> Dict[str, Any]:
+    root_table = map_entry["root_table"]
+    joins = map_entry.get("joins", [])
+    columns = map_entry.get("columns", {})
+    validation = map_entry.get("join_validation", "probe")
+    plan: Dict[str, Any] = {"columns": list(columns.values())}
+    if _uses_keyset(map_entry):
+        plan["keyset"] = generate_keyset_queries(
+            old_db, root_table, joins, columns, chunk_size, validation
+        )
+    else:
+        plan["query"] = generate_join_query(
+            old_db, root_table, joins, columns, validation
+        )
+    return plan
+
+
+def _entry_plan(
+    old_db: Database,
+    map_entry: Dict[str, Any],
+    chunk_size: int,
+    plan_cache: Optional[PlanCache],
+    source_fingerprint: Optional[str],
+) -> Dict[str, Any]:
+    if plan_cache is None:
+        return _build_plan(old_db, map_entry, chunk_size)
+    key = plan_cache.key(
+        map_entry, chunk_size, str(old_db.engine.url), source_fingerprint
+    )
+    plan = plan_cache.get(key)
+    if plan is None:
+        plan = _build_plan(old_db, map_entry, chunk_size)
+        plan_cache.put(key, plan)
+    return plan
+
+
+def _extract_chunks(
+    old_db: Database,
+    map_entry: Dict[str, Any],
+    plan: Dict[str, Any],
+    chunk_size: int,
+    after_key: Optional[Any] = None,
+) -> Iterator[KeyedChunk]:
+    if "keyset" in plan:
+        return iter_keyset_pages(
+            old_db, plan["keyset"], chunk_size, after_key=after_key
+        )
+    if map_entry.get("extract_method") == "copy":
+        chunks: Iterator[RowChunk] = iter_copy_chunks(
+            old_db, plan["query"], plan["columns"], chunk_size
+        )
+    elif map_entry.get("extract_method") == "arrow":
+        chunks = iter_arrow_chunks(old_db, plan["query"], chunk_size)
+    else:
+        chunks = old_db.stream_query(plan["query"], chunk_size=chunk_size)
+    return ((rows, None) for rows in chunks)
+
+
+def _has_commit_settings(map_entry: Dict[str, Any]) -> bool:
+    return (
+        map_entry.get("commit_every") is not None
+        or map_entry.get("commit_interval_s") is not None
+    )
+
+
+def _can_pipe_copy(
+    old_db: Database,
+    new_db: Database,
+    map_entry: Dict[str, Any],
+    insert_fn: Optional[RegisteredFn],
+    load_method: str,
+) -> bool:
+    return (
+        map_entry.get("extract_method") == "copy"
+        and map_entry.get("load_mode", "insert") == "insert"
+        and insert_fn is None
+        and load_method in ("auto", "copy")
+        and not _has_commit_settings(map_entry)
+        and old_db.engine.dialect.name == "postgresql"
+        and _supports_copy(new_db)
+    )
+
+
+def _can_pipe_arrow(
+    old_db: Database,
+    new_db: Database,
+    map_entry: Dict[str, Any],
+    insert_fn: Optional[RegisteredFn],
+    load_method: str,
+) -> bool:
+    return (
+        map_entry.get("extract_method") == "arrow"
+        and map_entry.get("load_mode", "insert") == "insert"
+        and insert_fn is None
+        and load_method in ("auto", "arrow")
+        and not _has_commit_settings(map_entry)
+        and _is_duckdb(old_db)
+        and _is_duckdb(new_db)
+    )
+
+
+def _extract_partitions(
+    old_db: Database,
+    plan: Dict[str, Any],
+    chunk_size: int,
+    parallelism: int,
+) -> List[Iterator[KeyedChunk]]:
+    queries = plan["keyset"]
+    return [
+        (
+            (rows, None)
+            for rows, _ in iter_keyset_pages(
+                old_db, queries, chunk_size, lower, upper
+            )
+        )
+        for lower, upper in partition_key_range(old_db, queries, parallelism)
+    ]
+
+
 def row_to_dict(row: Any) -> dict[str, Any]:
     if hasattr(row, "_mapping"):
         return dict(row._mapping)
@@ -35,20 +325,369 @@ def row_to_dict(row: Any) -> dict[str, Any]:
         return {k: getattr(row, k) for k in dir(row) if not k.startswith("_")}
 
 
+def _transform_rows(
+    new_db: Database,
+    rows: RowChunk,
+    insert_fn: Optional[RegisteredFn] = None,
+    transform_mode: str = "row",
+) -> List[Dict[str, Any]]:
+    row_dicts = [row_to_dict(row) for row in rows]
+    if not (insert_fn and callable(insert_fn)) or transform_mode != "batch":
+        return row_dicts
+    batch_fn = cast(BatchTransformFn, insert_fn)
+    transformed = batch_fn(new_db, row_dicts)
+    return [] if transformed is None else [dict(row) for row in transformed]
+
+
+def _write_rows(
+    new_db: Database,
+    target_table: str,
+    rows: List[Dict[str, Any]],
+    insert_fn: Optional[RegisteredFn] = None,
+    batch_size: int = DEFAULT_CHUNK_SIZE,
+    transform_mode: str = "row",
+    load_method: str = "auto",
+    conflict_keys: Optional[List[str]] = None,
+) -> None:
+    if insert_fn and callable(insert_fn) and transform_mode != "batch":
+        row_fn = cast(TransformFn, insert_fn)
+        for row in rows:
+            row_fn(new_db, row)
+        return
+    if rows and conflict_keys is not None:
+        upsert_rows(
+            new_db,
+            target_table,
+            rows,
+            conflict_keys=conflict_keys,
+            batch_size=batch_size,
+        )
+    elif rows:
+        load_rows(
+            new_db,
+            target_table,
+            rows,
+            batch_size=batch_size,
+            load_method=load_method,
+        )
+
+
 def _process_rows(
     new_db: Database,
     target_table: str,
-    rows: Sequence[RowMapping],
-    insert_fn: Optional[TransformFn] = None,
+    rows: RowChunk,
+    insert_fn: Optional[RegisteredFn] = None,
+    batch_size: int = DEFAULT_CHUNK_SIZE,
+    transform_mode: str = "row",
+    load_method: str = "auto",
+    conflict_keys: Optional[List[str]] = None,
+) -> None:
+    _write_rows(
+        new_db,
+        target_table,
+        _transform_rows(new_db, rows, insert_fn, transform_mode),
+        insert_fn,
+        batch_size=batch_size,
+        transform_mode=transform_mode,
+        load_method=load_method,
+        conflict_keys=conflict_keys,
+    )
+
+
+def _commit_settings(
+    map_entry: Dict[str, Any], fast_load: bool = False
+) -> Tuple[Optional[int], Optional[float]]:
+    commit_every = map_entry.get("commit_every")
+    commit_interval_s = map_entry.get("commit_interval_s")
+    if commit_every is not None and commit_every <= 0:
+        raise ValueError("commit_every must be a positive integer.")
+    if commit_interval_s is not None and commit_interval_s <= 0:
+        raise ValueError("commit_interval_s must be a positive number.")
+    if map_entry.get("single_transaction", False):
+        if map_entry.get("parallelism", 1) > 1:
+            raise ValueError(
+                "single_transaction cannot be combined with parallelism."
+            )
+        return None, None
+    if commit_every is None and commit_interval_s is None:
+        return (FAST_LOAD_COMMIT_EVERY if fast_load else 1), None
+    return commit_every, commit_interval_s
+
+
+def _load_in_transactions(
+    new_db: Database,
+    chunks: Iterable[TransformedChunk],
+    write_chunk: Callable[[TransformedChunk], None],
+    commit_every: Optional[int],
+    commit_interval_s: Optional[float],
+) -> None:
+    remaining = iter(chunks)
+    while True:
+        with new_db.transaction():
+            pending = 0
+            started = time.monotonic()
+            for chunk in remaining:
+                write_chunk(chunk)
+                pending += chunk[0]
+                if commit_every is not None and pending >= commit_every:
+                    break
+                if (
+                    commit_interval_s is not None
+                    and time.monotonic() - started >= commit_interval_s
+                ):
+                    break
+            else:
+                return
+
+
+def _upsert_keys(
+    new_db: Database,
+    target_table: str,
+    map_entry: Dict[str, Any],
+    insert_fn: Optional[RegisteredFn],
+    transform_mode: str,
+    load_method: str,
+) -> Optional[List[str]]:
+    load_mode = _check_choice(
+        "load_mode", map_entry.get("load_mode", "insert"), LOAD_MODES
+    )
+    if load_mode != "upsert":
+        if map_entry.get("conflict_keys"):
+            raise ValueError("conflict_keys requires load_mode 'upsert'.")
+        return None
+    if insert_fn is not None and transform_mode != "batch":
+        raise ValueError(
+            "load_mode 'upsert' cannot be combined with a row insert "
+            "function, which writes its own rows."
+        )
+    if load_method not in ("auto", "insert"):
+        raise ValueError(
+            f"load_mode 'upsert' cannot be combined with load_method "
+            f"'{load_method}'."
+        )
+    conflict_keys = map_entry.get("conflict_keys")
+    if isinstance(conflict_keys, str):
+        conflict_keys = [conflict_keys]
+    table = new_db.get_table(target_table)
+    return _conflict_keys(table, conflict_keys)
+
+
+def _checkpoint_key(map_entry: Dict[str, Any]) -> str:
+    root_table = map_entry["root_table"]
+    target_table = map_entry.get("target_table", root_table)
+    return str(map_entry.get("name") or f"{root_table}:{target_table}")
+
+
+def _source_tables(map_entry: Dict[str, Any]) -> List[str]:
+    joined = [join.get("table", "") for join in map_entry.get("joins", [])]
+    return [map_entry["root_table"], *joined]
+
+
+def _reflect_referenced_tables(
+    old_db: Database,
+    new_db: Database,
+    mapping: List[Dict[str, Any]],
+    reflect_source: bool = True,
 ) -> None:
-    for row in rows:
-        row_dict: Dict[str, Any] = row_to_dict(row)
+    if reflect_source:
+        old_db.reflect_tables(
+            table for entry in mapping for table in _source_tables(entry)
+        )
+    new_db.reflect_tables(
+        entry.get("target_table", entry["root_table"]) for entry in mapping
+    )
+
+
+def _migrate_entry(
+    old_db: Database,
+    new_db: Database,
+    map_entry: Dict[str, Any],
+    transform_registry: Mapping[str, RegisteredFn],
+    plan_cache: Optional[PlanCache] = None,
+    source_fingerprint: Optional[str] = None,
+    checkpoints: Optional[CheckpointStore] = None,
+    resume: bool = False,
+    fast_load: bool = False,
+) -> None:
+    root_table = map_entry["root_table"]
+    target_table = map_entry.get("target_table", root_table)
+    insert_fn_name = map_entry.get("insert_function", "")
+    chunk_size = map_entry.get("chunk_size", DEFAULT_CHUNK_SIZE)
+    parallelism = map_entry.get("parallelism", 1)
+    transform_mode = _check_choice(
+        "transform_mode",
+        map_entry.get("transform_mode", "row"),
+        TRANSFORM_MODES,
+    )
+    load_method = _check_choice(
+        "load_method", map_entry.get("load_method", "auto"), LOAD_METHODS
+    )
+    _check_choice(
+        "extract_method",
+        map_entry.get("extract_method", "stream"),
+        EXTRACT_METHODS,
+    )
+    if parallelism < 1:
+        raise ValueError("parallelism must be a positive integer.")
+    extract_method = map_entry.get("extract_method", "keyset")
+    if parallelism > 1 and extract_method != "keyset":
+        raise ValueError(
+            "parallelism reads keyset pages and cannot be combined with "
+            f"extract_method '{extract_method}'."
+        )
+    commit_every, commit_interval_s = _commit_settings(map_entry, fast_load)
+    pipeline = map_entry.get("pipeline", False)
+    transform_workers = map_entry.get("transform_workers", 1)
+    queue_size = map_entry.get("queue_size", 4)
+    transform_executor = _check_choice(
+        "transform_executor",
+        map_entry.get("transform_executor", "thread"),
+        TRANSFORM_EXECUTORS,
+    )
+
+    insert_fn = _lookup_insert_fn(transform_registry, insert_fn_name)
+    if transform_executor == "process" and (
+        insert_fn is None or transform_mode != "batch"
+    ):
+        raise ValueError(
+            "transform_executor 'process' requires a batch insert function."
+        )
+    conflict_keys = _upsert_keys(
+        new_db, target_table, map_entry, insert_fn, transform_mode, load_method
+    )
+    entry_key = _checkpoint_key(map_entry)
+    checkpoint = (
+        checkpoints.get(entry_key)
+        if checkpoints is not None and resume
+        else None
+    )
+    if checkpoint is not None and checkpoint["completed"]:
+        return
+    if (
+        checkpoint is not None
+        and conflict_keys is None
+        and not (_uses_keyset(map_entry) and parallelism == 1)
+    ):
+        raise ValueError(
+            f"Entry '{entry_key}' was interrupted after committing rows and "
+            "cannot resume: only keyset entries without parallelism record "
+            "their last row. Use load_mode 'upsert' to reload it over the "
+            "committed rows, or empty the target table and clear its "
+            "checkpoint."
+        )
+    after_key = checkpoint["last_key"] if checkpoint is not None else None
+
+    plan = _entry_plan(
+        old_db, map_entry, chunk_size, plan_cache, source_fingerprint
+    )
+    progress = tqdm(desc=target_table, unit="row", leave=False)
+    progress_lock = threading.Lock()
+    process_pool = (
+        _transform_process_pool(new_db, insert_fn, transform_workers)
+        if transform_executor == "process" and insert_fn is not None
+        else None
+    )
 
-        if insert_fn and callable(insert_fn):
-            insert_fn(new_db, row_dict)
-            continue
+    def transform_chunk(chunk: KeyedChunk) -> TransformedChunk:
+        rows, last_key = chunk
+        if process_pool is not None:
+            row_dicts = [row_to_dict(row) for row in rows]
+            future = process_pool.submit(_run_batch_transform, row_dicts)
+            return len(rows), future.result(), last_key
+        return (
+            len(rows),
+            _transform_rows(new_db, rows, insert_fn, transform_mode),
+            last_key,
+        )
+
+    def write_chunk(chunk: TransformedChunk) -> None:
+        source_rows, rows, last_key = chunk
+        _write_rows(
+            new_db,
+            target_table,
+            rows,
+            insert_fn,
+            batch_size=chunk_size,
+            transform_mode=transform_mode,
+            load_method=load_method,
+            conflict_keys=conflict_keys,
+        )
+        if checkpoints is not None:
+            checkpoints.save(entry_key, last_key)
+        with progress_lock:
+            progress.update(source_rows)
 
-        new_db.insert_row(target_table, row_dict)
+    def load(chunks: Iterable[KeyedChunk]) -> None:
+        if not pipeline:
+            _load_in_transactions(
+                new_db,
+                (
+                    map(transform_chunk, chunks)
+                    if process_pool is None
+                    else _iter_process_transforms(
+                        process_pool, chunks, transform_workers
+                    )
+                ),
+                write_chunk,
+                commit_every,
+                commit_interval_s,
+            )
+            return
+        # Closing the pipeline stops its threads even when a write fails.
+        with closing(
+            iter_pipelined(
+                chunks, transform_chunk, transform_workers, queue_size
+            )
+        ) as transformed:
+            _load_in_transactions(
+                new_db,
+                transformed,
+                write_chunk,
+                commit_every,
+                commit_interval_s,
+            )
+
+    try:
+        if parallelism == 1 and _can_pipe_copy(
+            old_db, new_db, map_entry, insert_fn, load_method
+        ):
+            progress.update(
+                copy_query_to_table(
+                    old_db,
+                    plan["query"],
+                    new_db,
+                    target_table,
+                    plan["columns"],
+                )
+            )
+        elif parallelism == 1 and _can_pipe_arrow(
+            old_db, new_db, map_entry, insert_fn, load_method
+        ):
+            progress.update(
+                arrow_query_to_table(
+                    old_db, plan["query"], new_db, target_table, chunk_size
+                )
+            )
+        elif parallelism == 1:
+            load(
+                _extract_chunks(
+                    old_db, map_entry, plan, chunk_size, after_key
+                )
+            )
+        else:
+            partitions = _extract_partitions(
+                old_db, plan, chunk_size, parallelism
+            )
+            with ThreadPoolExecutor(max_workers=parallelism) as executor:
+                futures = [executor.submit(load, part) for part in partitions]
+                for future in as_completed(futures):
+                    future.result()
+        if checkpoints is not None:
+            checkpoints.save(entry_key, completed=True)
+    finally:
+        if process_pool is not None:
+            process_pool.shutdown(cancel_futures=True)
+        progress.close()
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -56,7 +695,12 @@ def migrate(
     old_db: Database,
     new_db: Database,
     mapping: List[Dict[str, Any]],
-    transform_registry: Optional[Dict[str, TransformFn]] = None,
+    transform_registry: Optional[Mapping[str, RegisteredFn]] = None,
+    workers: int = 1,
+    plan_cache: Optional[PlanCache] = None,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    resume: bool = False,
+    fast_load: bool = False,
 ) -> str:
     """Migrate data from old_db to new_db based on the provided mapping.
 
@@ -64,26 +708,129 @@ def migrate(
         old_db (Database): The source database to migrate data from.
         new_db (Database): The target database to migrate data to.
         mapping (List[Dict]): The mapping configuration for migration.
+        Besides the join and column settings, each entry accepts optional
+        tuning keys:
+        - chunk_size: rows read, transformed and written per chunk
+          (default 1000)
+        - transform_mode: "row" (default) calls the insert function per
+          row, "batch" calls it per chunk and bulk-inserts the rows it
+          returns (see BatchTransformFn)
+        - extract_method: "stream" (default) uses a server-side cursor,
+          "keyset" reads primary-key pages of the root table, "copy"
+          exports the join with PostgreSQL COPY TO STDOUT (values are read
+          as text); without an insert function and with a COPY-capable
+          target, the export is piped straight into COPY FROM STDIN;
+          "arrow" reads a DuckDB source as Arrow record batches, piped
+          straight into a DuckDB target without an insert function. A
+          piped entry is loaded in a single target transaction; entries
+          with commit_every or commit_interval_s are loaded in chunks
+          instead
+        - parallelism: number of root-key ranges read and loaded
+          concurrently (default 1); reads keyset pages, so extract_method
+          must be unset or "keyset"
+        - load_method: "auto" (default), "insert", "copy", "load_data",
+          "bulk" or "arrow"; "auto" uses COPY FROM STDIN for PostgreSQL
+          targets, LOAD DATA LOCAL INFILE for MySQL targets,
+          fast_executemany for SQL Server (pyodbc) targets, Arrow batches
+          for DuckDB targets and batched inserts otherwise
+        - load_mode: "insert" (default) or "upsert"; "upsert" updates the
+          target rows that already exist, with ON CONFLICT, ON DUPLICATE
+          KEY UPDATE or MERGE depending on the target (see upsert_rows)
+        - conflict_keys: target columns identifying an existing row in
+          "upsert" mode (default: the primary key of the target table)
+        - join_validation: "probe" (default), "explain", "metadata" or
+          "none", see validate_joins
+        - depends_on: names or target tables of entries that must complete
+          first, in addition to those implied by target foreign keys
+        - commit_every: commit once at least this many source rows were
+          processed since the last commit (checked at chunk boundaries)
+        - commit_interval_s: commit once this many seconds passed since the
+          last commit (checked at chunk boundaries)
+        - single_transaction: load the whole entry in one transaction
+          (default False); not allowed together with parallelism
+        - pipeline: read, transform and write chunks concurrently
+          (default False); the next chunks are read and transformed while
+          the current one is written
+        - transform_workers: number of threads running the batch transform
+          in pipeline mode (default 1)
+        - queue_size: maximum number of chunks read ahead of the writer in
+          pipeline mode (default 4)
+        - transform_executor: "thread" (default) or "process"; "process"
+          runs the batch transform in a pool of transform_workers
+          processes, each with its own connection to new_db
+        The insert_function is looked up in transform_registry, or imported
+        when given as a "module:function" path.
+        Chunks are loaded in new_db.transaction(): the reads and writes of
+        transform functions through new_db share its connection and commit
+        together. Batch transforms run on pipeline threads or transform
+        processes are the exception: their new_db calls use their own
+        connections and commit independently. Without commit settings,
+        every chunk is committed.
         transform_registry (Dict[str, Callable], optional): A registry of
         transformation functions. Defaults to None.
+        workers (int): Maximum number of entries migrated concurrently.
+        Entries are started once the entries they depend on are done.
+        Defaults to 1.
+        plan_cache (PlanCache, optional): Cache of the generated source
+        queries. On a hit, join validation and query generation are
+        skipped. Entries are keyed by their configuration and the source
+        schema fingerprint. Defaults to None.
+        checkpoint_store (CheckpointStore, optional): Where the progress of
+        every entry is recorded: its completion and, for keyset entries
+        without parallelism, the last committed root key. Entries are
+        identified by their "name" key, or their root and target tables.
+        Keep the store in new_db so that checkpoints commit together with
+        the rows. Defaults to None.
+        resume (bool): Continue a previous run recorded in
+        checkpoint_store: completed entries are skipped and keyset entries
+        restart after their last committed root key. Other entries that
+        committed rows raise ValueError, unless their load_mode is
+        "upsert", in which case they are started over. When False, the
+        checkpoints of the mapping entries are reset. Defaults to False.
+        fast_load (bool): Bulk-load profile: entries without commit
+        settings commit every 100000 rows instead of every chunk, and a
+        file-based SQLite new_db is tuned with sqlite_fast_load for the
+        duration of the migration. Defaults to False.
 
     Returns:
         str: A message indicating the result of the migration.
     """
     if transform_registry is None:
         transform_registry = {}
+    if resume and checkpoint_store is None:
+        raise ValueError("resume requires a checkpoint_store.")
+    if checkpoint_store is not None and not resume:
+        for map_entry in mapping:
+            checkpoint_store.clear(_checkpoint_key(map_entry))
 
-    for map_entry in tqdm(mapping, desc="Migrating tables", unit="table"):
-        root_table = map_entry["root_table"]
-        joins = map_entry.get("joins", [])
-        columns = map_entry.get("columns", {})
-        target_table = map_entry.get("target_table", root_table)
-        insert_fn_name = map_entry.get("insert_function", "")
+    registry = transform_registry
+    source_fingerprint = (
+        schema_fingerprint(old_db.engine) if plan_cache is not None else None
+    )
+    _reflect_referenced_tables(
+        old_db, new_db, mapping, reflect_source=plan_cache is None
+    )
+    graph = build_dependency_graph(new_db, mapping)
+    progress = tqdm(total=len(mapping), desc="Migrating tables", unit="table")
 
-        insert_fn = _lookup_insert_fn(transform_registry, insert_fn_name)
-        join_query = generate_join_query(old_db, root_table, joins, columns)
-        rows = old_db.execute_query(join_query) or []
+    def run_entry(idx: int) -> None:
+        _migrate_entry(
+            old_db,
+            new_db,
+            mapping[idx],
+            registry,
+            plan_cache=plan_cache,
+            source_fingerprint=source_fingerprint,
+            checkpoints=checkpoint_store,
+            resume=resume,
+            fast_load=fast_load,
+        )
+        progress.update(1)
 
-        _process_rows(new_db, target_table, rows, insert_fn)
+    try:
+        with sqlite_fast_load(new_db) if fast_load else nullcontext():
+            run_scheduled(graph, run_entry, workers=workers)
+    finally:
+        progress.close()
 
     return "Migration completed successfully"
@@ -0,0 +1,72 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Generator, Iterable
+from pydantic import validate_call
+from .extraction import _QueueWriter
+
+_PIPELINE_END = object()
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def iter_pipelined(
+    chunks: Iterable[Any],
+    transform: Callable[[Any], Any],
+    workers: int = 1,
+    queue_size: int = 4,
+) -> Generator[Any, None, None]:
+    """Read, transform and consume chunks concurrently.
+
+    A reader thread pulls chunks from ``chunks`` and submits them to a pool
+    of ``workers`` transform threads, while the caller consumes the results
+    in input order. At most ``queue_size`` chunks wait between the stages,
+    so a slow consumer throttles reading instead of buffering the source.
+
+    Args:
+        chunks (Iterable[Any]): The chunks to process, e.g. from
+        Database.stream_query.
+        transform (Callable[[Any], Any]): Function applied to every chunk.
+        workers (int): Number of transform threads. Defaults to 1.
+        queue_size (int): Maximum number of chunks read ahead of the
+        consumer. Defaults to 4.
+
+    Yields:
+        Any: The transformed chunks, in the order they were read.
+    """
+    if workers <= 0:
+        raise ValueError("workers must be a positive integer.")
+    if queue_size <= 0:
+        raise ValueError("queue_size must be a positive integer.")
+    pending: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    sink = _QueueWriter(pending, stop)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    source = iter(chunks)
+
+    def read() -> None:
+        try:
+            for chunk in source:
+                if not sink.put(executor.submit(transform, chunk)):
+                    return
+        except BaseException as e:
+            sink.put(e)
+        finally:
+            close = getattr(source, "close", None)
+            if close is not None:
+                close()
+            sink.put(_PIPELINE_END)
+
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    try:
+        while True:
+            item = pending.get()
+            if item is _PIPELINE_END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item.result()
+    finally:
+        stop.set()
+        reader.join()
+        executor.shutdown(cancel_futures=True)
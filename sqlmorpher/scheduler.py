@@ -0,0 +1,213 @@
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple
+import asyncio
+from pydantic import validate_call
+from .db import Database
+
+
+def _entry_target(map_entry: Dict[str, Any]) -> str:
+    return str(map_entry.get("target_table", map_entry["root_table"]))
+
+
+def _index_entries(mapping: List[Dict[str, Any]]) -> Dict[str, Set[int]]:
+    index: Dict[str, Set[int]] = {}
+    for idx, map_entry in enumerate(mapping):
+        index.setdefault(_entry_target(map_entry), set()).add(idx)
+        name = map_entry.get("name")
+        if name:
+            index.setdefault(str(name), set()).add(idx)
+    return index
+
+
+def _referenced_tables(new_db: Database, table_name: str) -> Set[str]:
+    table = new_db.metadata.tables.get(table_name)
+    if table is None:
+        return set()
+    return {
+        fk.target_fullname.split(".")[-2]
+        for fk in table.foreign_keys
+        if fk.target_fullname.split(".")[-2] != table_name
+    }
+
+
+def _reaches(graph: Dict[int, Set[int]], start: int, target: int) -> bool:
+    seen: Set[int] = set()
+    stack = [start]
+    while stack:
+        idx = stack.pop()
+        if idx == target:
+            return True
+        if idx not in seen:
+            seen.add(idx)
+            stack.extend(graph[idx])
+    return False
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def build_dependency_graph(
+    new_db: Database, mapping: List[Dict[str, Any]]
+) -> Dict[int, Set[int]]:
+    """Compute which migration entries must complete before each entry.
+
+    An entry depends on the entries listed in its optional ``depends_on``
+    key (by entry ``name`` or target table), and on every entry loading a
+    table referenced by a foreign key of its target table. Foreign keys
+    that would close a cycle, e.g. between tables referencing each other,
+    are ignored, preferring the order of the mapping; only cycles made of
+    ``depends_on`` entries are errors.
+
+    Args:
+        new_db (Database): The target database, whose reflected foreign
+        keys are used.
+        mapping (List[Dict]): The migration entries.
+
+    Returns:
+        Dict[int, Set[int]]: For each entry index, the indices of the
+        entries it depends on.
+    """
+    index = _index_entries(mapping)
+    graph: Dict[int, Set[int]] = {}
+    foreign_keys: List[Tuple[int, int]] = []
+    for idx, map_entry in enumerate(mapping):
+        deps: Set[int] = set()
+        for table_name in _referenced_tables(new_db, _entry_target(map_entry)):
+            foreign_keys.extend(
+                (idx, dep) for dep in index.get(table_name, set())
+            )
+
+        depends_on = map_entry.get("depends_on", [])
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        for dep in depends_on:
+            if dep not in index:
+                raise ValueError(
+                    f"Migration entry at index {idx} depends on unknown "
+                    f"entry '{dep}'."
+                )
+            deps.update(index[dep])
+
+        deps.discard(idx)
+        graph[idx] = deps
+
+    # Edges to earlier entries first, so that cycles keep the mapping order.
+    for idx, dep in sorted(foreign_keys, key=lambda edge: edge[1] > edge[0]):
+        if idx != dep and not _reaches(graph, dep, idx):
+            graph[idx].add(dep)
+    return graph
+
+
+def _raise_cycle(remaining: Dict[int, Set[int]]) -> None:
+    raise ValueError(
+        "Circular dependency between migration entries: "
+        f"{sorted(remaining)}"
+    )
+
+
+def _topological_order(remaining: Dict[int, Set[int]]) -> List[int]:
+    order: List[int] = []
+    while remaining:
+        ready = [idx for idx in sorted(remaining) if not remaining[idx]]
+        if not ready:
+            _raise_cycle(remaining)
+        idx = ready[0]
+        del remaining[idx]
+        for deps in remaining.values():
+            deps.discard(idx)
+        order.append(idx)
+    return order
+
+
+def run_scheduled(
+    graph: Dict[int, Set[int]],
+    run_entry: Callable[[int], None],
+    workers: int = 1,
+) -> None:
+    """Run entries concurrently, starting each one as soon as all the
+    entries it depends on have completed.
+
+    Ready entries are started in index order. With a single worker the
+    entries run one after another in the calling thread. If an entry
+    fails, no new entry is started and the error is raised once running
+    entries finish.
+
+    Args:
+        graph (Dict[int, Set[int]]): The output of build_dependency_graph.
+        run_entry (Callable[[int], None]): Runs the entry at an index.
+        workers (int): Maximum number of entries running at once.
+    """
+    if workers < 1:
+        raise ValueError("workers must be a positive integer.")
+    remaining = {idx: set(deps) for idx, deps in graph.items()}
+    if workers == 1:
+        for idx in _topological_order(remaining):
+            run_entry(idx)
+        return
+
+    running: Dict[Future[None], int] = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while remaining or running:
+            ready = sorted(idx for idx, deps in remaining.items() if not deps)
+            for idx in ready[: workers - len(running)]:
+                del remaining[idx]
+                running[executor.submit(run_entry, idx)] = idx
+
+            if not running:
+                _raise_cycle(remaining)
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                finished = running.pop(future)
+                if future.exception() is not None:
+                    wait(running)
+                    future.result()
+                for deps in remaining.values():
+                    deps.discard(finished)
+
+
+async def arun_scheduled(
+    graph: Dict[int, Set[int]],
+    run_entry: Callable[[int], Awaitable[None]],
+    concurrency: int = 10,
+) -> None:
+    """Async counterpart of run_scheduled: run entries as asyncio tasks on
+    the current event loop, starting each one as soon as all the entries
+    it depends on have completed.
+
+    Args:
+        graph (Dict[int, Set[int]]): The output of build_dependency_graph.
+        run_entry (Callable[[int], Awaitable[None]]): Runs the entry at an
+        index.
+        concurrency (int): Maximum number of entries running at once.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be a positive integer.")
+    remaining = {idx: set(deps) for idx, deps in graph.items()}
+    running: Dict["asyncio.Future[None]", int] = {}
+
+    while remaining or running:
+        ready = sorted(idx for idx, deps in remaining.items() if not deps)
+        for idx in ready[: concurrency - len(running)]:
+            del remaining[idx]
+            task = asyncio.ensure_future(run_entry(idx))
+            running[task] = idx
+
+        if not running:
+            _raise_cycle(remaining)
+
+        done, _ = await asyncio.wait(
+            running, return_when=asyncio.FIRST_COMPLETED
+        )
+        for future in done:
+            finished = running.pop(future)
+            if future.exception() is not None:
+                if running:
+                    await asyncio.wait(running)
+                future.result()
+            for deps in remaining.values():
+                deps.discard(finished)
@@ -0,0 +1,160 @@
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Union
+from sqlalchemy import Table, text
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.sql.expression import Executable
+from .db import Database, _batched, _group_by_columns
+
+UPSERT_DIALECTS = (
+    "postgresql",
+    "sqlite",
+    "mysql",
+    "mariadb",
+    "mssql",
+    "oracle",
+)
+
+
+def _conflict_keys(
+    table: Table, conflict_keys: Optional[Sequence[str]]
+) -> List[str]:
+    keys = (
+        list(conflict_keys)
+        if conflict_keys
+        else [column.name for column in table.primary_key.columns]
+    )
+    if not keys:
+        raise ValueError(
+            f"Table '{table.name}' has no primary key; conflict_keys are "
+            "required to upsert into it."
+        )
+    unknown = [key for key in keys if key not in table.columns]
+    if unknown:
+        raise ValueError(
+            f"Unknown conflict keys for table '{table.name}': {unknown}"
+        )
+    return keys
+
+
+def _build_merge_sql(
+    db: Database,
+    table: Table,
+    columns: Sequence[str],
+    conflict_keys: Sequence[str],
+) -> str:
+    dialect = db.engine.dialect
+    preparer = dialect.identifier_preparer
+    oracle = dialect.name == "oracle"
+    alias = " " if oracle else " AS "
+    quoted = {column: preparer.quote(column) for column in columns}
+    source = ", ".join(f":{c} AS {quoted[c]}" for c in columns)
+    on = " AND ".join(
+        f"tgt.{quoted[key]} = src.{quoted[key]}" for key in conflict_keys
+    )
+    updates = ", ".join(
+        f"tgt.{quoted[c]} = src.{quoted[c]}"
+        for c in columns
+        if c not in conflict_keys
+    )
+    name = ".".join(
+        preparer.quote(part) for part in (table.schema, table.name) if part
+    )
+    sql = (
+        f"MERGE INTO {name}{alias}tgt "
+        f"USING (SELECT {source}{' FROM dual' if oracle else ''})"
+        f"{alias}src ON ({on})"
+    )
+    if updates:
+        sql += f" WHEN MATCHED THEN UPDATE SET {updates}"
+    sql += (
+        f" WHEN NOT MATCHED THEN INSERT "
+        f"({', '.join(quoted[c] for c in columns)}) "
+        f"VALUES ({', '.join(f'src.{quoted[c]}' for c in columns)})"
+    )
+    return sql if oracle else sql + ";"
+
+
+def _upsert_statement(
+    db: Database,
+    table: Table,
+    columns: Sequence[str],
+    conflict_keys: Sequence[str],
+) -> Executable:
+    dialect = db.engine.dialect.name
+    missing = [key for key in conflict_keys if key not in columns]
+    if missing:
+        raise ValueError(
+            f"Rows upserted into '{table.name}' must contain the conflict "
+            f"keys {missing}."
+        )
+    updated = [c for c in columns if c not in conflict_keys]
+    if dialect in ("postgresql", "sqlite"):
+        statement: Union[postgresql.Insert, sqlite.Insert] = (
+            postgresql.insert(table)
+            if dialect == "postgresql"
+            else sqlite.insert(table)
+        )
+        if not updated:
+            return statement.on_conflict_do_nothing(
+                index_elements=list(conflict_keys)
+            )
+        return statement.on_conflict_do_update(
+            index_elements=list(conflict_keys),
+            set_={c: statement.excluded[c] for c in updated},
+        )
+    if dialect in ("mysql", "mariadb"):
+        insert = mysql.insert(table)
+        return insert.on_duplicate_key_update(
+            {c: insert.inserted[c] for c in updated or conflict_keys[:1]}
+        )
+    if dialect in ("mssql", "oracle"):
+        return text(_build_merge_sql(db, table, columns, conflict_keys))
+    raise ValueError(f"Upserts are not supported for '{dialect}'.")
+
+
+def upsert_rows(
+    db: Database,
+    table: str,
+    rows: Iterable[Mapping[str, Any]],
+    conflict_keys: Optional[Sequence[str]] = None,
+    batch_size: int = 1000,
+) -> int:
+    """Insert rows into a table, updating the rows that already exist.
+
+    The statement is built from the reflected target table with the
+    database's native conflict handling: ``INSERT ... ON CONFLICT DO
+    UPDATE`` for PostgreSQL and SQLite, ``INSERT ... ON DUPLICATE KEY
+    UPDATE`` for MySQL and MariaDB (which match on any unique key, not
+    only ``conflict_keys``) and ``MERGE`` for SQL Server and Oracle. Every
+    batch is sent with executemany, committing once per batch. Columns
+    missing from a row are left untouched on update.
+
+    Args:
+        db (Database): The target database.
+        table (str): The name of the target table.
+        rows (Iterable[Mapping[str, Any]]): The rows to upsert. Every row
+        must contain the conflict keys.
+        conflict_keys (Sequence[str], optional): The columns identifying
+        an existing row, backed by a primary key or unique constraint.
+        Defaults to the primary key of the table.
+        batch_size (int): Maximum number of rows per transaction.
+
+    Returns:
+        int: The number of rows upserted.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer.")
+    if db.engine.dialect.name not in UPSERT_DIALECTS:
+        raise ValueError(
+            f"Upserts are not supported for '{db.engine.dialect.name}'. "
+            f"Expected one of: {list(UPSERT_DIALECTS)}"
+        )
+    target = db.get_table(table)
+    keys = _conflict_keys(target, conflict_keys)
+    upserted = 0
+    for batch in _batched(rows, batch_size):
+        with db.transaction() as connection:
+            for columns, group in _group_by_columns(batch):
+                statement = _upsert_statement(db, target, columns, keys)
+                connection.execute(statement, group)
+        upserted += len(batch)
+    return upserted
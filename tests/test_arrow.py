@@ -0,0 +1,167 @@
+import pytest
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List
+from _pytest.monkeypatch import MonkeyPatch
+from sqlmorpher import (
+    Database,
+    iter_arrow_batches,
+    iter_arrow_chunks,
+    arrow_load_rows,
+    arrow_query_to_table,
+    load_rows,
+)
+from sqlmorpher.arrow import _insert_arrow, _record_batches
+
+duckdb = pytest.importorskip("duckdb")
+pyarrow = pytest.importorskip("pyarrow")
+
+
+class RawConnection:
+    def __init__(self, duck: Any) -> None:
+        self.driver_connection = duck
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _duck_database(monkeypatch: MonkeyPatch, duck: Any) -> Database:
+    """A Database whose connections are the given DuckDB connection, since
+    duckdb_engine may not be installed."""
+    db = Database(type="sqlite", connection_string="sqlite:///:memory:")
+
+    @contextmanager
+    def transaction() -> Iterator[Any]:
+        duck.begin()
+        try:
+            yield SimpleNamespace(connection=RawConnection(duck))
+        except BaseException:
+            duck.rollback()
+            raise
+        duck.commit()
+
+    monkeypatch.setattr(db, "transaction", transaction)
+    monkeypatch.setattr(
+        db.engine, "raw_connection", lambda: RawConnection(duck)
+    )
+    return db
+
+
+@pytest.fixture
+def duck_db(monkeypatch: MonkeyPatch) -> Any:
+    monkeypatch.setattr("sqlmorpher.arrow._is_duckdb", lambda db: True)
+    monkeypatch.setattr("sqlmorpher.loading._is_duckdb", lambda db: True)
+    duck = duckdb.connect()
+    duck.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT)")
+    yield duck
+    duck.close()
+
+
+def test_record_batches_respect_chunk_size(duck_db: Any) -> None:
+    duck_db.execute("INSERT INTO items SELECT i, 'x' FROM range(10) t(i)")
+
+    batches = list(_record_batches(duck_db, "SELECT * FROM items", 4))
+
+    assert sum(batch.num_rows for batch in batches) == 10
+    assert max(batch.num_rows for batch in batches) <= 4
+
+
+def test_insert_arrow_matches_columns_by_name(duck_db: Any) -> None:
+    batch = pyarrow.Table.from_pylist([{"label": "a", "id": 1}])
+
+    _insert_arrow(duck_db, "items", batch)
+
+    assert duck_db.execute("SELECT id, label FROM items").fetchall() == [
+        (1, "a")
+    ]
+
+
+def test_iter_arrow_chunks_yields_row_dicts(
+    monkeypatch: MonkeyPatch, duck_db: Any
+) -> None:
+    duck_db.execute("INSERT INTO items VALUES (1, 'a'), (2, 'b'), (3, 'c')")
+    db = _duck_database(monkeypatch, duck_db)
+
+    chunks = list(
+        iter_arrow_chunks(db, "SELECT * FROM items ORDER BY id", chunk_size=2)
+    )
+
+    assert [row for chunk in chunks for row in chunk] == [
+        {"id": 1, "label": "a"},
+        {"id": 2, "label": "b"},
+        {"id": 3, "label": "c"},
+    ]
+    assert all(len(chunk) <= 2 for chunk in chunks)
+
+
+def test_arrow_load_rows(monkeypatch: MonkeyPatch, duck_db: Any) -> None:
+    db = _duck_database(monkeypatch, duck_db)
+    rows = [{"id": i, "label": str(i)} for i in range(5)]
+
+    assert arrow_load_rows(db, "items", rows, batch_size=2) == 5
+    assert load_rows(db, "items", [{"id": 9, "label": "z"}]) == 1
+    assert duck_db.execute("SELECT COUNT(*) FROM items").fetchone() == (6,)
+
+
+def test_arrow_load_rows_with_mixed_columns(
+    monkeypatch: MonkeyPatch, duck_db: Any
+) -> None:
+    duck_db.execute("CREATE TABLE tagged (id INTEGER, label TEXT DEFAULT 'x')")
+    db = _duck_database(monkeypatch, duck_db)
+    rows: List[Dict[str, Any]] = [
+        {"id": 1},
+        {"id": 2, "label": "b"},
+        {"label": "c", "id": 3},
+    ]
+
+    assert arrow_load_rows(db, "tagged", rows) == 3
+
+    assert duck_db.execute(
+        "SELECT id, label FROM tagged ORDER BY id"
+    ).fetchall() == [(1, "x"), (2, "b"), (3, "c")]
+
+
+def test_arrow_load_rows_rolls_back_on_error(
+    monkeypatch: MonkeyPatch, duck_db: Any
+) -> None:
+    db = _duck_database(monkeypatch, duck_db)
+    rows = [{"id": 1, "label": "a"}, {"id": 1, "label": "b"}]
+
+    with pytest.raises(duckdb.ConstraintException):
+        arrow_load_rows(db, "items", rows, batch_size=1)
+
+    assert duck_db.execute("SELECT COUNT(*) FROM items").fetchone() == (0,)
+
+
+def test_arrow_query_to_table(monkeypatch: MonkeyPatch, tmp_path: Any) -> None:
+    monkeypatch.setattr("sqlmorpher.arrow._is_duckdb", lambda db: True)
+    source = duckdb.connect(str(tmp_path / "source.duckdb"))
+    source.execute("CREATE TABLE users (uid INTEGER, name TEXT)")
+    source.execute("INSERT INTO users SELECT i, 'u' || i FROM range(7) t(i)")
+    target = duckdb.connect(str(tmp_path / "target.duckdb"))
+    target.execute("CREATE TABLE people (id INTEGER, label TEXT)")
+    source_db = _duck_database(monkeypatch, source)
+    target_db = _duck_database(monkeypatch, target)
+
+    loaded = arrow_query_to_table(
+        source_db,
+        "SELECT uid AS id, name AS label FROM users",
+        target_db,
+        "people",
+        chunk_size=3,
+    )
+
+    assert loaded == 7
+    assert target.execute("SELECT COUNT(*) FROM people").fetchone() == (7,)
+    source.close()
+    target.close()
+
+
+def test_arrow_requires_duckdb() -> None:
+    db = Database(type="sqlite", connection_string="sqlite:///:memory:")
+
+    with pytest.raises(ValueError, match="DuckDB"):
+        list(iter_arrow_batches(db, "SELECT 1"))
+    with pytest.raises(ValueError, match="DuckDB"):
+        arrow_load_rows(db, "items", [{"id": 1}])
@@ -0,0 +1,58 @@
+import asyncio
+from pathlib import Path
+from typing import List
+from sqlmorpher import AsyncDatabase
+
+
+def test_async_database_queries(tmp_path: Path) -> None:
+    async def run() -> List[List[int]]:
+        db = AsyncDatabase(
+            type="sqlite",
+            connection_string=f"sqlite+aiosqlite:///{tmp_path / 'a.db'}",
+        )
+        await db.aexecute_query("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+        inserted = await db.ainsert_rows(
+            "items", [{"id": i} for i in range(1, 6)], batch_size=2
+        )
+        assert inserted == 5
+        table = await db.run_sync(db.get_table, "items")
+        assert "id" in table.c
+        chunks = [
+            [row["id"] for row in chunk]
+            async for chunk in db.astream_query(
+                "SELECT id FROM items ORDER BY id", chunk_size=2
+            )
+        ]
+        await db.dispose()
+        return chunks
+
+    assert asyncio.run(run()) == [[1, 2], [3, 4], [5]]
+
+
+def test_async_database_transactions_are_task_local(tmp_path: Path) -> None:
+    async def run() -> List[int]:
+        db = AsyncDatabase(
+            type="sqlite",
+            connection_string=f"sqlite+aiosqlite:///{tmp_path / 'a.db'}",
+        )
+        await db.aexecute_query("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+
+        def write(first_id: int, fail: bool) -> None:
+            with db.transaction():
+                for i in range(first_id, first_id + 3):
+                    db.insert_row("items", {"id": i})
+                if fail:
+                    raise RuntimeError("abort")
+
+        results = await asyncio.gather(
+            db.run_sync(write, 1, False),
+            db.run_sync(write, 10, True),
+            return_exceptions=True,
+        )
+        assert results[0] is None
+        assert isinstance(results[1], RuntimeError)
+        rows = await db.aexecute_query("SELECT id FROM items ORDER BY id")
+        await db.dispose()
+        return [row["id"] for row in rows or []]
+
+    assert asyncio.run(run()) == [1, 2, 3]
@@ -0,0 +1,100 @@
+import asyncio
+import pytest
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Tuple
+from sqlmorpher import AsyncDatabase, Database, amigrate
+
+
+def _databases(tmp_path: Path) -> Tuple[AsyncDatabase, AsyncDatabase]:
+    old_db = AsyncDatabase(
+        type="sqlite",
+        connection_string=f"sqlite+aiosqlite:///{tmp_path / 'old.db'}",
+    )
+    new_db = AsyncDatabase(
+        type="sqlite",
+        connection_string=f"sqlite+aiosqlite:///{tmp_path / 'new.db'}",
+    )
+    return old_db, new_db
+
+
+def test_amigrate_runs_entries_concurrently(tmp_path: Path) -> None:
+    old_db, new_db = _databases(tmp_path)
+
+    def upper_name(new_db: Database, row: Mapping[str, Any]) -> None:
+        exists = new_db.execute_query(
+            "SELECT 1 FROM people WHERE id = :id", {"id": row["id"]}
+        )
+        if not exists:
+            new_db.insert_row("people", {**row, "name": row["name"].upper()})
+
+    async def run() -> Dict[str, List[Tuple[Any, ...]]]:
+        await old_db.aexecute_query(
+            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"
+        )
+        await old_db.aexecute_query(
+            "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER)"
+        )
+        await new_db.aexecute_query(
+            "CREATE TABLE people (id INTEGER PRIMARY KEY, name TEXT)"
+        )
+        await new_db.aexecute_query(
+            "CREATE TABLE purchases (id INTEGER PRIMARY KEY, "
+            "person_id INTEGER REFERENCES people (id))"
+        )
+        await old_db.ainsert_rows(
+            "users", [{"id": i, "name": f"user{i}"} for i in range(1, 11)]
+        )
+        await old_db.ainsert_rows(
+            "orders",
+            [{"id": i, "user_id": i % 10 + 1} for i in range(1, 31)],
+        )
+
+        mapping: List[Dict[str, Any]] = [
+            {
+                "root_table": "orders",
+                "columns": {"orders.id": "id", "orders.user_id": "person_id"},
+                "target_table": "purchases",
+                "chunk_size": 7,
+            },
+            {
+                "root_table": "users",
+                "columns": {"users.id": "id", "users.name": "name"},
+                "target_table": "people",
+                "insert_function": "upper_name",
+                "extract_method": "keyset",
+                "chunk_size": 3,
+            },
+        ]
+        await amigrate(old_db, new_db, mapping, {"upper_name": upper_name})
+
+        people = await new_db.aexecute_query(
+            "SELECT id, name FROM people ORDER BY id"
+        )
+        purchases = await new_db.aexecute_query(
+            "SELECT COUNT(*) AS n FROM purchases"
+        )
+        await old_db.dispose()
+        await new_db.dispose()
+        return {
+            "people": [tuple(row.values()) for row in people or []],
+            "purchases": [tuple(row.values()) for row in purchases or []],
+        }
+
+    result = asyncio.run(run())
+
+    assert result["people"] == [(i, f"USER{i}") for i in range(1, 11)]
+    assert result["purchases"] == [(30,)]
+
+
+def test_amigrate_rejects_threaded_options(tmp_path: Path) -> None:
+    old_db, new_db = _databases(tmp_path)
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id"},
+            "pipeline": True,
+        }
+    ]
+
+    with pytest.raises(ValueError, match="not supported by amigrate"):
+        asyncio.run(amigrate(old_db, new_db, mapping))
@@ -0,0 +1,80 @@
+import pickle
+from pathlib import Path
+from sqlmorpher import Database, PlanCache, schema_fingerprint
+
+
+def _create_db(path: Path) -> str:
+    conn_str = f"sqlite:///{path}"
+    setup = Database(type="sqlite", connection_string=conn_str)
+    setup.execute_query(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT);"
+    )
+    return conn_str
+
+
+def test_schema_fingerprint_changes_with_schema(tmp_path: Path) -> None:
+    conn_str = _create_db(tmp_path / "db.sqlite")
+    db = Database(type="sqlite", connection_string=conn_str)
+
+    before = schema_fingerprint(db.engine)
+    assert schema_fingerprint(db.engine) == before
+
+    db.execute_query("ALTER TABLE users ADD COLUMN email TEXT;")
+    assert schema_fingerprint(db.engine) != before
+
+
+def test_reflection_cache_reused_across_instances(tmp_path: Path) -> None:
+    conn_str = _create_db(tmp_path / "db.sqlite")
+    cache_dir = tmp_path / "cache"
+
+    first = Database(
+        type="sqlite",
+        connection_string=conn_str,
+        reflection_cache=str(cache_dir),
+    )
+    first.get_table("users")
+    cache_files = list(cache_dir.glob("*.pickle"))
+    assert len(cache_files) == 1
+    with open(cache_files[0], "rb") as f:
+        assert "users" in pickle.load(f)["metadata"].tables
+
+    second = Database(
+        type="sqlite",
+        connection_string=conn_str,
+        reflection_cache=str(cache_dir),
+    )
+    second.reflect_tables([])
+    assert "users" in second.metadata.tables
+
+
+def test_reflection_cache_invalidated_by_schema_change(
+    tmp_path: Path,
+) -> None:
+    conn_str = _create_db(tmp_path / "db.sqlite")
+    cache_dir = str(tmp_path / "cache")
+
+    Database(
+        type="sqlite", connection_string=conn_str, reflection_cache=cache_dir
+    ).get_table("users")
+    Database(type="sqlite", connection_string=conn_str).execute_query(
+        "ALTER TABLE users ADD COLUMN email TEXT;"
+    )
+
+    db = Database(
+        type="sqlite", connection_string=conn_str, reflection_cache=cache_dir
+    )
+    db.reflect_tables([])
+    assert "users" not in db.metadata.tables
+    assert "email" in db.get_table("users").c
+
+
+def test_plan_cache_persists_plans(tmp_path: Path) -> None:
+    key = PlanCache.key({"root_table": "users"}, "fingerprint")
+    assert key == PlanCache.key({"root_table": "users"}, "fingerprint")
+    assert key != PlanCache.key({"root_table": "users"}, "other")
+
+    PlanCache(str(tmp_path)).put(key, {"query": "SELECT 1"})
+
+    assert PlanCache(str(tmp_path)).get(key) == {"query": "SELECT 1"}
+    assert PlanCache(str(tmp_path)).get("missing") is None
+    assert PlanCache().get(key) is None
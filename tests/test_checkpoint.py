@@ -0,0 +1,84 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+from sqlmorpher import CheckpointStore, Database
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> CheckpointStore:
+    db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'ckpt.db'}"
+    )
+    return CheckpointStore(db)
+
+
+def test_checkpoint_store_round_trip(store: CheckpointStore) -> None:
+    assert store.get("users") is None
+
+    store.save("users", 42)
+    assert store.get("users") == {"last_key": 42, "completed": False}
+
+    store.save("users", "b-12", completed=True)
+    assert store.get("users") == {"last_key": "b-12", "completed": True}
+
+
+def test_checkpoint_store_clear(store: CheckpointStore) -> None:
+    store.save("users", 1)
+    store.save("orders", 2)
+
+    store.clear("users")
+    assert store.get("users") is None
+    assert store.get("orders") is not None
+
+    store.clear()
+    assert store.get("orders") is None
+
+
+def test_checkpoint_store_commits_with_transaction(
+    store: CheckpointStore,
+) -> None:
+    with pytest.raises(RuntimeError):
+        with store.db.transaction():
+            store.save("users", 1)
+            raise RuntimeError("abort")
+
+    assert store.get("users") is None
+
+
+@pytest.mark.parametrize(
+    "last_key",
+    [
+        Decimal("12.50"),
+        UUID("12345678-1234-5678-1234-567812345678"),
+        date(2024, 2, 29),
+        datetime(2024, 2, 29, 13, 45, 30, 250),
+        time(13, 45),
+        b"\x00\xff",
+    ],
+)
+def test_checkpoint_store_keeps_key_types(
+    store: CheckpointStore, last_key: Any
+) -> None:
+    store.save("users", last_key)
+
+    checkpoint = store.get("users")
+    assert checkpoint is not None
+    assert checkpoint["last_key"] == last_key
+    assert type(checkpoint["last_key"]) is type(last_key)
+
+
+def test_checkpoint_store_concurrent_saves(store: CheckpointStore) -> None:
+    def save_many(worker: int) -> None:
+        for _ in range(20):
+            store.save("users")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(save_many, range(4)))
+
+    assert store.get("users") == {"last_key": None, "completed": False}
+    rows = store.db.execute_query(f"SELECT entry FROM {store.table}")
+    assert rows is not None and len(rows) == 1
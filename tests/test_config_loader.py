@@ -3,6 +3,7 @@ from _pytest.monkeypatch import MonkeyPatch
 import tempfile
 import yaml
 import os
+from pathlib import Path
 from sqlmorpher import (
     load_db_config,
     load_migration_config,
@@ -73,3 +74,27 @@ def test_load_db_config(db_yaml_file: str) -> None:
     # Test que la connexion fonctionne
     assert databases["source"].validate_connection() is True
     assert databases["target"].validate_connection() is True
+
+
+def test_load_db_config_with_reflect(tmp_path: Path) -> None:
+    db_path = tmp_path / "source.sqlite"
+    Database(
+        type="sqlite", connection_string=f"sqlite:///{db_path}"
+    ).execute_query("CREATE TABLE users (id INTEGER PRIMARY KEY);")
+    config_path = tmp_path / "config.yaml"
+    content = {
+        "databases": {
+            "source": {
+                "type": "sqlite",
+                "path": str(db_path),
+                "reflect": True,
+            },
+            "target": {"type": "sqlite", "path": str(db_path)},
+        }
+    }
+    config_path.write_text(yaml.dump(content))
+
+    databases = load_db_config(str(config_path))
+
+    assert "users" in databases["source"].metadata.tables
+    assert len(databases["target"].metadata.tables) == 0
@@ -92,6 +92,30 @@ def test_sqlserver_connection_string() -> None:
     assert "Encrypt%3Dyes" in dsn
 
 
+def test_sqlserver_packet_size() -> None:
+    dsn = create_connection_string(
+        "mssql",
+        host="localhost",
+        port=1433,
+        user="sa",
+        password="secret",
+        database="mydb",
+        packet_size=32767,
+    )
+    assert "Packet+Size%3D32767" in dsn
+
+    with pytest.raises(ValueError, match="packet_size"):
+        create_connection_string(
+            "mssql",
+            host="localhost",
+            port=1433,
+            user="sa",
+            password="secret",
+            database="mydb",
+            packet_size=100000,
+        )
+
+
 def test_invalid_db_type() -> None:
     with pytest.raises(ValueError):
         create_connection_string("notadb")
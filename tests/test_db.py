@@ -1,6 +1,11 @@
 import tempfile
+import pytest
+from sqlalchemy import text
+from pathlib import Path
+from typing import Any, List
 from sqlmorpher import create_connection_string
 from sqlmorpher import Database
+from sqlmorpher.db import _engine_options
 
 
 def test_database_sqlite_creation() -> None:
@@ -33,3 +38,155 @@ def test_database_reflect_tables() -> None:
         assert table is not None
         assert "id" in table.c
         assert "name" in table.c
+
+
+def test_database_stream_query_chunks() -> None:
+    with tempfile.NamedTemporaryFile(suffix=".sqlite") as tmp:
+        conn_str = create_connection_string("sqlite", path=tmp.name)
+        db = Database(type="sqlite", connection_string=conn_str)
+        db.execute_query("CREATE TABLE numbers (id INTEGER PRIMARY KEY);")
+        for i in range(1, 8):
+            db.execute_query(
+                "INSERT INTO numbers (id) VALUES (:id)", params={"id": i}
+            )
+
+        chunks = list(
+            db.stream_query("SELECT id FROM numbers ORDER BY id", chunk_size=3)
+        )
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        assert [row["id"] for chunk in chunks for row in chunk] == list(
+            range(1, 8)
+        )
+
+
+def test_database_insert_rows_batches() -> None:
+    with tempfile.NamedTemporaryFile(suffix=".sqlite") as tmp:
+        conn_str = create_connection_string("sqlite", path=tmp.name)
+        db = Database(type="sqlite", connection_string=conn_str)
+        db.execute_query(
+            "CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT);"
+        )
+
+        rows = [{"id": i, "label": f"item{i}"} for i in range(1, 6)]
+        rows.append({"id": 6})
+        inserted = db.insert_rows("items", rows, batch_size=2)
+
+        assert inserted == 6
+        result = db.execute_query("SELECT id, label FROM items ORDER BY id")
+        assert result is not None
+        assert [row["id"] for row in result] == [1, 2, 3, 4, 5, 6]
+        assert result[0]["label"] == "item1"
+        assert result[5]["label"] is None
+
+
+def test_database_reflects_lazily() -> None:
+    with tempfile.NamedTemporaryFile(suffix=".sqlite") as tmp:
+        conn_str = create_connection_string("sqlite", path=tmp.name)
+        setup = Database(type="sqlite", connection_string=conn_str)
+        setup.execute_query("CREATE TABLE first (id INTEGER PRIMARY KEY);")
+        setup.execute_query("CREATE TABLE second (id INTEGER PRIMARY KEY);")
+
+        db = Database(type="sqlite", connection_string=conn_str)
+        assert len(db.metadata.tables) == 0
+
+        table = db.get_table("first")
+        assert "id" in table.c
+        assert db.get_table("first") is table
+        assert set(db.metadata.tables) == {"first"}
+
+        db.reflect_tables(["second", "missing"])
+        assert set(db.metadata.tables) == {"first", "second"}
+
+        with pytest.raises(ValueError, match="Table 'missing' does not exist"):
+            db.get_table("missing")
+
+        full = Database(
+            type="sqlite", connection_string=conn_str, reflect=True
+        )
+        assert set(full.metadata.tables) == {"first", "second"}
+
+
+def test_database_refresh_table_updates_in_place() -> None:
+    with tempfile.NamedTemporaryFile(suffix=".sqlite") as tmp:
+        conn_str = create_connection_string("sqlite", path=tmp.name)
+        db = Database(type="sqlite", connection_string=conn_str)
+        db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY);")
+        table = db.get_table("items")
+
+        db.execute_query("ALTER TABLE items ADD COLUMN label TEXT;")
+        assert "label" not in db.get_table("items").c
+
+        assert db.refresh_table("items") is table
+        assert "label" in table.c
+
+
+def test_database_insert_row_reuses_statements(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    db = Database(type="sqlite", connection_string="sqlite:///:memory:")
+    db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT)")
+    built: List[str] = []
+
+    def counting_text(sql: str) -> Any:
+        built.append(sql)
+        return text(sql)
+
+    monkeypatch.setattr("sqlmorpher.db.text", counting_text)
+    for i in range(1, 4):
+        db.insert_row("items", {"id": i, "label": f"item{i}"})
+    db.insert_rows("items", [{"id": 4, "label": "item4"}])
+    db.insert_row("items", {"id": 5})
+
+    assert built == [
+        "INSERT INTO items (id, label) VALUES (:id, :label)",
+        "INSERT INTO items (id) VALUES (:id)",
+    ]
+    result = db.execute_query("SELECT COUNT(*) AS n FROM items")
+    assert result is not None
+    assert result[0]["n"] == 5
+
+
+def test_database_transaction_reuses_one_connection(tmp_path: Path) -> None:
+    db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'tx.db'}"
+    )
+    db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT)")
+
+    with db.transaction() as connection:
+        db.insert_row("items", {"id": 1, "label": "a"})
+        db.insert_rows("items", [{"id": 2, "label": "b"}])
+        result = db.execute_query("SELECT COUNT(*) AS n FROM items")
+        assert result is not None
+        assert result[0]["n"] == 2
+        with db.transaction() as nested:
+            assert nested is connection
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.insert_row("items", {"id": 3, "label": "c"})
+            raise RuntimeError("abort")
+
+    result = db.execute_query("SELECT id FROM items ORDER BY id")
+    assert result is not None
+    assert [row["id"] for row in result] == [1, 2]
+
+
+def test_database_engine_options() -> None:
+    db = Database(
+        type="sqlite",
+        connection_string="sqlite:///:memory:",
+        engine_options={"echo": True},
+    )
+    assert db.engine.echo is True
+    assert db.engine_options == {"echo": True}
+
+
+def test_database_default_engine_options_by_backend() -> None:
+    odbc = "mssql+pyodbc:///?odbc_connect=Driver%3D%7Bx%7D"
+
+    assert _engine_options(odbc, {}) == {"fast_executemany": True}
+    assert _engine_options(odbc, {"fast_executemany": False}) == {
+        "fast_executemany": False
+    }
+    assert _engine_options("mssql+pymssql://sa@host/db", {}) == {}
+    assert _engine_options("sqlite:///:memory:", {}) == {}
@@ -0,0 +1,186 @@
+import pytest
+import tempfile
+from _pytest.monkeypatch import MonkeyPatch
+from sqlmorpher import (
+    Database,
+    create_connection_string,
+    generate_keyset_queries,
+    iter_keyset_chunks,
+    iter_keyset_pages,
+    iter_copy_chunks,
+    partition_key_range,
+)
+from typing import Any, Dict, List
+
+
+@pytest.fixture
+def db_with_rows() -> Any:
+    with tempfile.NamedTemporaryFile(suffix=".sqlite") as tmp:
+        conn_str = create_connection_string("sqlite", path=tmp.name)
+        db = Database(type="sqlite", connection_string=conn_str)
+        db.execute_query(
+            "CREATE TABLE users (id INTEGER PRIMARY KEY, username TEXT);"
+        )
+        db.execute_query(
+            """
+            CREATE TABLE orders (
+                id INTEGER PRIMARY KEY,
+                user_id INTEGER,
+                amount INTEGER
+            );
+        """
+        )
+        for i in range(1, 8):
+            db.execute_query(
+                "INSERT INTO users (id, username) VALUES (:id, :name)",
+                params={"id": i * 10, "name": f"user{i}"},
+            )
+        for i in range(1, 5):
+            db.execute_query(
+                "INSERT INTO orders (user_id, amount) VALUES (20, :amount)",
+                params={"amount": i},
+            )
+        db.reflect_tables()
+        yield db
+
+
+def _keyset_queries(db: Database, chunk_size: int) -> Dict[str, str]:
+    joins = [
+        {
+            "table": "orders",
+            "on_clause": "users.id = orders.user_id",
+            "type": "LEFT",
+        }
+    ]
+    columns = {"users.id": "id", "orders.amount": "amount"}
+    return generate_keyset_queries(db, "users", joins, columns, chunk_size)
+
+
+def test_iter_keyset_chunks_reads_every_row(db_with_rows: Database) -> None:
+    queries = _keyset_queries(db_with_rows, chunk_size=2)
+
+    chunks = list(iter_keyset_chunks(db_with_rows, queries, chunk_size=2))
+
+    ids: List[int] = [row["id"] for chunk in chunks for row in chunk]
+    assert len(chunks) == 4
+    assert ids == [10, 20, 20, 20, 20, 30, 40, 50, 60, 70]
+
+
+def test_iter_keyset_chunks_with_bounds(db_with_rows: Database) -> None:
+    queries = _keyset_queries(db_with_rows, chunk_size=2)
+
+    chunks = list(
+        iter_keyset_chunks(
+            db_with_rows, queries, chunk_size=2, lower_key=30, upper_key=50
+        )
+    )
+
+    assert [[row["id"] for row in chunk] for chunk in chunks] == [
+        [30, 40],
+        [50],
+    ]
+
+
+@pytest.mark.parametrize("after_key", [30, 35])
+def test_iter_keyset_pages_after_key(
+    db_with_rows: Database, after_key: int
+) -> None:
+    queries = _keyset_queries(db_with_rows, chunk_size=2)
+
+    pages = list(
+        iter_keyset_pages(
+            db_with_rows, queries, chunk_size=2, after_key=after_key
+        )
+    )
+
+    assert [
+        ([row["id"] for row in rows], last_key) for rows, last_key in pages
+    ] == [([40, 50], 50), ([60, 70], 70)]
+
+
+def test_iter_keyset_chunks_empty_table(db_with_rows: Database) -> None:
+    db_with_rows.execute_query("DELETE FROM users;")
+    queries = _keyset_queries(db_with_rows, chunk_size=2)
+
+    assert list(iter_keyset_chunks(db_with_rows, queries, chunk_size=2)) == []
+
+
+def test_partition_key_range_integer_keys(db_with_rows: Database) -> None:
+    queries = _keyset_queries(db_with_rows, chunk_size=2)
+
+    ranges = partition_key_range(db_with_rows, queries, partitions=3)
+
+    assert ranges == [(10, 30), (31, 51), (52, 70)]
+
+
+def test_partition_key_range_text_keys(db_with_rows: Database) -> None:
+    db_with_rows.execute_query("CREATE TABLE codes (code TEXT PRIMARY KEY);")
+    for code in ["a", "b", "c", "d", "e"]:
+        db_with_rows.execute_query(
+            "INSERT INTO codes (code) VALUES (:code)", params={"code": code}
+        )
+    queries = generate_keyset_queries(
+        db_with_rows, "codes", [], {"codes.code": "code"}, chunk_size=2
+    )
+
+    ranges = partition_key_range(db_with_rows, queries, partitions=2)
+
+    assert ranges == [("a", "c"), ("d", "e")]
+
+
+class FakeCopyOutCursor:
+    def __init__(self, chunks: List[bytes]) -> None:
+        self.chunks = chunks
+        self.sql = ""
+
+    def copy_expert(self, sql: str, file: Any) -> None:
+        self.sql = sql
+        for chunk in self.chunks:
+            file.write(chunk)
+
+    def close(self) -> None:
+        pass
+
+
+class FakeCopyOutConnection:
+    def __init__(self, cursor: FakeCopyOutCursor) -> None:
+        self._cursor = cursor
+
+    def cursor(self) -> FakeCopyOutCursor:
+        return self._cursor
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def test_iter_copy_chunks_parses_text_format(
+    db_with_rows: Database, monkeypatch: MonkeyPatch
+) -> None:
+    payload = "1\tcafé\n2\t\\N\n3\ta\\tb\\\\c\\nd\n".encode()
+    cursor = FakeCopyOutCursor([payload[:6], payload[6:20], payload[20:]])
+    monkeypatch.setattr(db_with_rows.engine.dialect, "name", "postgresql")
+    monkeypatch.setattr(
+        db_with_rows.engine,
+        "raw_connection",
+        lambda: FakeCopyOutConnection(cursor),
+    )
+
+    chunks = list(
+        iter_copy_chunks(
+            db_with_rows, "SELECT 1", ["id", "label"], chunk_size=2
+        )
+    )
+
+    assert cursor.sql == "COPY (SELECT 1) TO STDOUT"
+    assert chunks == [
+        [{"id": "1", "label": "café"}, {"id": "2", "label": None}],
+        [{"id": "3", "label": "a\tb\\c\nd"}],
+    ]
+
+
+def test_iter_copy_chunks_requires_postgresql(db_with_rows: Database) -> None:
+    with pytest.raises(ValueError, match="COPY extraction requires"):
+        list(iter_copy_chunks(db_with_rows, "SELECT 1", ["id"]))
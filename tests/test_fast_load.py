@@ -0,0 +1,55 @@
+import pytest
+from pathlib import Path
+from sqlalchemy import text
+from typing import Any, Dict
+from sqlmorpher import Database, sqlite_fast_load
+
+
+def _pragmas(db: Database) -> Dict[str, Any]:
+    with db.engine.connect() as connection:
+        return {
+            name: connection.execute(text(f"PRAGMA {name}")).scalar()
+            for name in ("journal_mode", "synchronous", "cache_size")
+        }
+
+
+def test_sqlite_fast_load_tunes_and_restores(tmp_path: Path) -> None:
+    db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'a.db'}"
+    )
+    db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    original = _pragmas(db)
+
+    with sqlite_fast_load(db, cache_size=-1024):
+        assert _pragmas(db) == {
+            "journal_mode": "wal",
+            "synchronous": 0,
+            "cache_size": -1024,
+        }
+        db.insert_rows("items", [{"id": i} for i in range(100)])
+
+    assert _pragmas(db) == original
+    result = db.execute_query("SELECT COUNT(*) AS n FROM items")
+    assert result is not None
+    assert result[0]["n"] == 100
+
+
+def test_sqlite_fast_load_skips_memory_databases() -> None:
+    db = Database(type="sqlite", connection_string="sqlite:///:memory:")
+    db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+
+    with sqlite_fast_load(db, journal_mode="OFF"):
+        db.insert_row("items", {"id": 1})
+
+    result = db.execute_query("SELECT COUNT(*) AS n FROM items")
+    assert result is not None
+    assert result[0]["n"] == 1
+
+
+def test_sqlite_fast_load_invalid_journal_mode(tmp_path: Path) -> None:
+    db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'a.db'}"
+    )
+    with pytest.raises(ValueError, match="Invalid journal_mode 'MEMORY'"):
+        with sqlite_fast_load(db, journal_mode="MEMORY"):
+            pass
@@ -1,12 +1,15 @@
 import pytest
 import tempfile
+from _pytest.monkeypatch import MonkeyPatch
 from sqlmorpher import (
     Database,
     create_connection_string,
     validate_joins,
+    explain_joins,
     generate_join_query,
+    generate_keyset_queries,
 )
-from typing import Any
+from typing import Any, List
 
 
 @pytest.fixture
@@ -147,3 +150,137 @@ def test_generate_join_query(db_with_schema: Database) -> None:
     assert "JOIN countries" in sql
     assert "ON users.id = profiles.user_id" in sql
     assert "ON profiles.country_id = countries.id" in sql
+
+
+def test_generate_keyset_queries(db_with_schema: Database) -> None:
+    joins = [
+        {
+            "table": "profiles",
+            "on_clause": "users.id = profiles.user_id",
+            "type": "LEFT",
+        }
+    ]
+    select_columns = {"users.id": "id", "profiles.phone": "phone"}
+
+    queries = generate_keyset_queries(
+        db_with_schema, "users", joins, select_columns, chunk_size=10
+    )
+
+    assert "min(users.id) AS min_key" in queries["bounds"]
+    assert "users.id >= :lower_key" in queries["keys"]
+    assert "LIMIT 11" in queries["keys"]
+    assert "LEFT OUTER JOIN profiles" in queries["page"]
+    assert "users.id <= :upper_key" in queries["page"]
+    assert "ORDER BY users.id" in queries["page"]
+
+
+def test_generate_keyset_queries_requires_single_primary_key(
+    db_with_schema: Database,
+) -> None:
+    db_with_schema.execute_query("CREATE TABLE tags (user_id INT, tag TEXT);")
+    with pytest.raises(ValueError, match="single-column primary key"):
+        generate_keyset_queries(
+            db_with_schema, "tags", [], {"tags.tag": "tag"}, chunk_size=10
+        )
+
+
+def test_validate_joins_reuses_reflected_tables(
+    db_with_schema: Database, monkeypatch: MonkeyPatch
+) -> None:
+    joins = [
+        {
+            "table": "profiles",
+            "on_clause": "users.id = profiles.user_id",
+            "type": "left",
+        },
+    ]
+    _, table_map = validate_joins(db_with_schema, "users", joins)
+
+    def fail_reflection(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("tables should not be reflected again")
+
+    monkeypatch.setattr(db_with_schema.metadata, "reflect", fail_reflection)
+    monkeypatch.setattr("sqlmorpher.db.Table", fail_reflection)
+    _, second_map = validate_joins(db_with_schema, "users", joins)
+
+    assert second_map["profiles"] is table_map["profiles"]
+    assert second_map["users"] is db_with_schema.get_table("users")
+
+
+def test_validate_joins_invalid_validation_mode(
+    db_with_schema: Database,
+) -> None:
+    with pytest.raises(ValueError, match="Invalid validation 'fast'"):
+        validate_joins(db_with_schema, "users", [], validation="fast")
+
+
+@pytest.mark.parametrize("validation", ["explain", "none"])
+def test_validate_joins_without_probe(
+    db_with_schema: Database, monkeypatch: MonkeyPatch, validation: str
+) -> None:
+    joins = [
+        {
+            "table": "profiles",
+            "on_clause": "users.id = profiles.user_id",
+            "type": "left",
+        }
+    ]
+
+    def fail_probe(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("the join should not be executed")
+
+    monkeypatch.setattr(db_with_schema, "execute_query", fail_probe)
+    _, table_map = validate_joins(
+        db_with_schema, "users", joins, validation=validation
+    )
+    assert set(table_map) == {"users", "profiles"}
+
+
+def test_validate_joins_metadata_mode(
+    db_with_schema: Database, monkeypatch: MonkeyPatch
+) -> None:
+    db_with_schema.execute_query(
+        """
+        CREATE TABLE orders (
+            id INTEGER PRIMARY KEY,
+            user_id INTEGER REFERENCES users (id)
+        );
+    """
+    )
+    probes: List[str] = []
+    monkeypatch.setattr(db_with_schema, "execute_query", probes.append)
+    fk_join = [
+        {"table": "orders", "on_clause": "users.id = orders.user_id"}
+    ]
+    plain_join = [
+        {"table": "profiles", "on_clause": "users.id = profiles.user_id"}
+    ]
+
+    validate_joins(db_with_schema, "users", fk_join, validation="metadata")
+    assert probes == []
+
+    validate_joins(db_with_schema, "users", plain_join, validation="metadata")
+    assert len(probes) == 1
+    assert "LIMIT" in probes[0]
+
+
+def test_explain_joins_reports_each_join(db_with_schema: Database) -> None:
+    joins = [
+        {
+            "table": "profiles",
+            "on_clause": "users.id = profiles.user_id",
+            "type": "LEFT",
+        },
+        {
+            "table": "countries",
+            "on_clause": "profiles.country_id = countries.id",
+            "type": "INNER",
+        },
+    ]
+
+    report = explain_joins(db_with_schema, "users", joins)
+
+    assert report == [
+        {"table": "profiles", "foreign_key": False, "cost": None},
+        {"table": "countries", "foreign_key": False, "cost": None},
+    ]
@@ -0,0 +1,279 @@
+import re
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from sqlalchemy.exc import OperationalError
+from sqlmorpher import (
+    Database,
+    load_rows,
+    copy_rows,
+    copy_query_to_table,
+    load_data_rows,
+    bulk_insert_rows,
+)
+from typing import Any, Dict, List, Tuple
+
+
+class FakeCursor:
+    def __init__(self, copies: List[Tuple[str, str]]) -> None:
+        self.copies = copies
+
+    def copy_expert(self, sql: str, file: Any) -> None:
+        data = ""
+        chunk = file.read(8192)
+        while chunk:
+            data += chunk.decode() if isinstance(chunk, bytes) else chunk
+            chunk = file.read(8192)
+        self.copies.append((sql, data))
+
+    def close(self) -> None:
+        pass
+
+
+class FakeRawConnection:
+    def __init__(self) -> None:
+        self.copies: List[Tuple[str, str]] = []
+        self.commits = 0
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self.copies)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def target_db() -> Database:
+    db = Database(type="sqlite", connection_string="sqlite:///:memory:")
+    db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT)")
+    return db
+
+
+def test_load_rows_auto_uses_inserts(target_db: Database) -> None:
+    rows: List[Dict[str, Any]] = [{"id": 1, "label": "a"}, {"id": 2}]
+
+    assert load_rows(target_db, "items", rows) == 2
+
+    result = target_db.execute_query("SELECT label FROM items ORDER BY id")
+    assert result is not None
+    assert [row["label"] for row in result] == ["a", None]
+
+
+def test_load_rows_invalid_method(target_db: Database) -> None:
+    with pytest.raises(ValueError, match="Invalid load_method 'fastest'"):
+        load_rows(target_db, "items", [], load_method="fastest")
+
+
+def test_copy_rows_requires_postgresql(target_db: Database) -> None:
+    with pytest.raises(ValueError, match="COPY loading requires"):
+        copy_rows(target_db, "items", [{"id": 1}])
+
+
+def test_copy_rows_encodes_text_format(
+    target_db: Database, monkeypatch: MonkeyPatch
+) -> None:
+    raw = FakeRawConnection()
+    monkeypatch.setattr("sqlmorpher.loading._supports_copy", lambda db: True)
+    monkeypatch.setattr(target_db.engine, "raw_connection", lambda: raw)
+    rows: List[Dict[str, Any]] = [
+        {"id": 1, "label": "tab\there"},
+        {"id": 2, "label": None, "flag": True},
+        {"id": 3, "label": "back\\slash\nline"},
+    ]
+
+    assert copy_rows(target_db, "items", rows, batch_size=2) == 3
+
+    assert raw.commits == 2
+    assert raw.copies == [
+        ("COPY items (id, label) FROM STDIN", "1\ttab\\there\n"),
+        ("COPY items (id, label, flag) FROM STDIN", "2\t\\N\t1\n"),
+        (
+            "COPY items (id, label) FROM STDIN",
+            "3\tback\\\\slash\\nline\n",
+        ),
+    ]
+
+
+def test_copy_rows_encodes_arrays_and_json(
+    target_db: Database, monkeypatch: MonkeyPatch
+) -> None:
+    raw = FakeRawConnection()
+    monkeypatch.setattr("sqlmorpher.loading._supports_copy", lambda db: True)
+    monkeypatch.setattr(target_db.engine, "raw_connection", lambda: raw)
+    rows: List[Dict[str, Any]] = [
+        {
+            "id": 1,
+            "tags": ["a b", None, 'q"uote', [1, 2]],
+            "data": {"k": [1, "v"]},
+        },
+    ]
+
+    copy_rows(target_db, "items", rows)
+
+    assert raw.copies == [
+        (
+            "COPY items (id, tags, data) FROM STDIN",
+            '1\t{"a b",NULL,"q\\\\"uote",{"1","2"}}'
+            '\t{"k": [1, "v"]}\n',
+        ),
+    ]
+
+
+class FakeCopyOutCursor:
+    def copy_expert(self, sql: str, file: Any) -> None:
+        file.write(b"1\ta\n")
+        file.write(b"2\tb\n")
+
+    def close(self) -> None:
+        pass
+
+
+class FakeSourceConnection(FakeRawConnection):
+    def cursor(self) -> Any:
+        return FakeCopyOutCursor()
+
+
+def test_copy_query_to_table_pipes_without_rows(
+    target_db: Database, monkeypatch: MonkeyPatch
+) -> None:
+    source_db = Database(
+        type="sqlite", connection_string="sqlite:///:memory:"
+    )
+    target_raw = FakeRawConnection()
+    monkeypatch.setattr("sqlmorpher.loading._supports_copy", lambda db: True)
+    monkeypatch.setattr(source_db.engine.dialect, "name", "postgresql")
+    monkeypatch.setattr(
+        source_db.engine, "raw_connection", FakeSourceConnection
+    )
+    monkeypatch.setattr(target_db.engine, "raw_connection", lambda: target_raw)
+
+    loaded = copy_query_to_table(
+        source_db, "SELECT id, label FROM t", target_db, "items", ["id", "n"]
+    )
+
+    assert loaded == 2
+    assert target_raw.commits == 1
+    assert target_raw.copies == [
+        ("COPY items (id, n) FROM STDIN", "1\ta\n2\tb\n"),
+    ]
+
+
+def test_load_data_rows_requires_mysql(target_db: Database) -> None:
+    with pytest.raises(ValueError, match="LOAD DATA loading requires"):
+        load_data_rows(target_db, "items", [{"id": 1}])
+
+
+def test_load_data_rows_spools_tsv(
+    target_db: Database, monkeypatch: MonkeyPatch
+) -> None:
+    loads: List[Tuple[str, bytes]] = []
+
+    def fake_run_load_data(db: Database, sql: str) -> None:
+        match = re.search(r"INFILE '([^']+)'", sql)
+        assert match is not None
+        with open(match.group(1), "rb") as f:
+            loads.append((sql.replace(match.group(1), "<file>"), f.read()))
+
+    monkeypatch.setattr(
+        "sqlmorpher.loading._supports_load_data", lambda db: True
+    )
+    monkeypatch.setattr(
+        "sqlmorpher.loading._run_load_data", fake_run_load_data
+    )
+    rows: List[Dict[str, Any]] = [
+        {"id": 1, "label": "tab\there", "data": b"\x00\\\n"},
+        {"id": 2, "data": True},
+        {"id": 3, "label": "é"},
+    ]
+
+    assert load_rows(target_db, "items", rows, batch_size=2) == 3
+    assert load_rows(target_db, "items", [{"id": 4, "data": None}]) == 1
+
+    assert loads == [
+        (
+            "LOAD DATA LOCAL INFILE '<file>' INTO TABLE items "
+            "CHARACTER SET utf8mb4 FIELDS TERMINATED BY '\\t' "
+            "ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' (id, label, data)",
+            b"1\ttab\\there\t\\0\\\\\\n\n",
+        ),
+        (
+            "LOAD DATA LOCAL INFILE '<file>' INTO TABLE items "
+            "CHARACTER SET utf8mb4 FIELDS TERMINATED BY '\\t' "
+            "ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' (id, data)",
+            b"2\t1\n",
+        ),
+        (
+            "LOAD DATA LOCAL INFILE '<file>' INTO TABLE items "
+            "CHARACTER SET utf8mb4 FIELDS TERMINATED BY '\\t' "
+            "ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' (id, label)",
+            "3\té\n".encode(),
+        ),
+        (
+            "LOAD DATA LOCAL INFILE '<file>' INTO TABLE items "
+            "CHARACTER SET utf8mb4 FIELDS TERMINATED BY '\\t' "
+            "ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' (id, data)",
+            b"4\t\\N\n",
+        ),
+    ]
+
+
+def test_load_data_rows_falls_back_to_inserts(
+    target_db: Database, monkeypatch: MonkeyPatch
+) -> None:
+    attempts: List[str] = []
+
+    def disabled(db: Database, sql: str) -> None:
+        attempts.append(sql)
+        raise OperationalError(
+            sql, {}, Exception(3948, "Loading local data is disabled")
+        )
+
+    monkeypatch.setattr(
+        "sqlmorpher.loading._supports_load_data", lambda db: True
+    )
+    monkeypatch.setattr("sqlmorpher.loading._run_load_data", disabled)
+    rows: List[Dict[str, Any]] = [{"id": i, "label": "x"} for i in range(5)]
+
+    assert load_rows(target_db, "items", rows, batch_size=2) == 5
+    assert load_data_rows(target_db, "items", [{"id": 9}]) == 1
+
+    assert len(attempts) == 1
+    result = target_db.execute_query("SELECT COUNT(*) AS n FROM items")
+    assert result is not None
+    assert result[0]["n"] == 6
+
+
+def test_bulk_insert_rows_requires_sqlserver(target_db: Database) -> None:
+    with pytest.raises(ValueError, match="Bulk loading requires"):
+        bulk_insert_rows(target_db, "items", [{"id": 1}])
+
+
+def test_bulk_insert_rows_binds_parameter_arrays(
+    target_db: Database, monkeypatch: MonkeyPatch
+) -> None:
+    calls: List[Tuple[str, List[Tuple[Any, ...]]]] = []
+    monkeypatch.setattr(
+        "sqlmorpher.loading._supports_bulk_insert", lambda db: True
+    )
+    monkeypatch.setattr(
+        "sqlmorpher.loading._run_bulk_insert",
+        lambda db, sql, params: calls.append((sql, params)),
+    )
+    rows: List[Dict[str, Any]] = [
+        {"id": 1, "label": "a"},
+        {"id": 2},
+        {"id": 3, "label": "c"},
+    ]
+
+    assert load_rows(target_db, "items", rows, batch_size=2) == 3
+
+    assert calls == [
+        ("INSERT INTO items (id, label) VALUES (?, ?)", [(1, "a")]),
+        ("INSERT INTO items (id) VALUES (?)", [(2,)]),
+        ("INSERT INTO items (id, label) VALUES (?, ?)", [(3, "c")]),
+    ]
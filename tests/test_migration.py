@@ -1,11 +1,50 @@
+import os
+import threading
+import time
 import pytest
+from pathlib import Path
+from _pytest.monkeypatch import MonkeyPatch
 from sqlalchemy import Table, Column, Integer, String, MetaData
-from sqlmorpher import Database, migrate
-from sqlmorpher.migration import TransformFn
+from sqlalchemy.exc import IntegrityError
+from sqlmorpher import (
+    CheckpointStore,
+    Database,
+    PlanCache,
+    migrate,
+    build_dependency_graph,
+)
+from sqlmorpher.migration import TransformFn, BatchTransformFn
 from sqlmorpher.migration import row_to_dict
+from sqlmorpher.migration import _can_pipe_arrow, _can_pipe_copy
 from typing import Dict, Any, Optional, List, Mapping
 
 
+def double_ids(
+    new_db: Database, rows: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    pid = os.getpid()
+    return [{**row, "double": row["id"] * 2, "pid": pid} for row in rows]
+
+
+def timed_double_ids(
+    new_db: Database, rows: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    started = time.time()
+    time.sleep(0.2)
+    finished = time.time()
+    return [
+        {**row, "started": started, "finished": finished}
+        for row in double_ids(new_db, rows)
+    ]
+
+
+def pool_recycle_ids(
+    new_db: Database, rows: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    recycle = new_db.engine_options.get("pool_recycle")
+    return [{"id": row["id"], "double": recycle} for row in rows]
+
+
 @pytest.fixture
 def old_db() -> Database:
     db = Database(type="sqlite", connection_string="sqlite:///:memory:")
@@ -266,3 +305,848 @@ def test_migrate_without_transform_function(
     row = row_to_dict(result[0])
     assert row["login"] == "alice"
     assert row["telephone"] == "123456"
+
+
+def test_migrate_streams_rows_in_chunks(
+    old_db: Database, new_db: Database
+) -> None:
+    for i in range(2, 6):
+        old_db.execute_query(
+            "INSERT INTO users (id, username) VALUES (:id, :name)",
+            params={"id": i, "name": f"user{i}"},
+        )
+
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id", "users.username": "login"},
+            "target_table": "comptes",
+            "chunk_size": 2,
+        }
+    ]
+    migrate(old_db, new_db, mapping)
+
+    result = new_db.execute_query("SELECT id FROM comptes ORDER BY id")
+    assert result is not None
+    assert [row["id"] for row in result] == [1, 2, 3, 4, 5]
+
+
+def test_migrate_with_batch_transform_function(
+    old_db: Database, new_db: Database
+) -> None:
+    old_db.execute_query("INSERT INTO users (id, username) VALUES (2, 'bob')")
+    calls: List[int] = []
+
+    def uppercase_batch(
+        new_db: Database, rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        calls.append(len(rows))
+        return [
+            {**row, "login": row["login"].upper()}
+            for row in rows
+            if row["login"] != "bob"
+        ]
+
+    transform_registry: Dict[str, BatchTransformFn] = {
+        "uppercase_batch": uppercase_batch,
+    }
+
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id", "users.username": "login"},
+            "target_table": "comptes",
+            "insert_function": "uppercase_batch",
+            "transform_mode": "batch",
+        }
+    ]
+    migrate(old_db, new_db, mapping, transform_registry=transform_registry)
+
+    assert calls == [2]
+    result = new_db.execute_query("SELECT id, login FROM comptes")
+    assert result is not None
+    assert [row_to_dict(row) for row in result] == [
+        {"id": 1, "login": "ALICE"}
+    ]
+
+
+def test_migrate_with_invalid_transform_mode_raises_error(
+    old_db: Database, new_db: Database
+) -> None:
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id"},
+            "target_table": "comptes",
+            "transform_mode": "columnar",
+        }
+    ]
+    with pytest.raises(ValueError, match="Invalid transform_mode"):
+        migrate(old_db, new_db, mapping)
+
+
+def test_migrate_with_keyset_extraction(
+    old_db: Database, new_db: Database
+) -> None:
+    for i in range(2, 6):
+        old_db.execute_query(
+            "INSERT INTO users (id, username) VALUES (:id, :name)",
+            params={"id": i, "name": f"user{i}"},
+        )
+
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "joins": [
+                {
+                    "table": "profiles",
+                    "on_clause": "users.id = profiles.user_id",
+                    "type": "LEFT",
+                }
+            ],
+            "columns": {
+                "users.id": "id",
+                "users.username": "login",
+                "profiles.phone": "telephone",
+            },
+            "target_table": "comptes",
+            "chunk_size": 2,
+            "extract_method": "keyset",
+        }
+    ]
+    migrate(old_db, new_db, mapping)
+
+    result = new_db.execute_query("SELECT * FROM comptes ORDER BY id")
+    assert result is not None
+    assert [row["id"] for row in result] == [1, 2, 3, 4, 5]
+    assert result[0]["telephone"] == "123456"
+
+
+def test_migrate_with_parallel_partitions(tmp_path: Path) -> None:
+    source = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'src.db'}"
+    )
+    target = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'dst.db'}"
+    )
+    source.execute_query(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, username TEXT);"
+    )
+    target.execute_query(
+        "CREATE TABLE comptes (id INTEGER PRIMARY KEY, login TEXT);"
+    )
+    source.insert_rows(
+        "users", [{"id": i, "username": f"user{i}"} for i in range(1, 51)]
+    )
+
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id", "users.username": "login"},
+            "target_table": "comptes",
+            "chunk_size": 7,
+            "parallelism": 4,
+        }
+    ]
+    migrate(source, target, mapping)
+
+    result = target.execute_query("SELECT id FROM comptes ORDER BY id")
+    assert result is not None
+    assert [row["id"] for row in result] == list(range(1, 51))
+
+
+def test_migrate_with_workers_orders_by_foreign_keys(tmp_path: Path) -> None:
+    source = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'src.db'}"
+    )
+    target = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'dst.db'}"
+    )
+    source.execute_query("CREATE TABLE pays (id INTEGER PRIMARY KEY);")
+    source.execute_query(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, pays_id INTEGER);"
+    )
+    source.insert_rows("pays", [{"id": 1}, {"id": 2}])
+    source.insert_rows("users", [{"id": 1, "pays_id": 2}])
+    target.execute_query("CREATE TABLE countries (id INTEGER PRIMARY KEY);")
+    target.execute_query(
+        """
+        CREATE TABLE comptes (
+            id INTEGER PRIMARY KEY,
+            country_id INTEGER REFERENCES countries (id)
+        );
+    """
+    )
+    target.reflect_tables()
+
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id", "users.pays_id": "country_id"},
+            "target_table": "comptes",
+        },
+        {
+            "root_table": "pays",
+            "columns": {"pays.id": "id"},
+            "target_table": "countries",
+        },
+    ]
+    migrate(source, target, mapping, workers=2)
+
+    assert build_dependency_graph(target, mapping) == {0: {1}, 1: set()}
+    result = target.execute_query("SELECT country_id FROM comptes")
+    assert result is not None
+    assert result[0]["country_id"] == 2
+
+
+@pytest.mark.parametrize("extract_method", ["stream", "copy", "arrow"])
+def test_migrate_parallelism_rejects_other_extract_methods(
+    old_db: Database, new_db: Database, extract_method: str
+) -> None:
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id"},
+            "target_table": "comptes",
+            "parallelism": 2,
+            "extract_method": extract_method,
+        }
+    ]
+
+    with pytest.raises(ValueError, match="cannot be combined"):
+        migrate(old_db, new_db, mapping)
+
+
+def test_migrate_tables_referencing_each_other(
+    old_db: Database, new_db: Database
+) -> None:
+    new_db.execute_query(
+        "CREATE TABLE a (id INTEGER PRIMARY KEY, b_id INTEGER REFERENCES b)"
+    )
+    new_db.execute_query(
+        "CREATE TABLE b (id INTEGER PRIMARY KEY, a_id INTEGER REFERENCES a)"
+    )
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id"},
+            "target_table": table,
+        }
+        for table in ("a", "b")
+    ]
+
+    migrate(old_db, new_db, mapping)
+
+    for table in ("a", "b"):
+        result = new_db.execute_query(f"SELECT id FROM {table}")
+        assert result is not None
+        assert [row["id"] for row in result] == [1]
+
+
+def test_migrate_with_plan_cache_skips_validation(
+    old_db: Database,
+    new_db: Database,
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id", "users.username": "login"},
+            "target_table": "comptes",
+        }
+    ]
+    migrate(old_db, new_db, mapping, plan_cache=PlanCache(str(tmp_path)))
+    new_db.execute_query("DELETE FROM comptes")
+
+    def fail_generation(*args: Any, **kwargs: Any) -> str:
+        raise AssertionError("the cached plan should be used")
+
+    monkeypatch.setattr(
+        "sqlmorpher.migration.generate_join_query", fail_generation
+    )
+    migrate(old_db, new_db, mapping, plan_cache=PlanCache(str(tmp_path)))
+
+    result = new_db.execute_query("SELECT login FROM comptes")
+    assert result is not None
+    assert [row["login"] for row in result] == ["alice"]
+
+
+def test_migrate_rolls_back_failed_chunk(tmp_path: Path) -> None:
+    old_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'old.db'}"
+    )
+    new_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'new.db'}"
+    )
+    old_db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    new_db.execute_query("CREATE TABLE copies (id INTEGER PRIMARY KEY)")
+    for i in range(1, 6):
+        old_db.execute_query("INSERT INTO items (id) VALUES (:id)", {"id": i})
+
+    def copy_item(new_db: Database, row: Mapping[str, Any]) -> None:
+        new_db.insert_row("copies", row)
+        if row["id"] == 4:
+            raise RuntimeError("transform failed")
+
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "items",
+            "columns": {"items.id": "id"},
+            "target_table": "copies",
+            "insert_function": "copy_item",
+            "extract_method": "keyset",
+            "chunk_size": 3,
+        }
+    ]
+
+    with pytest.raises(RuntimeError):
+        migrate(old_db, new_db, mapping, {"copy_item": copy_item})
+
+    result = new_db.execute_query("SELECT id FROM copies ORDER BY id")
+    assert result is not None
+    assert [row["id"] for row in result] == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "settings, committed",
+    [
+        ({"commit_every": 4}, [1, 2, 3, 4]),
+        ({"single_transaction": True}, []),
+    ],
+)
+def test_migrate_commit_settings(
+    tmp_path: Path, settings: Dict[str, Any], committed: List[int]
+) -> None:
+    old_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'old.db'}"
+    )
+    new_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'new.db'}"
+    )
+    old_db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    new_db.execute_query("CREATE TABLE copies (id INTEGER PRIMARY KEY)")
+    for i in range(1, 8):
+        old_db.execute_query("INSERT INTO items (id) VALUES (:id)", {"id": i})
+
+    def copy_item(new_db: Database, row: Mapping[str, Any]) -> None:
+        if row["id"] == 6:
+            raise RuntimeError("transform failed")
+        new_db.insert_row("copies", row)
+
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "items",
+            "columns": {"items.id": "id"},
+            "target_table": "copies",
+            "insert_function": "copy_item",
+            "extract_method": "keyset",
+            "chunk_size": 2,
+            **settings,
+        }
+    ]
+
+    with pytest.raises(RuntimeError):
+        migrate(old_db, new_db, mapping, {"copy_item": copy_item})
+
+    result = new_db.execute_query("SELECT id FROM copies ORDER BY id")
+    assert result is not None
+    assert [row["id"] for row in result] == committed
+
+
+def test_migrate_single_transaction_rejects_parallelism(
+    old_db: Database, new_db: Database
+) -> None:
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id"},
+            "target_table": "comptes",
+            "parallelism": 2,
+            "single_transaction": True,
+        }
+    ]
+
+    with pytest.raises(ValueError, match="single_transaction"):
+        migrate(old_db, new_db, mapping)
+
+
+def test_migrate_with_pipeline(tmp_path: Path) -> None:
+    old_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'old.db'}"
+    )
+    new_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'new.db'}"
+    )
+    old_db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    new_db.execute_query(
+        "CREATE TABLE copies (id INTEGER PRIMARY KEY, double INTEGER)"
+    )
+    for i in range(1, 51):
+        old_db.execute_query("INSERT INTO items (id) VALUES (:id)", {"id": i})
+
+    def double_batch(
+        new_db: Database, rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        return [{**row, "double": row["id"] * 2} for row in rows]
+
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "items",
+            "columns": {"items.id": "id"},
+            "target_table": "copies",
+            "insert_function": "double_batch",
+            "transform_mode": "batch",
+            "chunk_size": 7,
+            "pipeline": True,
+            "transform_workers": 3,
+            "queue_size": 2,
+        }
+    ]
+    migrate(old_db, new_db, mapping, {"double_batch": double_batch})
+
+    result = new_db.execute_query("SELECT id, double FROM copies ORDER BY id")
+    assert result is not None
+    assert [(row["id"], row["double"]) for row in result] == [
+        (i, i * 2) for i in range(1, 51)
+    ]
+
+
+def test_migrate_pipeline_write_failure_stops_threads(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    monkeypatch.setattr("tqdm.std.tqdm.monitor_interval", 0)
+    old_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'old.db'}"
+    )
+    new_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'new.db'}"
+    )
+    old_db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    new_db.execute_query("CREATE TABLE copies (id INTEGER PRIMARY KEY)")
+    new_db.execute_query("INSERT INTO copies (id) VALUES (10)")
+    old_db.insert_rows("items", [{"id": i} for i in range(1, 201)])
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "items",
+            "columns": {"items.id": "id"},
+            "target_table": "copies",
+            "chunk_size": 5,
+            "pipeline": True,
+            "transform_workers": 2,
+            "queue_size": 2,
+        }
+    ]
+    before = set(threading.enumerate())
+
+    with pytest.raises(IntegrityError):
+        migrate(old_db, new_db, mapping)
+
+    started = set(threading.enumerate()) - before
+    for thread in started:
+        thread.join(timeout=1)
+    assert not [thread for thread in started if thread.is_alive()]
+
+
+@pytest.mark.parametrize("pipeline", [True, False])
+def test_migrate_with_process_transforms(
+    tmp_path: Path, pipeline: bool
+) -> None:
+    old_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'old.db'}"
+    )
+    new_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'new.db'}"
+    )
+    old_db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    new_db.execute_query(
+        "CREATE TABLE copies (id INTEGER PRIMARY KEY, double INTEGER, "
+        "pid INTEGER, started REAL, finished REAL)"
+    )
+    for i in range(1, 21):
+        old_db.execute_query("INSERT INTO items (id) VALUES (:id)", {"id": i})
+
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "items",
+            "columns": {"items.id": "id"},
+            "target_table": "copies",
+            "insert_function": f"{__name__}:timed_double_ids",
+            "transform_mode": "batch",
+            "transform_executor": "process",
+            "transform_workers": 2,
+            "pipeline": pipeline,
+            "chunk_size": 5,
+        }
+    ]
+    migrate(old_db, new_db, mapping)
+
+    result = new_db.execute_query("SELECT * FROM copies")
+    assert result is not None
+    assert sorted((row["id"], row["double"]) for row in result) == [
+        (i, i * 2) for i in range(1, 21)
+    ]
+    assert os.getpid() not in {row["pid"] for row in result}
+    runs = sorted({(row["started"], row["finished"]) for row in result})
+    assert any(
+        later[0] < earlier[1] for earlier, later in zip(runs, runs[1:])
+    )
+
+
+def test_process_transforms_keep_engine_options(tmp_path: Path) -> None:
+    old_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'old.db'}"
+    )
+    new_db = Database(
+        type="sqlite",
+        connection_string=f"sqlite:///{tmp_path / 'new.db'}",
+        engine_options={"pool_recycle": 3600},
+    )
+    old_db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    new_db.execute_query(
+        "CREATE TABLE copies (id INTEGER PRIMARY KEY, double INTEGER)"
+    )
+    old_db.execute_query("INSERT INTO items (id) VALUES (1), (2)")
+
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "items",
+            "columns": {"items.id": "id"},
+            "target_table": "copies",
+            "insert_function": f"{__name__}:pool_recycle_ids",
+            "transform_mode": "batch",
+            "transform_executor": "process",
+        }
+    ]
+    migrate(old_db, new_db, mapping)
+
+    result = new_db.execute_query("SELECT double FROM copies")
+    assert result is not None
+    assert [row["double"] for row in result] == [3600, 3600]
+
+
+def test_migrate_process_transforms_require_batch_mode(
+    old_db: Database, new_db: Database
+) -> None:
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id"},
+            "target_table": "comptes",
+            "insert_function": f"{__name__}:double_ids",
+            "transform_executor": "process",
+        }
+    ]
+
+    with pytest.raises(ValueError, match="requires a batch insert function"):
+        migrate(old_db, new_db, mapping)
+
+
+def test_migrate_with_unimportable_function_path_raises_error(
+    old_db: Database, new_db: Database
+) -> None:
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id"},
+            "target_table": "comptes",
+            "insert_function": "missing_module:transform",
+        }
+    ]
+
+    with pytest.raises(ValueError, match="could not be imported"):
+        migrate(old_db, new_db, mapping)
+
+
+def test_migrate_resumes_from_checkpoints(tmp_path: Path) -> None:
+    old_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'old.db'}"
+    )
+    new_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'new.db'}"
+    )
+    old_db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    old_db.execute_query("CREATE TABLE tags (id INTEGER PRIMARY KEY)")
+    new_db.execute_query("CREATE TABLE copies (id INTEGER PRIMARY KEY)")
+    new_db.execute_query("CREATE TABLE labels (id INTEGER PRIMARY KEY)")
+    for i in range(1, 8):
+        old_db.execute_query("INSERT INTO items (id) VALUES (:id)", {"id": i})
+        old_db.execute_query("INSERT INTO tags (id) VALUES (:id)", {"id": i})
+    failing = {"id": 6}
+    seen: List[int] = []
+
+    def copy_item(new_db: Database, row: Mapping[str, Any]) -> None:
+        if row["id"] == failing["id"]:
+            raise RuntimeError("transform failed")
+        seen.append(row["id"])
+        new_db.insert_row("copies", row)
+
+    mapping: List[Dict[str, Any]] = [
+        {
+            "name": "labels",
+            "root_table": "tags",
+            "columns": {"tags.id": "id"},
+            "target_table": "labels",
+        },
+        {
+            "root_table": "items",
+            "columns": {"items.id": "id"},
+            "target_table": "copies",
+            "insert_function": "copy_item",
+            "extract_method": "keyset",
+            "chunk_size": 2,
+            "depends_on": "labels",
+        },
+    ]
+    store = CheckpointStore(new_db)
+    registry = {"copy_item": copy_item}
+
+    with pytest.raises(RuntimeError):
+        migrate(old_db, new_db, mapping, registry, checkpoint_store=store)
+    assert store.get("labels") == {"last_key": None, "completed": True}
+    assert store.get("items:copies") == {"last_key": 4, "completed": False}
+
+    failing["id"] = 0
+    seen.clear()
+    migrate(
+        old_db, new_db, mapping, registry, checkpoint_store=store, resume=True
+    )
+
+    assert seen == [5, 6, 7]
+    result = new_db.execute_query("SELECT COUNT(*) AS n FROM copies")
+    assert result is not None
+    assert result[0]["n"] == 7
+    assert store.get("items:copies") == {"last_key": None, "completed": True}
+
+
+def test_migrate_resumes_after_non_json_key(tmp_path: Path) -> None:
+    old_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'old.db'}"
+    )
+    new_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'new.db'}"
+    )
+    old_db.execute_query("CREATE TABLE items (code BLOB PRIMARY KEY)")
+    new_db.execute_query("CREATE TABLE copies (code BLOB PRIMARY KEY)")
+    old_db.insert_rows("items", [{"code": bytes([i])} for i in range(1, 8)])
+    failing = {"code": b"\x06"}
+
+    def copy_batch(
+        new_db: Database, rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        if any(row["code"] == failing["code"] for row in rows):
+            raise RuntimeError("transform failed")
+        return rows
+
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "items",
+            "columns": {"items.code": "code"},
+            "target_table": "copies",
+            "insert_function": "copy_batch",
+            "transform_mode": "batch",
+            "extract_method": "keyset",
+            "chunk_size": 2,
+        }
+    ]
+    store = CheckpointStore(new_db)
+    registry = {"copy_batch": copy_batch}
+
+    with pytest.raises(RuntimeError):
+        migrate(old_db, new_db, mapping, registry, checkpoint_store=store)
+    assert store.get("items:copies") == {
+        "last_key": b"\x04",
+        "completed": False,
+    }
+
+    failing["code"] = b""
+    migrate(
+        old_db, new_db, mapping, registry, checkpoint_store=store, resume=True
+    )
+
+    result = new_db.execute_query("SELECT code FROM copies ORDER BY code")
+    assert result is not None
+    assert [row["code"] for row in result] == [bytes([i]) for i in range(1, 8)]
+
+
+def test_migrate_resume_refuses_to_reload_committed_rows(
+    tmp_path: Path,
+) -> None:
+    old_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'old.db'}"
+    )
+    new_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'new.db'}"
+    )
+    old_db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    new_db.execute_query("CREATE TABLE copies (id INTEGER PRIMARY KEY)")
+    old_db.insert_rows("items", [{"id": i} for i in range(1, 8)])
+    failing = {"id": 6}
+
+    def copy_batch(
+        new_db: Database, rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        if any(row["id"] == failing["id"] for row in rows):
+            raise RuntimeError("transform failed")
+        return rows
+
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "items",
+            "columns": {"items.id": "id"},
+            "target_table": "copies",
+            "insert_function": "copy_batch",
+            "transform_mode": "batch",
+            "chunk_size": 2,
+        }
+    ]
+    store = CheckpointStore(new_db)
+    registry = {"copy_batch": copy_batch}
+
+    with pytest.raises(RuntimeError):
+        migrate(old_db, new_db, mapping, registry, checkpoint_store=store)
+    assert store.get("items:copies") == {"last_key": None, "completed": False}
+
+    failing["id"] = 0
+    with pytest.raises(ValueError, match="cannot resume"):
+        migrate(
+            old_db,
+            new_db,
+            mapping,
+            registry,
+            checkpoint_store=store,
+            resume=True,
+        )
+
+    migrate(
+        old_db,
+        new_db,
+        [{**mapping[0], "load_mode": "upsert"}],
+        registry,
+        checkpoint_store=store,
+        resume=True,
+    )
+    result = new_db.execute_query("SELECT COUNT(*) AS n FROM copies")
+    assert result is not None
+    assert result[0]["n"] == 7
+
+
+def test_migrate_resume_requires_checkpoint_store(
+    old_db: Database, new_db: Database
+) -> None:
+    with pytest.raises(ValueError, match="checkpoint_store"):
+        migrate(old_db, new_db, [], resume=True)
+
+
+def test_migrate_with_fast_load(tmp_path: Path) -> None:
+    old_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'old.db'}"
+    )
+    new_db = Database(
+        type="sqlite", connection_string=f"sqlite:///{tmp_path / 'new.db'}"
+    )
+    old_db.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    new_db.execute_query("CREATE TABLE copies (id INTEGER PRIMARY KEY)")
+    old_db.insert_rows("items", [{"id": i} for i in range(1, 5001)])
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "items",
+            "columns": {"items.id": "id"},
+            "target_table": "copies",
+        }
+    ]
+
+    migrate(old_db, new_db, mapping, fast_load=True)
+
+    result = new_db.execute_query("SELECT COUNT(*) AS n FROM copies")
+    assert result is not None
+    assert result[0]["n"] == 5000
+    journal = new_db.execute_query("PRAGMA journal_mode")
+    assert journal is not None
+    assert journal[0]["journal_mode"] == "delete"
+
+
+def test_migrate_with_upsert_load_mode(
+    old_db: Database, new_db: Database
+) -> None:
+    new_db.execute_query(
+        "INSERT INTO comptes (id, login, telephone) VALUES (1, 'old', '0')"
+    )
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id", "users.username": "login"},
+            "target_table": "comptes",
+            "load_mode": "upsert",
+        }
+    ]
+
+    migrate(old_db, new_db, mapping)
+    migrate(old_db, new_db, mapping)
+
+    result = new_db.execute_query("SELECT * FROM comptes")
+    assert result is not None
+    assert [dict(row) for row in result] == [
+        {"id": 1, "login": "alice", "telephone": "0"}
+    ]
+
+
+def test_migrate_upsert_rejects_row_insert_function(
+    old_db: Database, new_db: Database
+) -> None:
+    mapping: List[Dict[str, Any]] = [
+        {
+            "root_table": "users",
+            "columns": {"users.id": "id"},
+            "target_table": "comptes",
+            "insert_function": "insert_comptes",
+            "load_mode": "upsert",
+        }
+    ]
+    registry: Dict[str, TransformFn] = {
+        "insert_comptes": lambda db, row: None
+    }
+
+    with pytest.raises(ValueError, match="row insert function"):
+        migrate(old_db, new_db, mapping, registry)
+    with pytest.raises(ValueError, match="load_mode"):
+        migrate(
+            old_db,
+            new_db,
+            [{**mapping[0], "insert_function": "", "load_mode": "merge"}],
+        )
+    with pytest.raises(ValueError, match="requires load_mode"):
+        migrate(
+            old_db,
+            new_db,
+            [
+                {
+                    **mapping[0],
+                    "insert_function": "",
+                    "load_mode": "insert",
+                    "conflict_keys": ["id"],
+                }
+            ],
+        )
+
+
+@pytest.mark.parametrize("setting", ["commit_every", "commit_interval_s"])
+def test_pipes_skipped_with_commit_settings(
+    monkeypatch: MonkeyPatch, setting: str
+) -> None:
+    old_db = Database(type="sqlite", connection_string="sqlite:///:memory:")
+    new_db = Database(type="sqlite", connection_string="sqlite:///:memory:")
+    monkeypatch.setattr(old_db.engine.dialect, "name", "postgresql")
+    monkeypatch.setattr("sqlmorpher.migration._supports_copy", lambda db: True)
+    monkeypatch.setattr("sqlmorpher.migration._is_duckdb", lambda db: True)
+    copy_entry: Dict[str, Any] = {"extract_method": "copy"}
+    arrow_entry: Dict[str, Any] = {"extract_method": "arrow"}
+
+    assert _can_pipe_copy(old_db, new_db, copy_entry, None, "auto")
+    assert _can_pipe_arrow(old_db, new_db, arrow_entry, None, "auto")
+
+    copy_entry[setting] = 10
+    arrow_entry[setting] = 10
+
+    assert not _can_pipe_copy(old_db, new_db, copy_entry, None, "auto")
+    assert not _can_pipe_arrow(old_db, new_db, arrow_entry, None, "auto")
@@ -0,0 +1,59 @@
+import threading
+import time
+import pytest
+from typing import Iterator, List
+from sqlmorpher import iter_pipelined
+
+
+def test_iter_pipelined_keeps_input_order() -> None:
+    def slow_square(chunk: List[int]) -> List[int]:
+        time.sleep(0.01 * (5 - chunk[0] % 5))
+        return [value * value for value in chunk]
+
+    chunks = [[i, i] for i in range(10)]
+    result = list(iter_pipelined(chunks, slow_square, workers=4))
+
+    assert result == [[i * i, i * i] for i in range(10)]
+
+
+def test_iter_pipelined_bounds_read_ahead() -> None:
+    read: List[int] = []
+    release = threading.Event()
+
+    def source() -> Iterator[int]:
+        for i in range(100):
+            read.append(i)
+            yield i
+
+    def transform(chunk: int) -> int:
+        release.wait()
+        return chunk
+
+    pipelined = iter_pipelined(source(), transform, queue_size=2)
+    first = threading.Thread(target=lambda: next(pipelined))
+    first.start()
+    time.sleep(0.2)
+    assert len(read) <= 4
+    release.set()
+    first.join()
+    assert list(pipelined) == list(range(1, 100))
+
+
+def test_iter_pipelined_propagates_errors() -> None:
+    def transform(chunk: int) -> int:
+        if chunk == 3:
+            raise RuntimeError("bad chunk")
+        return chunk
+
+    def source() -> Iterator[int]:
+        yield from range(5)
+        raise ValueError("source failed")
+
+    results: List[int] = []
+    with pytest.raises(RuntimeError, match="bad chunk"):
+        for chunk in iter_pipelined(range(5), transform, workers=2):
+            results.append(chunk)
+    assert results == [0, 1, 2]
+
+    with pytest.raises(ValueError, match="source failed"):
+        list(iter_pipelined(source(), lambda chunk: chunk))
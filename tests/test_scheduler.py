@@ -0,0 +1,173 @@
+import asyncio
+import pytest
+import threading
+import time
+from sqlalchemy import Table, Column, Integer, String, MetaData, ForeignKey
+from sqlmorpher import (
+    Database,
+    build_dependency_graph,
+    run_scheduled,
+    arun_scheduled,
+)
+from typing import Any, Dict, List, Set
+
+
+@pytest.fixture
+def target_db() -> Database:
+    db = Database(type="sqlite", connection_string="sqlite:///:memory:")
+    metadata = MetaData()
+    Table(
+        "countries",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+    )
+    Table(
+        "accounts",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("country_id", Integer, ForeignKey("countries.id")),
+        Column("parent_id", Integer, ForeignKey("accounts.id")),
+    )
+    Table("logs", metadata, Column("id", Integer, primary_key=True))
+    metadata.create_all(db.engine)
+    db.metadata = metadata
+    return db
+
+
+def test_build_dependency_graph_from_foreign_keys(
+    target_db: Database,
+) -> None:
+    mapping: List[Dict[str, Any]] = [
+        {"root_table": "users", "target_table": "accounts"},
+        {"root_table": "countries"},
+        {"root_table": "events", "target_table": "logs"},
+    ]
+
+    graph = build_dependency_graph(target_db, mapping)
+
+    assert graph == {0: {1}, 1: set(), 2: set()}
+
+
+def test_build_dependency_graph_with_depends_on(target_db: Database) -> None:
+    mapping: List[Dict[str, Any]] = [
+        {"name": "first", "root_table": "countries"},
+        {
+            "root_table": "events",
+            "target_table": "logs",
+            "depends_on": "first",
+        },
+    ]
+
+    graph = build_dependency_graph(target_db, mapping)
+
+    assert graph == {0: set(), 1: {0}}
+
+
+def test_build_dependency_graph_breaks_foreign_key_cycles() -> None:
+    db = Database(type="sqlite", connection_string="sqlite:///:memory:")
+    metadata = MetaData()
+    Table(
+        "a",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("b_id", Integer, ForeignKey("b.id")),
+    )
+    Table(
+        "b",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("a_id", Integer, ForeignKey("a.id")),
+    )
+    db.metadata = metadata
+    mapping: List[Dict[str, Any]] = [
+        {"root_table": "a"},
+        {"root_table": "b"},
+    ]
+
+    assert build_dependency_graph(db, mapping) == {0: set(), 1: {0}}
+    assert build_dependency_graph(db, mapping[::-1]) == {0: set(), 1: {0}}
+
+    mapping[0]["depends_on"] = "b"
+    assert build_dependency_graph(db, mapping) == {0: {1}, 1: set()}
+
+
+def test_build_dependency_graph_unknown_dependency(
+    target_db: Database,
+) -> None:
+    mapping: List[Dict[str, Any]] = [
+        {"root_table": "countries", "depends_on": ["missing"]},
+    ]
+    with pytest.raises(ValueError, match="unknown entry 'missing'"):
+        build_dependency_graph(target_db, mapping)
+
+
+def test_run_scheduled_respects_dependencies() -> None:
+    graph: Dict[int, Set[int]] = {0: {2}, 1: set(), 2: set(), 3: {0, 1}}
+    finished: List[int] = []
+    lock = threading.Lock()
+
+    def run_entry(idx: int) -> None:
+        time.sleep(0.01)
+        with lock:
+            finished.append(idx)
+
+    run_scheduled(graph, run_entry, workers=3)
+
+    assert sorted(finished) == [0, 1, 2, 3]
+    assert finished.index(2) < finished.index(0)
+    assert finished.index(3) == 3
+
+
+def test_run_scheduled_sequential_order() -> None:
+    graph: Dict[int, Set[int]] = {0: {1}, 1: set(), 2: set()}
+    finished: List[int] = []
+
+    run_scheduled(graph, finished.append, workers=1)
+
+    assert finished == [1, 0, 2]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_scheduled_detects_cycles(workers: int) -> None:
+    graph: Dict[int, Set[int]] = {0: {1}, 1: {0}, 2: set()}
+    with pytest.raises(ValueError, match="Circular dependency"):
+        run_scheduled(graph, lambda idx: None, workers=workers)
+
+
+def test_run_scheduled_propagates_errors() -> None:
+    graph: Dict[int, Set[int]] = {0: set(), 1: {0}}
+    started: List[int] = []
+
+    def run_entry(idx: int) -> None:
+        started.append(idx)
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_scheduled(graph, run_entry, workers=2)
+    assert started == [0]
+
+
+def test_arun_scheduled_respects_dependencies() -> None:
+    graph: Dict[int, Set[int]] = {0: {2}, 1: set(), 2: set(), 3: {0, 1}}
+    finished: List[int] = []
+
+    async def run_entry(idx: int) -> None:
+        await asyncio.sleep(0.01)
+        finished.append(idx)
+
+    asyncio.run(arun_scheduled(graph, run_entry, concurrency=3))
+
+    assert sorted(finished) == [0, 1, 2, 3]
+    assert finished.index(2) < finished.index(0)
+    assert finished.index(3) == 3
+
+
+def test_arun_scheduled_detects_cycles() -> None:
+    graph: Dict[int, Set[int]] = {0: {1}, 1: {0}, 2: set()}
+
+    async def run_entry(idx: int) -> None:
+        return None
+
+    with pytest.raises(ValueError, match="Circular dependency"):
+        asyncio.run(arun_scheduled(graph, run_entry))
@@ -0,0 +1,142 @@
+import pytest
+from typing import Any
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_mock_engine,
+)
+from sqlalchemy.engine import Dialect
+from sqlalchemy.sql import ClauseElement
+from _pytest.monkeypatch import MonkeyPatch
+from sqlmorpher import Database, upsert_rows
+from sqlmorpher.upsert import _build_merge_sql, _upsert_statement
+
+
+def _dialect(url: str) -> Dialect:
+    return create_mock_engine(url, lambda *args, **kwargs: None).dialect
+
+
+def _compiled(statement: Any, dialect: Dialect) -> str:
+    assert isinstance(statement, ClauseElement)
+    return str(statement.compile(dialect=dialect))
+
+
+@pytest.fixture
+def target_db() -> Database:
+    db = Database(type="sqlite", connection_string="sqlite:///:memory:")
+    db.execute_query(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, code TEXT UNIQUE, "
+        "label TEXT, qty INTEGER)"
+    )
+    return db
+
+
+@pytest.fixture
+def items() -> Table:
+    return Table(
+        "items",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("label", String),
+        Column("qty", Integer),
+    )
+
+
+def test_upsert_rows_inserts_and_updates(target_db: Database) -> None:
+    target_db.insert_row("items", {"id": 1, "label": "old", "qty": 5})
+    rows = [
+        {"id": 1, "label": "new"},
+        {"id": 2, "label": "b"},
+        {"id": 3, "label": "c"},
+    ]
+
+    assert upsert_rows(target_db, "items", rows, batch_size=2) == 3
+
+    result = target_db.execute_query(
+        "SELECT id, label, qty FROM items ORDER BY id"
+    )
+    assert result is not None
+    assert [dict(row) for row in result] == [
+        {"id": 1, "label": "new", "qty": 5},
+        {"id": 2, "label": "b", "qty": None},
+        {"id": 3, "label": "c", "qty": None},
+    ]
+
+
+def test_upsert_rows_with_conflict_keys(target_db: Database) -> None:
+    target_db.insert_row("items", {"id": 1, "code": "A", "label": "old"})
+
+    upsert_rows(
+        target_db,
+        "items",
+        [{"id": 1, "code": "A", "label": "new"}],
+        conflict_keys=["code"],
+    )
+    upsert_rows(target_db, "items", [{"code": "A"}], conflict_keys=["code"])
+
+    result = target_db.execute_query("SELECT code, label FROM items")
+    assert result is not None
+    assert [dict(row) for row in result] == [{"code": "A", "label": "new"}]
+
+
+def test_upsert_rows_inside_transaction_rolls_back(
+    target_db: Database,
+) -> None:
+    with pytest.raises(RuntimeError):
+        with target_db.transaction():
+            upsert_rows(target_db, "items", [{"id": 1, "label": "a"}])
+            raise RuntimeError("abort")
+
+    assert target_db.execute_query("SELECT * FROM items") == []
+
+
+def test_upsert_rows_validates_keys(target_db: Database) -> None:
+    with pytest.raises(ValueError, match="Unknown conflict keys"):
+        upsert_rows(target_db, "items", [{"id": 1}], conflict_keys=["nope"])
+    with pytest.raises(ValueError, match="must contain the conflict keys"):
+        upsert_rows(target_db, "items", [{"label": "a"}])
+
+    target_db.execute_query("CREATE TABLE logs (message TEXT)")
+    with pytest.raises(ValueError, match="no primary key"):
+        upsert_rows(target_db, "logs", [{"message": "a"}])
+
+
+def test_upsert_statement_per_dialect(
+    monkeypatch: MonkeyPatch, target_db: Database, items: Table
+) -> None:
+    dialect = _dialect("postgresql://")
+    monkeypatch.setattr(target_db.engine, "dialect", dialect)
+    statement = _upsert_statement(target_db, items, ("id", "label"), ["id"])
+    assert "ON CONFLICT (id) DO UPDATE SET label = excluded.label" in (
+        _compiled(statement, dialect)
+    )
+
+    dialect = _dialect("mysql://")
+    monkeypatch.setattr(target_db.engine, "dialect", dialect)
+    statement = _upsert_statement(target_db, items, ("id",), ["id"])
+    assert "ON DUPLICATE KEY UPDATE id = VALUES(id)" in (
+        _compiled(statement, dialect)
+    )
+
+
+def test_build_merge_sql(
+    monkeypatch: MonkeyPatch, target_db: Database, items: Table
+) -> None:
+    monkeypatch.setattr(target_db.engine, "dialect", _dialect("mssql://"))
+    assert _build_merge_sql(target_db, items, ("id", "label"), ["id"]) == (
+        "MERGE INTO items AS tgt USING (SELECT :id AS id, :label AS label) "
+        "AS src ON (tgt.id = src.id) "
+        "WHEN MATCHED THEN UPDATE SET tgt.label = src.label "
+        "WHEN NOT MATCHED THEN INSERT (id, label) "
+        "VALUES (src.id, src.label);"
+    )
+
+    monkeypatch.setattr(target_db.engine, "dialect", _dialect("oracle://"))
+    assert _build_merge_sql(target_db, items, ("id",), ["id"]) == (
+        "MERGE INTO items tgt USING (SELECT :id AS id FROM dual) "
+        "src ON (tgt.id = src.id) "
+        "WHEN NOT MATCHED THEN INSERT (id) VALUES (src.id)"
+    )